@@ -0,0 +1,19 @@
+import pytest
+from pytest_benchmark.utils import parse_compare_fail
+
+
+# the allowed slowdown of the median time in comparison with the baseline
+REGRESSION_THRESHOLD: str = "median:20%"
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """Fails the run comparing with the baseline on regression
+    unless another threshold is passed in the command line"""
+
+    if config.getoption("benchmark_compare") and not config.getoption(
+        "benchmark_compare_fail"
+    ):
+        config.option.benchmark_compare_fail = [
+            parse_compare_fail(REGRESSION_THRESHOLD)
+        ]
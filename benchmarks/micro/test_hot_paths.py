@@ -0,0 +1,139 @@
+"""
+Micro-benchmarks of the service layer hot paths.
+
+Usage (from the project root):
+    python -m pytest benchmarks --benchmark-autosave     # save a new baseline
+    python -m pytest benchmarks --benchmark-compare      # compare with the last one
+
+The comparison fails if the median time of any benchmark is more than 20 %
+worse than in the baseline (see benchmarks/conftest.py). Baselines are saved
+to benchmarks/.benchmarks separately for every machine and interpreter.
+"""
+import uuid
+from datetime import datetime
+from datetime import timedelta
+from typing import Callable
+from typing import List
+
+from src.event.models import Event
+from src.event.schemas import EventCreationSchema
+from src.event.services.services import EventService
+from src.pet.schemas import PetCreationSchema
+from src.pet.services.services import PetService
+from src.user.services import security
+from src.user.services.hashing import Hasher
+from src.worker.services.email import _get_template_for_event
+
+
+PASSWORD: str = "some_password"
+EMAIL: str = "some_email@email.ru"
+
+
+def _create_events(number_of_events: int, pet_id: uuid.UUID) -> List[Event]:
+    return [
+        Event(
+            event_id=uuid.uuid4(),
+            title=f"title {number}",
+            content="some content",
+            scheduled_at=datetime(2030, 10, 10, 10, 10) - timedelta(hours=number),
+            pet_id=pet_id,
+            is_happened=False,
+        )
+        for number in range(number_of_events)
+    ]
+
+
+def test_form_event_data(benchmark: Callable):
+    event: Event = _create_events(1, uuid.uuid4())[0]
+
+    result: dict = benchmark(EventService._form_event_data, event, True)
+
+    assert result["content"] == "some content"
+
+
+def test_form_event_data_for_pet(benchmark: Callable):
+    events: List[Event] = _create_events(200, uuid.uuid4())
+
+    result: List[dict] = benchmark(PetService._form_event_data_for_pet, events)
+
+    assert len(result) == 200
+
+
+def test_create_jwt_token(benchmark: Callable):
+    token: str = benchmark(security.create_jwt_token, EMAIL, timedelta(minutes=30))
+
+    assert security.get_email_from_jwt_token(token) == EMAIL
+
+
+def test_get_email_from_jwt_token(benchmark: Callable):
+    token: str = security.create_jwt_token(EMAIL, timedelta(minutes=30))
+
+    assert benchmark(security.get_email_from_jwt_token, token) == EMAIL
+
+
+def test_get_password_hash(benchmark: Callable):
+    hasher: Hasher = Hasher()
+
+    hashed_password: str = benchmark.pedantic(
+        hasher.get_password_hash, args=(PASSWORD,), rounds=5, iterations=1
+    )
+
+    assert hashed_password != PASSWORD
+
+
+def test_verify_password(benchmark: Callable):
+    hasher: Hasher = Hasher()
+    hashed_password: str = hasher.get_password_hash(PASSWORD)
+
+    assert benchmark.pedantic(
+        hasher.verify_password, args=(hashed_password, PASSWORD), rounds=5, iterations=1
+    )
+
+
+def test_render_notification_template(benchmark: Callable):
+    data: dict = {
+        "title": "some title",
+        "content": "some content",
+        "pet": "Some name",
+        "year": 2030,
+        "month": 10,
+        "day": 10,
+        "hour": 10,
+        "minute": 10,
+    }
+
+    result: str = benchmark(_get_template_for_event, data)
+
+    assert "some title" in result
+
+
+def test_validate_event_creation_schema(benchmark: Callable):
+    data: dict = {
+        "title": "some title",
+        "content": "some content",
+        "year": datetime.now().year + 1,
+        "month": 10,
+        "day": 10,
+        "hour": 10,
+        "minute": 10,
+        "timezone": "Europe/Moscow",
+        "pet_id": str(uuid.uuid4()),
+    }
+
+    result: EventCreationSchema = benchmark(EventCreationSchema.model_validate, data)
+
+    assert result.title == "some title"
+
+
+def test_validate_pet_creation_schema(benchmark: Callable):
+    data: dict = {
+        "name": "Some name",
+        "species": "Cat",
+        "breed": "Some breed",
+        "gender": "male",
+        "weight": 15,
+    }
+
+    result: PetCreationSchema = benchmark(PetCreationSchema.model_validate, data)
+
+    assert result.name == "Some name"
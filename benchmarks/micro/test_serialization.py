@@ -0,0 +1,94 @@
+"""
+Micro-benchmarks of the serialization of the responses with 5k events.
+
+Usage (from the project root):
+    python -m pytest benchmarks/micro/test_serialization.py
+
+The median time per event is saved to extra_info of every benchmark as
+"per_item_us", so the paths can be compared in the saved baselines.
+"""
+import json
+import uuid
+from datetime import datetime
+from datetime import timedelta
+from typing import Callable
+from typing import List
+
+import orjson
+import pytest
+from pydantic import TypeAdapter
+
+from src.event.models import Event
+from src.event.schemas import ShowEventSchema
+from src.event.services.services import EventService
+from src.serialization import serialize
+from src.serialization import serialize_trusted
+
+
+NUMBER_OF_EVENTS: int = 5000
+
+
+@pytest.fixture(scope="module")
+def events_data() -> List[dict]:
+    pet_id: uuid.UUID = uuid.uuid4()
+    return [
+        EventService._form_event_data(
+            Event(
+                event_id=uuid.uuid4(),
+                title=f"title {number}",
+                content="some content",
+                scheduled_at=datetime(2030, 10, 10, 10, 10) - timedelta(hours=number),
+                pet_id=pet_id,
+                is_happened=False,
+            ),
+            False,
+        )
+        for number in range(NUMBER_OF_EVENTS)
+    ]
+
+
+def _save_per_item_cost(benchmark: Callable) -> None:
+    # the stats are not collected when benchmarks are disabled
+    if benchmark.stats is not None:
+        benchmark.extra_info["per_item_us"] = (
+            benchmark.stats.stats.median / NUMBER_OF_EVENTS * 1_000_000
+        )
+
+
+def _serialize_as_fastapi(type_adapter: TypeAdapter, data: List[dict]) -> bytes:
+    # response_model validation followed by JSONResponse rendering
+    return json.dumps(
+        type_adapter.dump_python(type_adapter.validate_python(data), mode="json"),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode()
+
+
+@pytest.mark.benchmark(group="serialize-5k-events")
+def test_serialize_events_as_fastapi(benchmark: Callable, events_data: List[dict]):
+    type_adapter: TypeAdapter = TypeAdapter(List[ShowEventSchema])
+
+    result: bytes = benchmark(_serialize_as_fastapi, type_adapter, events_data)
+
+    _save_per_item_cost(benchmark)
+    assert orjson.loads(result) == orjson.loads(serialize_trusted(events_data))
+
+
+@pytest.mark.benchmark(group="serialize-5k-events")
+def test_serialize_events_with_type_adapter(
+    benchmark: Callable, events_data: List[dict]
+):
+    result: bytes = benchmark(serialize, List[ShowEventSchema], events_data)
+
+    _save_per_item_cost(benchmark)
+    assert result == serialize_trusted(events_data)
+
+
+@pytest.mark.benchmark(group="serialize-5k-events")
+def test_serialize_events_trusted(benchmark: Callable, events_data: List[dict]):
+    result: bytes = benchmark(serialize_trusted, events_data)
+
+    _save_per_item_cost(benchmark)
+    assert len(orjson.loads(result)) == NUMBER_OF_EVENTS
@@ -0,0 +1,58 @@
+"""added notify_at
+
+Revision ID: 5b1e3f7c9a2d
+Revises: 9058262426f5
+Create Date: 2026-10-17 11:40:18.204716
+
+"""
+from typing import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b1e3f7c9a2d"
+down_revision: Union[str, None] = "9058262426f5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("event", sa.Column("notify_at", sa.DateTime(), nullable=True))
+
+    # indexes are built concurrently so that the tables stay writable
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_event_pending_scheduled_at",
+            table_name="event",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_event_pending_notify_at",
+            "event",
+            ["notify_at"],
+            unique=False,
+            postgresql_where=sa.text("is_happened = false"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_event_pending_notify_at",
+            table_name="event",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_event_pending_scheduled_at",
+            "event",
+            ["scheduled_at"],
+            unique=False,
+            postgresql_where=sa.text("is_happened = false"),
+            postgresql_concurrently=True,
+        )
+
+    op.drop_column("event", "notify_at")
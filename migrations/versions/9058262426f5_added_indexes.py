@@ -0,0 +1,77 @@
+"""added indexes
+
+Revision ID: 9058262426f5
+Revises: c4edfd2cde9d
+Create Date: 2026-10-17 09:12:40.512318
+
+"""
+from typing import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9058262426f5"
+down_revision: Union[str, None] = "c4edfd2cde9d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # indexes are built concurrently so that the tables stay writable
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_pet_owner_id",
+            "pet",
+            ["owner_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_event_pet_id_scheduled_at_event_id",
+            "event",
+            ["pet_id", sa.text("scheduled_at DESC"), sa.text("event_id DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_event_pending_scheduled_at",
+            "event",
+            ["scheduled_at"],
+            unique=False,
+            postgresql_where=sa.text("is_happened = false"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_task_record_event_id",
+            "task_record",
+            ["event_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_task_record_event_id",
+            table_name="task_record",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_event_pending_scheduled_at",
+            table_name="event",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_event_pet_id_scheduled_at_event_id",
+            table_name="event",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_pet_owner_id",
+            table_name="pet",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,320 @@
+import json
+import time
+from abc import ABC
+from abc import abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+from urllib.parse import urlencode
+from uuid import UUID
+
+from fastapi import Response
+from prometheus_client import Counter
+from redis import asyncio as redis
+
+from src.config import project_settings
+
+
+RESPONSE_CACHE_HITS: Counter = Counter(
+    "pettracker_response_cache_hits_total",
+    "Number of responses served from the response cache",
+    ["route"],
+)
+RESPONSE_CACHE_MISSES: Counter = Counter(
+    "pettracker_response_cache_misses_total",
+    "Number of responses that were not found in the response cache",
+    ["route"],
+)
+
+
+@dataclass
+class CachedResponse:
+    """Serialized body of the response together with its headers"""
+
+    content: bytes
+    headers: Dict[str, str]
+
+    def dump(self) -> bytes:
+        """Packs the response into one value stored in the cache"""
+
+        return json.dumps(self.headers).encode() + b"\n" + self.content
+
+    @classmethod
+    def load(cls, raw_data: bytes) -> "CachedResponse":
+        """Unpacks the response from the value stored in the cache"""
+
+        raw_headers, content = raw_data.split(b"\n", 1)
+        return cls(content=content, headers=json.loads(raw_headers))
+
+
+class BaseResponseCache(ABC):
+    """Base class for the caches of the responses of read endpoints.
+    The responses are kept in a separate namespace for every user that
+    is identified by its generation. Invalidation switches the user to
+    a new generation, so all the responses are invalidated at once.
+    The generation is taken before the data is read from database, and
+    a response read before a concurrent change is stored under the old
+    generation where it is never found"""
+
+    @abstractmethod
+    async def get_generation(self, user_id: UUID) -> int:
+        """Gets the current generation of the responses of the user"""
+
+    @abstractmethod
+    async def get(
+        self, user_id: UUID, generation: int, key: str
+    ) -> Optional[CachedResponse]:
+        """Gets the response of the user by its key"""
+
+    @abstractmethod
+    async def set(
+        self, user_id: UUID, generation: int, key: str, response: CachedResponse
+    ) -> None:
+        """Saves the response of the user by its key"""
+
+    @abstractmethod
+    async def invalidate(self, user_id: UUID) -> None:
+        """Removes all the responses of the user"""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Removes all the cached responses"""
+
+
+class DisabledResponseCache(BaseResponseCache):
+    """Cache that stores nothing, so every response is formed from database"""
+
+    async def get_generation(self, user_id: UUID) -> int:
+        return 0
+
+    async def get(
+        self, user_id: UUID, generation: int, key: str
+    ) -> Optional[CachedResponse]:
+        return None
+
+    async def set(
+        self, user_id: UUID, generation: int, key: str, response: CachedResponse
+    ) -> None:
+        pass
+
+    async def invalidate(self, user_id: UUID) -> None:
+        pass
+
+    async def clear(self) -> None:
+        pass
+
+
+class InMemoryResponseCache(BaseResponseCache):
+    """Per-process LRU cache whose entries expire after the provided TTL.
+    The entries of the old generations are evicted as unused.
+    Only suitable when the data is changed by the same process"""
+
+    def __init__(self, max_size: int, ttl: int):
+        """Initializes InMemoryResponseCache by binding
+        its capacity and time to live of the entries"""
+
+        self.max_size: int = max_size
+        self.ttl: int = ttl
+        self._generations: Dict[UUID, int] = {}
+        self._entries: OrderedDict[
+            Tuple[UUID, int, str], Tuple[float, CachedResponse]
+        ] = OrderedDict()
+
+    async def get_generation(self, user_id: UUID) -> int:
+        return self._generations.get(user_id, 0)
+
+    async def get(
+        self, user_id: UUID, generation: int, key: str
+    ) -> Optional[CachedResponse]:
+        entry_key: Tuple[UUID, int, str] = (user_id, generation, key)
+        entry: Optional[Tuple[float, CachedResponse]] = self._entries.get(entry_key)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(entry_key, None)
+            return None
+
+        self._entries.move_to_end(entry_key)
+        return response
+
+    async def set(
+        self, user_id: UUID, generation: int, key: str, response: CachedResponse
+    ) -> None:
+        if generation != self._generations.get(user_id, 0):
+            return
+
+        entry_key: Tuple[UUID, int, str] = (user_id, generation, key)
+        self._entries[entry_key] = (time.monotonic() + self.ttl, response)
+        self._entries.move_to_end(entry_key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, user_id: UUID) -> None:
+        self._generations[user_id] = self._generations.get(user_id, 0) + 1
+
+    async def clear(self) -> None:
+        self._generations.clear()
+        self._entries.clear()
+
+
+class RedisResponseCache(BaseResponseCache):
+    """Cache shared by all the application processes and the celery
+    workers that is stored in Redis. Every response is a separate key
+    expiring after the TTL, and the generation of the user is a counter
+    incremented on invalidation"""
+
+    KEY_PREFIX: str = "response-cache:"
+    # the generation outlives the entries, so it is not reset to
+    # the value the entries which may still exist were stored with
+    GENERATION_TTL_FACTOR: int = 10
+
+    def __init__(self, url: str, ttl: int):
+        """Initializes RedisResponseCache by creating a Redis client"""
+
+        self.ttl: int = ttl
+        self.client: redis.Redis = redis.from_url(url)
+
+    async def get_generation(self, user_id: UUID) -> int:
+        generation: Optional[bytes] = await self.client.get(
+            self.get_generation_key(user_id)
+        )
+        return int(generation) if generation is not None else 0
+
+    async def get(
+        self, user_id: UUID, generation: int, key: str
+    ) -> Optional[CachedResponse]:
+        raw_data: Optional[bytes] = await self.client.get(
+            self.get_entry_key(user_id, generation, key)
+        )
+        if raw_data is None:
+            return None
+        return CachedResponse.load(raw_data)
+
+    async def set(
+        self, user_id: UUID, generation: int, key: str, response: CachedResponse
+    ) -> None:
+        await self.client.set(
+            self.get_entry_key(user_id, generation, key), response.dump(), ex=self.ttl
+        )
+
+    async def invalidate(self, user_id: UUID) -> None:
+        generation_key: str = self.get_generation_key(user_id)
+        async with self.client.pipeline(transaction=False) as pipeline:
+            pipeline.incr(generation_key)
+            pipeline.expire(generation_key, self.ttl * self.GENERATION_TTL_FACTOR)
+            await pipeline.execute()
+
+    async def clear(self) -> None:
+        async for key in self.client.scan_iter(match=self.KEY_PREFIX + "*"):
+            await self.client.delete(key)
+
+    @classmethod
+    def get_generation_key(cls, user_id: UUID) -> str:
+        """Returns the key of the generation of the responses of the user"""
+
+        return f"{cls.KEY_PREFIX}generation:{user_id}"
+
+    @classmethod
+    def get_entry_key(cls, user_id: UUID, generation: int, key: str) -> str:
+        """Returns the key of the response of the user in the generation"""
+
+        return f"{cls.KEY_PREFIX}entry:{user_id}:{generation}:{key}"
+
+
+def _create_response_cache() -> BaseResponseCache:
+    """Creates the response cache configured by project settings"""
+
+    if not project_settings.RESPONSE_CACHE_ENABLED:
+        return DisabledResponseCache()
+
+    if not project_settings.RESPONSE_CACHE_REDIS_ENABLED:
+        return InMemoryResponseCache(
+            max_size=project_settings.RESPONSE_CACHE_MAX_SIZE,
+            ttl=project_settings.RESPONSE_CACHE_TTL_SECONDS,
+        )
+
+    return RedisResponseCache(
+        url=project_settings.RESPONSE_CACHE_REDIS_URL,
+        ttl=project_settings.RESPONSE_CACHE_TTL_SECONDS,
+    )
+
+
+response_cache: BaseResponseCache = _create_response_cache()
+
+
+def get_cache_key(route: str, **params: Any) -> str:
+    """Forms the key of the response from the route and the query
+    parameters. The parameters which are not provided are skipped,
+    so the key does not depend on the order of the parameters"""
+
+    return (
+        route
+        + "?"
+        + urlencode(
+            sorted(
+                (name, getattr(value, "value", value))
+                for name, value in params.items()
+                if value is not None
+            )
+        )
+    )
+
+
+async def get_cached_response(
+    user_id: UUID, route: str, key: str
+) -> Tuple[int, Optional[CachedResponse]]:
+    """Gets the current generation of the responses of the user together
+    with the cached response and counts the hit or the miss. The generation
+    must be passed to cache_response, so the response formed from data read
+    before a concurrent change is not stored"""
+
+    generation: int = await response_cache.get_generation(user_id)
+    cached_response: Optional[CachedResponse] = await response_cache.get(
+        user_id, generation, key
+    )
+    if cached_response is None:
+        RESPONSE_CACHE_MISSES.labels(route=route).inc()
+    else:
+        RESPONSE_CACHE_HITS.labels(route=route).inc()
+
+    return generation, cached_response
+
+
+async def cache_response(
+    user_id: UUID,
+    generation: int,
+    key: str,
+    content: bytes,
+    headers: Optional[Dict[str, str]] = None,
+) -> CachedResponse:
+    """Saves the serialized body of the response with its headers
+    in the cache of the user if the generation is still current"""
+
+    cached_response: CachedResponse = CachedResponse(
+        content=content, headers=headers or {}
+    )
+    await response_cache.set(user_id, generation, key, cached_response)
+
+    return cached_response
+
+
+async def invalidate_cached_responses(user_id: UUID) -> None:
+    """Removes all the cached responses of the user"""
+
+    await response_cache.invalidate(user_id)
+
+
+def to_response(cached_response: CachedResponse) -> Response:
+    """Creates the response to be sent from the cached one"""
+
+    return Response(
+        content=cached_response.content,
+        headers=cached_response.headers,
+        media_type="application/json",
+    )
@@ -0,0 +1,100 @@
+import hashlib
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from email.utils import format_datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+from fastapi import Response
+from fastapi import status
+
+
+def get_etag(key: str, *version: Any) -> str:
+    """Forms a weak ETag from the key of the response and the version
+    of the data it is formed from, e.g. the latest update date
+    and the number of rows"""
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(key.encode())
+    for part in version:
+        digest.update(b"|" + str(part).encode())
+
+    return f'W/"{digest.hexdigest()}"'
+
+
+def get_last_modified(updated_at: datetime) -> Optional[str]:
+    """Formats the naive UTC date of the last update as the value
+    of Last-Modified header. HTTP dates have no fractions of a second,
+    so the date is rounded up, and it is not returned until that second
+    is over: a later change within the same second would get the same
+    date and If-Modified-Since would wrongly tell the client to keep
+    its stale copy"""
+
+    last_modified: datetime = updated_at.replace(microsecond=0)
+    if updated_at.microsecond:
+        last_modified += timedelta(seconds=1)
+    if last_modified > datetime.utcnow():
+        return None
+
+    return format_datetime(last_modified.replace(tzinfo=timezone.utc), usegmt=True)
+
+
+def get_validators(etag: str, updated_at: Optional[datetime] = None) -> Dict[str, str]:
+    """Forms the headers with the validators of the response"""
+
+    headers: Dict[str, str] = {"ETag": etag}
+    if updated_at is not None:
+        last_modified: Optional[str] = get_last_modified(updated_at)
+        if last_modified is not None:
+            headers["Last-Modified"] = last_modified
+    return headers
+
+
+def is_not_modified(
+    headers: Dict[str, str],
+    if_none_match: Optional[str],
+    if_modified_since: Optional[str] = None,
+) -> bool:
+    """Checks whether the client already has the response with the provided
+    validators. If-Modified-Since is only taken into account when
+    If-None-Match is not sent, as RFC 9110 requires"""
+
+    if if_none_match is not None:
+        etag: Optional[str] = headers.get("ETag")
+        if etag is None:
+            return False
+
+        return any(
+            candidate.strip() in ("*", etag, etag.removeprefix("W/"))
+            for candidate in if_none_match.split(",")
+        )
+
+    last_modified: Optional[str] = headers.get("Last-Modified")
+    if if_modified_since is None or last_modified is None:
+        return False
+
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(
+            if_modified_since
+        )
+    except (TypeError, ValueError):
+        return False
+
+
+def get_documented_responses(model: Any) -> Dict[int, Dict[str, Any]]:
+    """Describes the responses of the endpoint that returns the serialized
+    body as is, so OpenAPI docs still show the schema of the data"""
+
+    return {
+        status.HTTP_200_OK: {"model": model},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Not Modified"},
+    }
+
+
+def get_not_modified_response(headers: Dict[str, str]) -> Response:
+    """Creates the response telling the client to use its copy"""
+
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
@@ -1,4 +1,5 @@
 import os
+from typing import Optional
 
 from pydantic_settings import BaseSettings
 from pydantic_settings import SettingsConfigDict
@@ -23,9 +24,23 @@ class ProjectSettings(BaseSettings):
     MAIL_SSL_TLS: bool
     USE_CREDENTIALS: bool
     VALIDATE_CERTS: bool
+    SMTP_TIMEOUT_SECONDS: int = 30
+    SMTP_POOL_SIZE: int = 2
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = 100
+    SMTP_KEEPALIVE_SECONDS: int = 30
+    SMTP_MAX_IDLE_SECONDS: int = 240
+
+    TEMPLATES_BYTECODE_CACHE_DIR: Optional[str] = None
+
+    USER_EMAIL_DELIVERY: str = "queue"
+    USER_EMAIL_MAX_RETRIES: int = 5
+    USER_EMAIL_RETRY_BACKOFF_SECONDS: int = 10
+    USER_EMAIL_RETRY_BACKOFF_MAX_SECONDS: int = 600
 
     PWD_SCHEMA: str
     PWD_DEPRECATED: str
+    PWD_HASHING_EXECUTOR: str = "thread"
+    PWD_HASHING_MAX_WORKERS: int = 4
 
     APP_TITLE: str
     API_URL_PREFIX: str
@@ -39,6 +54,33 @@ class ProjectSettings(BaseSettings):
     CELERY_BROKER_PORT: int
     CELERY_RESULT_BACKEND_PORT: int
 
+    NOTIFICATION_SCHEDULER_MODE: str = "eta"
+    NOTIFICATION_SCHEDULER_INTERVAL_SECONDS: int = 30
+    NOTIFICATION_SCHEDULER_BATCH_SIZE: int = 100
+    NOTIFICATION_DISPATCH_MODE: str = "single"
+    NOTIFICATION_BATCH_SIZE: int = 200
+    NOTIFICATION_BATCH_FLUSH_INTERVAL_SECONDS: int = 5
+    NOTIFICATION_LAG_ALERT_SECONDS: int = 60
+    NOTIFICATION_LAG_RETENTION_DAYS: int = 7
+    NOTIFICATION_LAG_PURGE_INTERVAL_SECONDS: int = 3600
+
+    WORKER_METRICS_PORT: Optional[int] = None
+
+    SERVICE_TOKEN: Optional[str] = None
+
+    USER_CACHE_ENABLED: bool = True
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_LOCAL_TTL_SECONDS: int = 10
+    USER_CACHE_REDIS_ENABLED: bool = True
+    USER_CACHE_REDIS_TTL_SECONDS: int = 300
+    USER_CACHE_REDIS_DB: int = 1
+
+    RESPONSE_CACHE_ENABLED: bool = False
+    RESPONSE_CACHE_MAX_SIZE: int = 10000
+    RESPONSE_CACHE_TTL_SECONDS: int = 60
+    RESPONSE_CACHE_REDIS_ENABLED: bool = True
+    RESPONSE_CACHE_REDIS_DB: int = 2
+
     @property
     def CELERY_BROKER_URL(self):
         return f"redis://{self.CELERY_BROKER_HOST}:{self.CELERY_BROKER_PORT}"
@@ -47,6 +89,18 @@ class ProjectSettings(BaseSettings):
     def CELERY_RESULT_BACKEND_URL(self):
         return f"redis://{self.CELERY_RESULT_BACKEND_HOST}:{self.CELERY_RESULT_BACKEND_PORT}"
 
+    @property
+    def NOTIFICATION_BUFFER_REDIS_URL(self):
+        return f"redis://{self.CELERY_BROKER_HOST}:{self.CELERY_BROKER_PORT}"
+
+    @property
+    def USER_CACHE_REDIS_URL(self):
+        return f"redis://{self.CELERY_BROKER_HOST}:{self.CELERY_BROKER_PORT}/{self.USER_CACHE_REDIS_DB}"
+
+    @property
+    def RESPONSE_CACHE_REDIS_URL(self):
+        return f"redis://{self.CELERY_BROKER_HOST}:{self.CELERY_BROKER_PORT}/{self.RESPONSE_CACHE_REDIS_DB}"
+
     @property
     def FRONTEND_URL(self):
         return f"http://{self.FRONTEND_HOST}:{self.FRONTEND_PORT}"
@@ -1,12 +1,18 @@
 import os.path
+import time
+from typing import Callable
+from typing import Optional
 
 from pydantic_settings import BaseSettings
 from pydantic_settings import SettingsConfigDict
 from sqlalchemy import create_engine
+from sqlalchemy import Engine
 from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 
 
 class DatabaseSettings(BaseSettings):
@@ -18,6 +24,16 @@ class DatabaseSettings(BaseSettings):
     DB_PASSWORD: str
     DB_NAME: str
 
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_WORKER_POOL_SIZE: int = 2
+    DB_WORKER_MAX_OVERFLOW: int = 2
+
     @property
     def ASYNC_DATABASE_URL(self):
         return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
@@ -26,22 +42,6 @@ class DatabaseSettings(BaseSettings):
     def SYNC_DATABASE_URL(self):
         return f"postgresql+psycopg://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
-    @property
-    def _async_engine(self):
-        return create_async_engine(url=self.ASYNC_DATABASE_URL, future=True, echo=True)
-
-    @property
-    def async_session(self):
-        return async_sessionmaker(self._async_engine, expire_on_commit=False)
-
-    @property
-    def _engine(self):
-        return create_engine(url=self.SYNC_DATABASE_URL, echo=True)
-
-    @property
-    def session(self):
-        return sessionmaker(self._engine)
-
     model_config = SettingsConfigDict(
         env_file=os.path.join(
             os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"
@@ -53,6 +53,166 @@ class DatabaseSettings(BaseSettings):
 database_settings = DatabaseSettings()
 
 
+class AsyncEngineManager:
+    """Class that owns the async engine shared by the whole process.
+    The engine keeps a connection pool, so requests reuse already
+    established connections instead of connecting to database every time"""
+
+    def __init__(self, settings: DatabaseSettings):
+        """Initializes AsyncEngineManager by binding database settings to it.
+        The engine itself is created by the init method"""
+
+        self.settings: DatabaseSettings = settings
+        self._engine: Optional[AsyncEngine] = None
+        self._session_factory: Optional[async_sessionmaker] = None
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """Returns the async engine creating it if it does not exist yet"""
+
+        if self._engine is None:
+            self.init()
+        return self._engine
+
+    @property
+    def async_session(self) -> async_sessionmaker:
+        """Returns the session factory bound to the async engine"""
+
+        if self._session_factory is None:
+            self.init()
+        return self._session_factory
+
+    def init(self) -> None:
+        """Creates the async engine with a connection pool
+        configured by database settings"""
+
+        if self._engine is not None:
+            return
+
+        self._engine = create_async_engine(
+            url=self.settings.ASYNC_DATABASE_URL,
+            future=True,
+            echo=self.settings.DB_ECHO,
+            pool_size=self.settings.DB_POOL_SIZE,
+            max_overflow=self.settings.DB_MAX_OVERFLOW,
+            pool_timeout=self.settings.DB_POOL_TIMEOUT,
+            pool_recycle=self.settings.DB_POOL_RECYCLE,
+            pool_pre_ping=self.settings.DB_POOL_PRE_PING,
+            connect_args={
+                "prepared_statement_cache_size": self.settings.DB_STATEMENT_CACHE_SIZE
+            },
+        )
+        self._session_factory = async_sessionmaker(self._engine, expire_on_commit=False)
+
+    async def dispose(self) -> None:
+        """Closes all pooled connections and drops the engine"""
+
+        if self._engine is not None:
+            await self._engine.dispose()
+
+        self._engine = None
+        self._session_factory = None
+
+    def get_pool_stats(self) -> dict:
+        """Returns the current state of the connection pool"""
+
+        if self._engine is None:
+            return {"initialized": False}
+
+        pool = self._engine.pool
+        return {
+            "initialized": True,
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "max_overflow": self.settings.DB_MAX_OVERFLOW,
+        }
+
+
+engine_manager = AsyncEngineManager(settings=database_settings)
+
+
+class TimedQueuePool(QueuePool):
+    """Connection pool that reports how long it took to check a connection out.
+    The time includes waiting for a free connection and connecting to database"""
+
+    on_checkout: Optional[Callable[[float, "TimedQueuePool"], None]] = None
+
+    def connect(self):
+        started_at: float = time.perf_counter()
+        connection = super().connect()
+
+        if self.on_checkout is not None:
+            self.on_checkout(time.perf_counter() - started_at, self)
+        return connection
+
+
+class SyncEngineManager:
+    """Class that owns the synchronous engine of the celery worker process.
+    The engine is created once per process, so tasks reuse
+    pooled connections instead of creating a new engine every time"""
+
+    def __init__(self, settings: DatabaseSettings):
+        """Initializes SyncEngineManager by binding database settings to it.
+        The engine itself is created by the init method"""
+
+        self.settings: DatabaseSettings = settings
+        self._engine: Optional[Engine] = None
+        self._session_factory: Optional[sessionmaker] = None
+
+    @property
+    def engine(self) -> Engine:
+        """Returns the engine creating it if it does not exist yet"""
+
+        if self._engine is None:
+            self.init()
+        return self._engine
+
+    @property
+    def session(self) -> sessionmaker:
+        """Returns the session factory bound to the engine"""
+
+        if self._session_factory is None:
+            self.init()
+        return self._session_factory
+
+    def init(
+        self, on_checkout: Optional[Callable[[float, TimedQueuePool], None]] = None
+    ) -> None:
+        """Creates the engine with a connection pool configured by database
+        settings. The provided function is called after every checkout
+        of a connection with its duration in seconds and the pool"""
+
+        if self._engine is not None:
+            return
+
+        self._engine = create_engine(
+            url=self.settings.SYNC_DATABASE_URL,
+            echo=self.settings.DB_ECHO,
+            poolclass=TimedQueuePool,
+            pool_size=self.settings.DB_WORKER_POOL_SIZE,
+            max_overflow=self.settings.DB_WORKER_MAX_OVERFLOW,
+            pool_timeout=self.settings.DB_POOL_TIMEOUT,
+            pool_recycle=self.settings.DB_POOL_RECYCLE,
+            pool_pre_ping=self.settings.DB_POOL_PRE_PING,
+        )
+        self._engine.pool.on_checkout = on_checkout
+        self._session_factory = sessionmaker(self._engine)
+
+    def dispose(self) -> None:
+        """Closes all pooled connections and drops the engine"""
+
+        if self._engine is not None:
+            self._engine.dispose()
+
+        self._engine = None
+        self._session_factory = None
+
+
+sync_engine_manager = SyncEngineManager(settings=database_settings)
+
+
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models in the project"""
 
@@ -1,18 +1,26 @@
+import secrets
 from typing import Any
 from typing import Generator
 from typing import Optional
 
 from fastapi import Depends
+from fastapi import Header
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
 from sqlalchemy import Result
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database import database_settings
+from src.config import project_settings
+from src.database import engine_manager
 from src.exceptions import credentials_exception
+from src.exceptions import service_disabled_exception
+from src.exceptions import service_token_exception
 from src.user.models import User
 from src.user.services import security
+from src.user.services.cache import dump_user
+from src.user.services.cache import load_user
+from src.user.services.cache import user_cache
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/user/auth/login")
@@ -23,12 +31,27 @@ async def get_db_session() -> Generator[AsyncSession, Any, None]:
     and closes it when controller work is finished"""
 
     try:
-        session: AsyncSession = database_settings.async_session()
+        session: AsyncSession = engine_manager.async_session()
         yield session
     finally:
         await session.close()
 
 
+async def verify_service_token(
+    x_service_token: Optional[str] = Header(default=None),
+) -> None:
+    """Dependence that lets through only the requests with the token
+    from SERVICE_TOKEN setting. The service endpoints are disabled
+    if the setting is not provided"""
+
+    if project_settings.SERVICE_TOKEN is None:
+        raise service_disabled_exception
+    if x_service_token is None or not secrets.compare_digest(
+        x_service_token.encode(), project_settings.SERVICE_TOKEN.encode()
+    ):
+        raise service_token_exception
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db_session: AsyncSession = Depends(get_db_session),
@@ -42,9 +65,7 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    user: Optional[User] = await _get_user_by_email_from_database(
-        email=email, db_session=db_session
-    )
+    user: Optional[User] = await _get_user_by_email(email=email, db_session=db_session)
     if user is None:
         raise credentials_exception
     if not user.is_active:
@@ -53,6 +74,24 @@ async def get_current_user(
     return user
 
 
+async def _get_user_by_email(email: str, db_session: AsyncSession) -> Optional[User]:
+    """Function used by get_current_user dependence for getting a user
+    by email from a token. Active users are taken from the user cache
+    if possible, otherwise they are loaded from database and cached"""
+
+    cached_data: Optional[dict] = await user_cache.get(email)
+    if cached_data is not None:
+        return load_user(cached_data)
+
+    user: Optional[User] = await _get_user_by_email_from_database(
+        email=email, db_session=db_session
+    )
+    if user is not None and user.is_active:
+        await user_cache.set(email, dump_user(user))
+
+    return user
+
+
 async def _get_user_by_email_from_database(
     email: str, db_session: AsyncSession
 ) -> Optional[User]:
@@ -2,6 +2,7 @@ import uuid
 from datetime import datetime
 
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import String
 from sqlalchemy import text
 from sqlalchemy.orm import Mapped
@@ -29,6 +30,9 @@ class Event(Base):
     )
     pet_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("pet.pet_id"))
     is_happened: Mapped[bool] = mapped_column(default=False)
+    notify_at: Mapped[datetime] = mapped_column(nullable=True)
+    recurrence_rule: Mapped[str] = mapped_column(String(255), nullable=True)
+    timezone: Mapped[str] = mapped_column(String(64), nullable=True)
 
     pet = relationship("Pet", back_populates="events")
 
@@ -39,13 +43,43 @@ class Event(Base):
         return str(self.event_id) == str(other.event_id)
 
 
+Index(
+    "ix_event_pet_id_scheduled_at_event_id",
+    Event.pet_id,
+    Event.scheduled_at.desc(),
+    Event.event_id.desc(),
+)
+Index(
+    "ix_event_pending_notify_at",
+    Event.notify_at,
+    postgresql_where=Event.is_happened == False,
+)
+
+
 class TaskRecord(Base):
     """Models representing celery task associated with the event"""
 
     __tablename__ = "task_record"
 
     task_id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
-    event_id: Mapped[uuid.UUID]
+    event_id: Mapped[uuid.UUID] = mapped_column(index=True)
 
     def __repr__(self):
         return f"Task record №{self.task_id}"
+
+
+class NotificationDelivery(Base):
+    """Model representing the delivery of the notification about
+    the event: the UTC time it was due at, the time it was actually
+    sent at and the lag between them in milliseconds"""
+
+    __tablename__ = "notification_delivery"
+
+    delivery_id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    event_id: Mapped[uuid.UUID]
+    due_at: Mapped[datetime] = mapped_column(index=True)
+    sent_at: Mapped[datetime]
+    lag_ms: Mapped[int]
+
+    def __repr__(self):
+        return f"Delivery of the notification about the event №{self.event_id}"
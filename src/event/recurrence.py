@@ -0,0 +1,128 @@
+import itertools
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import pytz
+from dateutil.rrule import rrule
+from dateutil.rrule import rrulestr
+
+
+# the frequencies too small for reminders about pets
+FORBIDDEN_FREQUENCIES: tuple = ("SECONDLY", "MINUTELY")
+
+# the parts of the rule that repeat the event within an hour
+# if more than one value is provided
+SUBHOURLY_PARTS: tuple = ("BYMINUTE", "BYSECOND")
+
+UTC_UNTIL_FORMAT: str = "%Y%m%dT%H%M%SZ"
+LOCAL_UNTIL_FORMAT: str = "%Y%m%dT%H%M%S"
+
+
+def validate_recurrence_rule(recurrence_rule: str) -> str:
+    """Checks that the provided value is a single RRULE in the RFC 5545
+    format without DTSTART, since the start of the rule is the scheduled
+    date of the event. Raises ValueError if the rule is invalid"""
+
+    recurrence_rule = recurrence_rule.strip().upper()
+    if recurrence_rule.startswith("RRULE:"):
+        recurrence_rule = recurrence_rule[len("RRULE:") :]
+
+    if "\n" in recurrence_rule or "DTSTART" in recurrence_rule:
+        raise ValueError("Only one rule without DTSTART can be provided")
+
+    parts: Dict[str, str] = _get_rule_parts(recurrence_rule)
+    if parts.get("FREQ") in FORBIDDEN_FREQUENCIES or any(
+        "," in parts.get(part, "") for part in SUBHOURLY_PARTS
+    ):
+        raise ValueError("Events can not be repeated more often than hourly")
+
+    _get_rule(localize_until(recurrence_rule, "UTC"), datetime(2000, 1, 1))
+
+    return recurrence_rule
+
+
+def localize_until(recurrence_rule: str, timezone: str) -> str:
+    """The rules are expanded from the naive local dates of the events,
+    so the UNTIL date provided in UTC is converted to the local date
+    of the provided timezone. Raises ValueError if the date is invalid"""
+
+    parts: List[str] = recurrence_rule.split(";")
+    for index, part in enumerate(parts):
+        name, _, value = part.partition("=")
+        if name != "UNTIL" or not value.endswith("Z"):
+            continue
+
+        try:
+            until: datetime = datetime.strptime(value, UTC_UNTIL_FORMAT)
+        except ValueError:
+            raise ValueError("UNTIL must be a date or a date with time")
+        parts[index] = "UNTIL=" + to_local(until, timezone).strftime(LOCAL_UNTIL_FORMAT)
+
+    return ";".join(parts)
+
+
+def _get_rule_parts(recurrence_rule: str) -> Dict[str, str]:
+    """Splits the rule into the values of its parts by their names"""
+
+    return {
+        name: value
+        for name, _, value in (
+            part.partition("=") for part in recurrence_rule.split(";")
+        )
+    }
+
+
+@lru_cache(maxsize=1024)
+def _get_rule(recurrence_rule: str, start: datetime) -> rrule:
+    """Parses the rule starting at the provided local date. Parsed
+    rules are cached, since the same events are expanded repeatedly.
+    The rules do not cache their occurrences, so the memory taken
+    by a cached rule does not grow with the number of occurrences"""
+
+    return rrulestr(recurrence_rule, dtstart=start)
+
+
+def get_next_occurrence(
+    recurrence_rule: str, start: datetime, after: datetime, inclusive: bool = False
+) -> Optional[datetime]:
+    """Gets the first occurrence of the rule after the provided local date.
+    Returns None if the rule has no more occurrences"""
+
+    return _get_rule(recurrence_rule, start).after(after, inc=inclusive)
+
+
+def get_occurrences(
+    recurrence_rule: str,
+    start: datetime,
+    window_from: datetime,
+    window_to: datetime,
+    limit: int,
+) -> List[datetime]:
+    """Expands the rule into the local dates of its occurrences
+    within the provided window, but not more than the limit"""
+
+    occurrences = _get_rule(recurrence_rule, start).xafter(window_from, inc=True)
+
+    return list(
+        itertools.islice(
+            itertools.takewhile(lambda occurrence: occurrence < window_to, occurrences),
+            limit,
+        )
+    )
+
+
+def to_utc(value: datetime, timezone: str) -> datetime:
+    """Converts the local date to the naive UTC date"""
+
+    local_tz: datetime.tzinfo = pytz.timezone(timezone)
+    return local_tz.localize(value).astimezone(pytz.utc).replace(tzinfo=None)
+
+
+def to_local(value: datetime, timezone: str) -> datetime:
+    """Converts the naive UTC date to the naive local date"""
+
+    local_tz: datetime.tzinfo = pytz.timezone(timezone)
+    return pytz.utc.localize(value).astimezone(local_tz).replace(tzinfo=None)
@@ -1,20 +1,39 @@
+from datetime import datetime
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from uuid import UUID
 
 from fastapi import APIRouter
 from fastapi import Depends
+from fastapi import Header
 from fastapi import HTTPException
+from fastapi import Query
+from fastapi import Response
 from fastapi import status
 from starlette.responses import JSONResponse
 
+from src.cache import cache_response
+from src.cache import CachedResponse
+from src.cache import get_cache_key
+from src.cache import get_cached_response
+from src.cache import to_response
+from src.conditional import get_documented_responses
+from src.conditional import get_etag
+from src.conditional import get_not_modified_response
+from src.conditional import get_validators
+from src.conditional import is_not_modified
 from src.dependencies import get_current_user
 from src.event.dependencies import get_event_service
 from src.event.models import Event
+from src.event.schemas import BulkEventCreationResultSchema
+from src.event.schemas import BulkEventCreationSchema
 from src.event.schemas import EventCreationSchema
 from src.event.schemas import ShowEventSchema
 from src.event.schemas import UpdateEventSchema
 from src.event.services.services import EventService
+from src.serialization import serialize_trusted
 from src.user.models import User
 
 
@@ -42,13 +61,58 @@ async def create_event(
     return ShowEventSchema(**event_data)
 
 
-@event_router.get(path="/", response_model=ShowEventSchema)
+@event_router.post(path="/bulk", response_model=List[BulkEventCreationResultSchema])
+async def create_events(
+    body: BulkEventCreationSchema,
+    user: User = Depends(get_current_user),
+    event_service: EventService = Depends(get_event_service),
+) -> List[dict]:
+    """Endpoint that creates several events at once. Returns the result
+    of creation for every provided event in the order they were passed"""
+
+    return await event_service.create_events(
+        user=user, events=[event.model_dump() for event in body.events]
+    )
+
+
+@event_router.get(path="/", responses=get_documented_responses(ShowEventSchema))
 async def get_event(
     event_id: UUID,
+    if_none_match: Optional[str] = Header(default=None),
+    if_modified_since: Optional[str] = Header(default=None),
     user: User = Depends(get_current_user),
     event_service: EventService = Depends(get_event_service),
-) -> ShowEventSchema:
-    """Endpoint that gets an event by its id"""
+) -> Response:
+    """Endpoint that gets an event by its id. The response is cached
+    until the data of the user changes. The cache is kept per user,
+    so a cached event is always one the current user owns and
+    the ownership check is not repeated. The event is not sent again
+    if it has not changed since the request with the provided
+    ETag or since the provided date"""
+
+    cache_key: str = get_cache_key("/event/", event_id=event_id)
+    generation, cached_response = await get_cached_response(
+        user_id=user.user_id, route="/event/", key=cache_key
+    )
+    if cached_response is not None:
+        if is_not_modified(cached_response.headers, if_none_match, if_modified_since):
+            return get_not_modified_response(cached_response.headers)
+        return to_response(cached_response)
+
+    updated_at: Optional[datetime] = await event_service.get_event_version(
+        event_id=event_id, user=user
+    )
+    if updated_at is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event with this id belonging to the current user does not exist",
+        )
+
+    validators: Dict[str, str] = get_validators(
+        get_etag(cache_key, updated_at), updated_at
+    )
+    if is_not_modified(validators, if_none_match, if_modified_since):
+        return get_not_modified_response(validators)
 
     event_data: Optional[dict] = await event_service.get_event(event_id, user)
 
@@ -58,17 +122,82 @@ async def get_event(
             detail="Event with this id belonging to the current user does not exist",
         )
 
-    return ShowEventSchema(**event_data)
+    if "Last-Modified" not in validators:
+        # The event has changed within the current second, so the response
+        # is not cached until it can be sent with its Last-Modified date
+        return to_response(
+            CachedResponse(content=serialize_trusted(event_data), headers=validators)
+        )
+
+    cached_response = await cache_response(
+        user_id=user.user_id,
+        generation=generation,
+        key=cache_key,
+        content=serialize_trusted(event_data),
+        headers=validators,
+    )
+    return to_response(cached_response)
 
 
-@event_router.get(path="/list-of-events", response_model=List[ShowEventSchema])
+@event_router.get(
+    path="/list-of-events", responses=get_documented_responses(List[ShowEventSchema])
+)
 async def get_list_of_events(
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    is_happened: Optional[bool] = None,
+    pet_id: Optional[UUID] = None,
+    scheduled_from: Optional[datetime] = None,
+    scheduled_to: Optional[datetime] = None,
+    if_none_match: Optional[str] = Header(default=None),
     user: User = Depends(get_current_user),
     event_service: EventService = Depends(get_event_service),
-) -> List[dict]:
-    """Endpoint that gets a list of events created by the current user"""
+) -> Response:
+    """Endpoint that gets a page of events created by the current user.
+    If there are more events, the cursor of the next page is returned
+    in the X-Next-Cursor header. The page is cached until the data
+    of the user changes. The page is not sent again if the events
+    have not changed since the request with the provided ETag"""
+
+    cache_key: str = get_cache_key(
+        "/event/list-of-events",
+        limit=limit,
+        cursor=cursor,
+        is_happened=is_happened,
+        pet_id=pet_id,
+        scheduled_from=scheduled_from,
+        scheduled_to=scheduled_to,
+    )
+    generation, cached_response = await get_cached_response(
+        user_id=user.user_id, route="/event/list-of-events", key=cache_key
+    )
+    if cached_response is not None:
+        if is_not_modified(cached_response.headers, if_none_match):
+            return get_not_modified_response(cached_response.headers)
+        return to_response(cached_response)
 
-    events_data: List[dict] = await event_service.get_list_of_events(user=user)
+    version: Tuple[Optional[datetime], int] = await event_service.get_events_version(
+        user=user, pet_id=pet_id
+    )
+    validators: Dict[str, str] = get_validators(get_etag(cache_key, *version))
+    if is_not_modified(validators, if_none_match):
+        return get_not_modified_response(validators)
+
+    try:
+        events_data, next_cursor = await event_service.get_list_of_events(
+            user=user,
+            limit=limit,
+            cursor=cursor,
+            is_happened=is_happened,
+            pet_id=pet_id,
+            scheduled_from=scheduled_from,
+            scheduled_to=scheduled_to,
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Incorrect cursor",
+        )
 
     if not events_data:
         raise HTTPException(
@@ -76,7 +205,54 @@ async def get_list_of_events(
             detail="There are no events belonging to the current user",
         )
 
-    return events_data
+    headers: Dict[str, str] = dict(validators)
+    if next_cursor is not None:
+        headers["X-Next-Cursor"] = next_cursor
+
+    cached_response = await cache_response(
+        user_id=user.user_id,
+        generation=generation,
+        key=cache_key,
+        content=serialize_trusted(events_data),
+        headers=headers,
+    )
+    return to_response(cached_response)
+
+
+@event_router.get(path="/occurrences", response_model=List[ShowEventSchema])
+async def get_occurrences(
+    scheduled_from: datetime,
+    scheduled_to: datetime,
+    limit: int = Query(default=500, ge=1, le=2000),
+    pet_id: Optional[UUID] = None,
+    user: User = Depends(get_current_user),
+    event_service: EventService = Depends(get_event_service),
+) -> List[dict]:
+    """Endpoint that gets the occurrences of the events of the current
+    user within the provided window of at most a year. The occurrences
+    of the recurring events are expanded according to their rules"""
+
+    try:
+        occurrences_data: List[dict] = await event_service.get_occurrences(
+            user=user,
+            scheduled_from=scheduled_from,
+            scheduled_to=scheduled_to,
+            limit=limit,
+            pet_id=pet_id,
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Window must be positive and not longer than a year",
+        )
+
+    if not occurrences_data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="There are no events belonging to the current user in this window",
+        )
+
+    return occurrences_data
 
 
 @event_router.delete(path="/")
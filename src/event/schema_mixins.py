@@ -1,11 +1,15 @@
 from datetime import datetime
 from datetime import timedelta
+from typing import Optional
 from typing import Self
 
 import pytz
 from pydantic import field_validator
 from pydantic import model_validator
 
+from src.event.recurrence import localize_until
+from src.event.recurrence import validate_recurrence_rule
+
 
 class EventValidationMixin:
     """Mixin for the provided event data validation"""
@@ -20,6 +24,27 @@ class EventValidationMixin:
 
         return timezone
 
+    @field_validator("recurrence_rule", check_fields=False)
+    @classmethod
+    def validate_recurrence_rule(cls, recurrence_rule: Optional[str]) -> Optional[str]:
+        """Checks if the provided recurrence rule is a valid RRULE"""
+
+        if recurrence_rule is None:
+            return recurrence_rule
+
+        return validate_recurrence_rule(recurrence_rule)
+
+    @model_validator(mode="after")
+    def localize_recurrence_rule(self) -> Self:
+        """Converts the UNTIL date of the recurrence rule provided in UTC
+        to the local date of the event, since the rule is expanded
+        from the local date"""
+
+        if self.recurrence_rule is not None:
+            self.recurrence_rule = localize_until(self.recurrence_rule, self.timezone)
+
+        return self
+
     @model_validator(mode="after")
     def validate_date(self) -> Self:
         """If date is provided, then checks whether the provided date
@@ -1,3 +1,4 @@
+from typing import List
 from typing import Optional
 from uuid import UUID
 
@@ -12,7 +13,9 @@ class EventCreationSchema(EventValidationMixin, BaseModel):
     """
     Schema representing data for event creation with
     the date passed as separate elements. Schema also includes
-    parameter timezone for correct work with the provided date
+    parameter timezone for correct work with the provided date.
+    If the recurrence rule is passed, the event is repeated
+    according to it starting from the provided date
     """
 
     title: str = Field(..., min_length=1, max_length=100)
@@ -22,6 +25,7 @@ class EventCreationSchema(EventValidationMixin, BaseModel):
     day: int
     hour: int
     minute: int
+    recurrence_rule: Optional[str] = Field(None, min_length=1, max_length=255)
 
     timezone: str
     pet_id: UUID
@@ -46,6 +50,26 @@ class ShowEventSchema(BaseModel):
     hour: int
     minute: int
     is_happened: bool
+    recurrence_rule: Optional[str] = None
+
+
+class BulkEventCreationSchema(BaseModel):
+    """Schema representing a list of events to be created at once"""
+
+    events: List[EventCreationSchema] = Field(..., min_length=1, max_length=100)
+
+
+class BulkEventCreationResultSchema(BaseModel):
+    """
+    Schema representing the result of creating one event of the list.
+    The created event is passed only if the creation succeeded,
+    otherwise the reason of the failure is passed
+    """
+
+    index: int
+    is_created: bool
+    event: Optional[ShowEventSchema] = None
+    detail: Optional[str] = None
 
 
 class UpdateEventSchema(EventValidationMixin, BaseModel):
@@ -62,5 +86,6 @@ class UpdateEventSchema(EventValidationMixin, BaseModel):
     day: Optional[int] = None
     hour: Optional[int] = None
     minute: Optional[int] = None
+    recurrence_rule: Optional[str] = Field(None, min_length=1, max_length=255)
 
     timezone: str
@@ -1,17 +1,45 @@
-import operator
 import uuid
 from datetime import datetime
 from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import Union
 
+from sqlalchemy import ColumnElement
+from sqlalchemy import DateTime
+from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import literal
+from sqlalchemy import or_
+from sqlalchemy import Result
+from sqlalchemy import Row
+from sqlalchemy import Select
 from sqlalchemy import select
+from sqlalchemy import tuple_
+from sqlalchemy.orm import contains_eager
+from sqlalchemy.orm import load_only
 
+from src.cache import invalidate_cached_responses
 from src.event.models import Event
+from src.event.models import NotificationDelivery
 from src.event.models import TaskRecord
 from src.pet.models import Pet
 from src.services import BaseDAL
 
 
+def _get_local_date(value: datetime) -> Union[datetime, ColumnElement]:
+    """Events are stored with the naive local dates of their timezones,
+    so the date with a timezone is converted to the local date
+    of every event, while the naive date is compared as is"""
+
+    if value.tzinfo is None:
+        return value
+    return func.timezone(
+        func.coalesce(Event.timezone, "UTC"),
+        literal(value, DateTime(timezone=True)),
+    )
+
+
 class EventDAL(BaseDAL):
     """Data access layer service that enables to work with the data
     related to the events"""
@@ -22,23 +50,61 @@ class EventDAL(BaseDAL):
         content: Optional[str],
         pet_id: str,
         scheduled_at: datetime,
+        owner_id: uuid.UUID,
+        timezone: Optional[str] = None,
+        recurrence_rule: Optional[str] = None,
     ) -> Event:
-        """Creates event in database"""
+        """Creates event in database. The cached responses
+        of the owner of the pet are invalidated"""
 
         async with self.db_session.begin():
             event: Event = Event(
-                title=title, content=content, scheduled_at=scheduled_at, pet_id=pet_id
+                title=title,
+                content=content,
+                scheduled_at=scheduled_at,
+                pet_id=pet_id,
+                timezone=timezone,
+                recurrence_rule=recurrence_rule,
             )
             self.db_session.add(event)
             await self.db_session.flush()
 
-            return event
+        await invalidate_cached_responses(owner_id)
+        return event
+
+    async def create_events_with_tasks(
+        self, events: List[dict], task_records: List[dict], owner_id: uuid.UUID
+    ) -> List[Event]:
+        """Creates the provided events of the pets of the provided owner
+        and the records about the celery tasks associated with them in
+        database. Both are inserted by multi-row INSERT statements
+        within the same transaction"""
+
+        async with self.db_session.begin():
+            result: Result = await self.db_session.execute(
+                insert(Event).returning(Event, sort_by_parameter_order=True), events
+            )
+            created_events: List[Event] = result.scalars().all()
+
+            # an empty list of parameters would insert a row of defaults
+            if task_records:
+                await self.db_session.execute(insert(TaskRecord), task_records)
+
+        await invalidate_cached_responses(owner_id)
+        return created_events
 
-    async def create_task_in_database(self, event: Event) -> uuid.UUID:
-        """Creates the celery task
-        associated with the provided event in database"""
+    async def create_task_in_database(
+        self, event: Event, notify_at: datetime
+    ) -> uuid.UUID:
+        """Creates the celery task associated with the provided event
+        in database and saves the UTC time the notification is due at.
+        The event rescheduled to the future becomes pending again"""
 
         async with self.db_session.begin():
+            setattr(event, "notify_at", notify_at)
+            if notify_at > datetime.utcnow():
+                setattr(event, "is_happened", False)
+
             task_id: uuid.UUID = uuid.uuid4()
 
             task_record: TaskRecord = TaskRecord(
@@ -50,49 +116,168 @@ class EventDAL(BaseDAL):
             return task_id
 
     async def get_event_by_id(
-        self, event_id: uuid.UUID, pets_of_user: List[Pet]
+        self, event_id: uuid.UUID, user_id: uuid.UUID
     ) -> Optional[Event]:
-        """Gets an event from database by its id"""
+        """Gets an event from database by its id if the pet of this event
+        belongs to the provided user. The pet is loaded by the same query"""
+
+        async with self.db_session.begin():
+            result: Result = await self.db_session.execute(
+                select(Event)
+                .join(Event.pet)
+                .filter(Event.event_id == event_id, Pet.owner_id == user_id)
+                .options(contains_eager(Event.pet))
+            )
+            return result.scalars().first()
+
+    async def get_event_version(
+        self, event_id: uuid.UUID, user_id: uuid.UUID
+    ) -> Optional[datetime]:
+        """Gets the date of the latest update of the event if the pet
+        of this event belongs to the provided user"""
 
         async with self.db_session.begin():
-            for p in pets_of_user:
-                result = await self.db_session.execute(
-                    select(Event).filter_by(pet_id=p.pet_id, event_id=event_id)
+            result: Result = await self.db_session.execute(
+                select(Event.updated_at)
+                .join(Event.pet)
+                .filter(Event.event_id == event_id, Pet.owner_id == user_id)
+            )
+            return result.scalars().first()
+
+    async def get_events_version(
+        self, user_id: uuid.UUID, pet_id: Optional[uuid.UUID] = None
+    ) -> Row:
+        """Gets the version of the events of the provided user, optionally
+        only of the provided pet: the date of the latest update and
+        the number of events. The number changes when
+        an event is deleted, unlike the date"""
+
+        query: Select = (
+            select(
+                func.max(Event.updated_at).label("updated_at"),
+                func.count().label("count"),
+            )
+            .join(Event.pet)
+            .filter(Pet.owner_id == user_id)
+        )
+        if pet_id is not None:
+            query = query.filter(Event.pet_id == pet_id)
+
+        async with self.db_session.begin():
+            result: Result = await self.db_session.execute(query)
+            return result.one()
+
+    async def get_events_by_user(
+        self,
+        user_id: uuid.UUID,
+        limit: int,
+        cursor: Optional[Tuple[datetime, uuid.UUID]] = None,
+        is_happened: Optional[bool] = None,
+        pet_id: Optional[uuid.UUID] = None,
+        scheduled_from: Optional[datetime] = None,
+        scheduled_to: Optional[datetime] = None,
+    ) -> List[Event]:
+        """Gets a page of events of the provided user from database ordered
+        by parameters "scheduled_at" and "event_id" in descending order.
+        The page starts after the event the provided cursor points to"""
+
+        query: Select = (
+            select(Event)
+            .join(Event.pet)
+            .filter(Pet.owner_id == user_id)
+            .options(
+                load_only(
+                    Event.event_id,
+                    Event.title,
+                    Event.pet_id,
+                    Event.scheduled_at,
+                    Event.is_happened,
+                    Event.recurrence_rule,
                 )
-                event: Optional[Event] = result.scalars().first()
-                if event is not None:
-                    return event
+            )
+        )
 
-    async def get_events_by_user(self, pets_of_user: List[Pet]) -> List[Event]:
-        """Gets a list of events from database by user
-        ordered by parameter "scheduled_at" """
+        if cursor is not None:
+            query = query.filter(tuple_(Event.scheduled_at, Event.event_id) < cursor)
+        if is_happened is not None:
+            query = query.filter(Event.is_happened == is_happened)
+        if pet_id is not None:
+            query = query.filter(Event.pet_id == pet_id)
+        if scheduled_from is not None:
+            query = query.filter(Event.scheduled_at >= _get_local_date(scheduled_from))
+        if scheduled_to is not None:
+            query = query.filter(Event.scheduled_at < _get_local_date(scheduled_to))
+
+        query = query.order_by(Event.scheduled_at.desc(), Event.event_id.desc()).limit(
+            limit
+        )
 
         async with self.db_session.begin():
-            events: List = []
+            result: Result = await self.db_session.execute(query)
+            return result.scalars().all()
+
+    async def get_events_in_window(
+        self,
+        user_id: uuid.UUID,
+        scheduled_from: datetime,
+        scheduled_to: datetime,
+        pet_id: Optional[uuid.UUID] = None,
+    ) -> List[Event]:
+        """Gets the events of the provided user which may occur within
+        the provided window: the one-off events scheduled within it and
+        the recurring events started before its end. The occurrences
+        of the recurring events are expanded by the caller"""
 
-            for p in pets_of_user:
-                result = await self.db_session.execute(
-                    select(Event).filter_by(pet_id=p.pet_id)
+        query: Select = (
+            select(Event)
+            .join(Event.pet)
+            .filter(
+                Pet.owner_id == user_id,
+                Event.scheduled_at < _get_local_date(scheduled_to),
+                or_(
+                    Event.recurrence_rule.is_not(None),
+                    Event.scheduled_at >= _get_local_date(scheduled_from),
+                ),
+            )
+            .options(
+                load_only(
+                    Event.event_id,
+                    Event.title,
+                    Event.pet_id,
+                    Event.scheduled_at,
+                    Event.is_happened,
+                    Event.notify_at,
+                    Event.recurrence_rule,
+                    Event.timezone,
                 )
+            )
+        )
 
-                pet_events: Optional[List] = result.scalars().all()
-                if pet_events:
-                    events.extend(pet_events)
+        if pet_id is not None:
+            query = query.filter(Event.pet_id == pet_id)
 
-        return sorted(events, key=operator.attrgetter("scheduled_at"), reverse=True)
+        async with self.db_session.begin():
+            result: Result = await self.db_session.execute(
+                query.order_by(Event.scheduled_at)
+            )
+            return result.scalars().all()
 
     async def delete_event(self, event: Event) -> None:
-        """Deletes the provided event from database"""
+        """Deletes the provided event from database. The pet
+        of the event is expected to be loaded"""
 
         async with self.db_session.begin():
             await self.db_session.delete(event)
 
+        await invalidate_cached_responses(event.pet.owner_id)
+
     async def update_event(
         self,
         event: Event,
         parameters_for_update: dict,
     ) -> Event:
-        """Updates the provided event using the provided data"""
+        """Updates the provided event using the provided data.
+        The pet of the event is expected to be loaded"""
 
         async with self.db_session.begin():
             scheduled_at = event.scheduled_at
@@ -112,6 +297,7 @@ class EventDAL(BaseDAL):
                     setattr(event, key, value)
             setattr(event, "scheduled_at", scheduled_at)
 
+        await invalidate_cached_responses(event.pet.owner_id)
         return event
 
     async def delete_invalid_tasks(self, event: Event) -> None:
@@ -126,3 +312,30 @@ class EventDAL(BaseDAL):
 
             for t_r in task_records:
                 await self.db_session.delete(t_r)
+
+    async def get_notification_lag_by_hour(
+        self, since: datetime, late_threshold_ms: int
+    ) -> List[Row]:
+        """Gets the percentiles of the notification lag for every hour
+        the notifications were due at starting from the provided time.
+        The notifications later than the threshold are counted separately"""
+
+        hour = func.date_trunc("hour", NotificationDelivery.due_at).label("hour")
+        lag_ms = NotificationDelivery.lag_ms
+
+        async with self.db_session.begin():
+            result: Result = await self.db_session.execute(
+                select(
+                    hour,
+                    func.count().label("notifications"),
+                    func.count().filter(lag_ms > late_threshold_ms).label("late"),
+                    func.percentile_cont(0.5).within_group(lag_ms).label("p50"),
+                    func.percentile_cont(0.95).within_group(lag_ms).label("p95"),
+                    func.percentile_cont(0.99).within_group(lag_ms).label("p99"),
+                    func.max(lag_ms).label("max"),
+                )
+                .filter(NotificationDelivery.due_at >= since)
+                .group_by(hour)
+                .order_by(hour)
+            )
+            return result.all()
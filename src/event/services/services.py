@@ -1,12 +1,26 @@
+import base64
+import heapq
+import operator
+import uuid
 from datetime import datetime
+from datetime import timedelta
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from uuid import UUID
 
 import pytz
+from kombu import Producer
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import project_settings
 from src.event.models import Event
+from src.event.recurrence import get_next_occurrence
+from src.event.recurrence import get_occurrences
+from src.event.recurrence import to_local
+from src.event.recurrence import to_utc
 from src.pet.models import Pet
 from src.pet.services.dal import PetDAL
 from src.services import BaseService
@@ -14,6 +28,10 @@ from src.user.models import User
 from src.worker.celery import send_notification_email
 
 
+# the longest window the occurrences of the events can be got for
+MAX_OCCURRENCES_WINDOW: timedelta = timedelta(days=366)
+
+
 class EventService(BaseService):
     """Service representing business logic
     used by the endpoints of event_router"""
@@ -37,12 +55,15 @@ class EventService(BaseService):
         month: int,
         year: int,
         timezone: str,
+        recurrence_rule: Optional[str] = None,
     ) -> Optional[dict]:
         """Creates an event in database, sends the task
         related to this event to the celery app"""
 
-        current_user_pets: List[Pet] = await self.additional_dal.get_pets(user=user)
-        if pet_id not in [p.pet_id for p in current_user_pets]:
+        pet: Optional[Pet] = await self.additional_dal.get_pet_by_owner(
+            pet_id=pet_id, user_id=user.user_id
+        )
+        if pet is None:
             return
 
         scheduled_at = datetime(
@@ -54,43 +75,288 @@ class EventService(BaseService):
             content=content,
             pet_id=pet_id,
             scheduled_at=scheduled_at,
+            owner_id=user.user_id,
+            timezone=timezone,
+            recurrence_rule=recurrence_rule,
         )
 
         await self._send_task_to_celery(
             event=event,
             user=user,
-            pet_id=pet_id,
+            pet=pet,
             scheduled_at=scheduled_at,
             timezone=timezone,
         )
         return self._form_event_data(event=event, is_detailed=True)
 
+    async def create_events(self, user: User, events: List[dict]) -> List[dict]:
+        """Creates the provided events in database at once and sends
+        the tasks related to them to the celery app in one batch.
+        The ownership of all the pets is checked by one query.
+        Returns the result of creation for every provided event"""
+
+        pets: List[Pet] = await self.additional_dal.get_pets_by_owner(
+            pet_ids=list({event_data["pet_id"] for event_data in events}),
+            user_id=user.user_id,
+        )
+        pets_by_id: Dict[UUID, Pet] = {pet.pet_id: pet for pet in pets}
+
+        results: List[dict] = []
+        new_events: List[dict] = []
+        occurrences: List[Optional[datetime]] = []
+        for index, event_data in enumerate(events):
+            if event_data["pet_id"] not in pets_by_id:
+                results.append(
+                    {
+                        "index": index,
+                        "is_created": False,
+                        "detail": "User does not own the pet "
+                        "whose event to be created",
+                    }
+                )
+                continue
+
+            scheduled_at: datetime = datetime(
+                hour=event_data["hour"],
+                minute=event_data["minute"],
+                day=event_data["day"],
+                month=event_data["month"],
+                year=event_data["year"],
+            )
+            occurrence: Optional[datetime] = self._get_pending_occurrence(
+                scheduled_at=scheduled_at,
+                recurrence_rule=event_data["recurrence_rule"],
+                timezone=event_data["timezone"],
+            )
+            new_events.append(
+                {
+                    "event_id": uuid.uuid4(),
+                    "title": event_data["title"],
+                    "content": event_data["content"],
+                    "pet_id": event_data["pet_id"],
+                    "scheduled_at": scheduled_at,
+                    "timezone": event_data["timezone"],
+                    "recurrence_rule": event_data["recurrence_rule"],
+                    "notify_at": None
+                    if occurrence is None
+                    else to_utc(occurrence, event_data["timezone"]),
+                }
+            )
+            occurrences.append(occurrence)
+            results.append({"index": index, "is_created": True})
+
+        if not new_events:
+            return results
+
+        tasks: List[dict] = [
+            {"scheduled_at": occurrence, "task_id": uuid.uuid4(), "event_id": event_id}
+            for occurrence, event_id in zip(
+                occurrences, [event_data["event_id"] for event_data in new_events]
+            )
+            if occurrence is not None
+        ]
+        created_events: List[Event] = await self.dal.create_events_with_tasks(
+            events=new_events,
+            task_records=[
+                {"task_id": task["task_id"], "event_id": task["event_id"]}
+                for task in tasks
+            ],
+            owner_id=user.user_id,
+        )
+
+        created_results: List[dict] = [
+            result for result in results if result["is_created"]
+        ]
+        for result, event in zip(created_results, created_events):
+            result["event"] = self._form_event_data(event=event, is_detailed=True)
+
+        if project_settings.NOTIFICATION_SCHEDULER_MODE != "database" and tasks:
+            events_by_id: Dict[UUID, Event] = {
+                event.event_id: event for event in created_events
+            }
+            self._create_tasks(
+                [
+                    {
+                        "scheduled_at": task["scheduled_at"],
+                        "event": events_by_id[task["event_id"]],
+                        "user": user,
+                        "pet": pets_by_id[events_by_id[task["event_id"]].pet_id],
+                        "task_id": task["task_id"],
+                        "timezone": events_by_id[task["event_id"]].timezone,
+                    }
+                    for task in tasks
+                ]
+            )
+
+        return results
+
     async def get_event(
         self,
         event_id: UUID,
         user: User,
     ) -> Optional[Event]:
         """Gets detailed data about an event by its id"""
-        pets_of_user: List[Pet] = await self.additional_dal.get_pets(user=user)
 
         event: Optional[Event] = await self.dal.get_event_by_id(
-            event_id=event_id, pets_of_user=pets_of_user
+            event_id=event_id, user_id=user.user_id
         )
         if event is not None:
             return self._form_event_data(event=event, is_detailed=True)
 
-    async def get_list_of_events(self, user: User) -> List[dict]:
-        """Get a list containing general information about events"""
-        pets_of_user: List[Pet] = await self.additional_dal.get_pets(user=user)
+    async def get_event_version(self, event_id: UUID, user: User) -> Optional[datetime]:
+        """Gets the date of the latest update of the event
+        without loading the event itself"""
+
+        return await self.dal.get_event_version(event_id=event_id, user_id=user.user_id)
+
+    async def get_events_version(
+        self, user: User, pet_id: Optional[UUID] = None
+    ) -> Tuple[Optional[datetime], int]:
+        """Gets the date of the latest update and the number of the events
+        of the user without loading the events themselves"""
+
+        version: Row = await self.dal.get_events_version(
+            user_id=user.user_id, pet_id=pet_id
+        )
+        return version.updated_at, version.count
+
+    async def get_list_of_events(
+        self,
+        user: User,
+        limit: int,
+        cursor: Optional[str] = None,
+        is_happened: Optional[bool] = None,
+        pet_id: Optional[UUID] = None,
+        scheduled_from: Optional[datetime] = None,
+        scheduled_to: Optional[datetime] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        """Get a page containing general information about events
+        and the cursor pointing to the next page if it exists"""
 
         events: List[Event] = await self.dal.get_events_by_user(
-            pets_of_user=pets_of_user
+            user_id=user.user_id,
+            limit=limit + 1,
+            cursor=self._decode_cursor(cursor) if cursor is not None else None,
+            is_happened=is_happened,
+            pet_id=pet_id,
+            scheduled_from=scheduled_from,
+            scheduled_to=scheduled_to,
+        )
+
+        next_cursor: Optional[str] = None
+        if len(events) > limit:
+            events = events[:limit]
+            next_cursor = self._encode_cursor(event=events[-1])
+
+        events_data: List[dict] = [
+            self._form_event_data(event=event, is_detailed=False) for event in events
+        ]
+        return events_data, next_cursor
+
+    async def get_occurrences(
+        self,
+        user: User,
+        scheduled_from: datetime,
+        scheduled_to: datetime,
+        limit: int,
+        pet_id: Optional[UUID] = None,
+    ) -> List[dict]:
+        """Gets general information about the occurrences of the events
+        of the user within the provided window ordered by their dates.
+        The occurrences of the recurring events are expanded on the fly.
+        Raises ValueError if the window is empty or too long"""
+
+        try:
+            window: timedelta = scheduled_to - scheduled_from
+        except TypeError:
+            raise ValueError("Incorrect window")
+        if not timedelta(0) < window <= MAX_OCCURRENCES_WINDOW:
+            raise ValueError("Incorrect window")
+
+        events: List[Event] = await self.dal.get_events_in_window(
+            user_id=user.user_id,
+            scheduled_from=scheduled_from,
+            scheduled_to=scheduled_to,
+            pet_id=pet_id,
+        )
+
+        occurrences: List[Tuple[datetime, Event]] = []
+        for event in events:
+            if event.recurrence_rule is None:
+                occurrences.append((event.scheduled_at, event))
+                continue
+
+            occurrences.extend(
+                (occurrence, event)
+                for occurrence in get_occurrences(
+                    recurrence_rule=event.recurrence_rule,
+                    start=event.scheduled_at,
+                    window_from=self._to_local(scheduled_from, event.timezone),
+                    window_to=self._to_local(scheduled_to, event.timezone),
+                    limit=limit,
+                )
+            )
+
+        return [
+            self._form_occurrence_data(event=event, occurrence=occurrence)
+            for occurrence, event in heapq.nsmallest(
+                limit, occurrences, key=operator.itemgetter(0)
+            )
+        ]
+
+    async def get_notification_lag_report(self, hours: int) -> dict:
+        """Forms the report about the lag of sending notifications
+        in milliseconds for every hour of the provided period"""
+
+        threshold: int = project_settings.NOTIFICATION_LAG_ALERT_SECONDS
+        rows: List[Row] = await self.dal.get_notification_lag_by_hour(
+            since=datetime.utcnow() - timedelta(hours=hours),
+            late_threshold_ms=threshold * 1000,
         )
 
-        for e in range(len(events)):
-            events[e] = self._form_event_data(event=events[e], is_detailed=False)
+        return {
+            "alert_threshold_seconds": threshold,
+            "hours": [
+                {
+                    "hour": row.hour,
+                    "notifications": row.notifications,
+                    "late": row.late,
+                    "p50_ms": round(row.p50),
+                    "p95_ms": round(row.p95),
+                    "p99_ms": round(row.p99),
+                    "max_ms": row.max,
+                }
+                for row in rows
+            ],
+        }
+
+    @staticmethod
+    def _encode_cursor(event: Event) -> str:
+        """Forms an opaque cursor pointing to the provided event"""
+
+        raw_cursor: str = f"{event.scheduled_at.isoformat()}|{event.event_id}"
+        return base64.urlsafe_b64encode(raw_cursor.encode()).decode()
 
-        return events
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+        """Gets the date and the id of the event the cursor points to.
+        Raises ValueError if the cursor is malformed"""
+
+        raw_cursor: str = base64.urlsafe_b64decode(cursor.encode()).decode()
+        scheduled_at, event_id = raw_cursor.split("|")
+        return datetime.fromisoformat(scheduled_at), UUID(event_id)
+
+    @staticmethod
+    def _to_local(value: datetime, timezone: Optional[str]) -> datetime:
+        """Events are stored with the naive local dates of their timezones,
+        so the date with a timezone is converted to the local date
+        of the event, while the naive date is used as is"""
+
+        if value.tzinfo is None:
+            return value
+        return to_local(
+            value.astimezone(pytz.utc).replace(tzinfo=None), timezone or "UTC"
+        )
 
     async def delete_event(
         self,
@@ -98,10 +364,9 @@ class EventService(BaseService):
         user: User,
     ) -> Optional[UUID]:
         """Deletes an event by its id"""
-        pets_of_user: List[Pet] = await self.additional_dal.get_pets(user=user)
 
         event: Optional[Event] = await self.dal.get_event_by_id(
-            event_id=event_id, pets_of_user=pets_of_user
+            event_id=event_id, user_id=user.user_id
         )
 
         if event is None:
@@ -118,10 +383,8 @@ class EventService(BaseService):
         """Updates the event with the provided id. Deletes
         the old celery tasks related to this event and creates a new one"""
 
-        pets_of_user: List[Pet] = await self.additional_dal.get_pets(user=user)
-
         event: Optional[Event] = await self.dal.get_event_by_id(
-            event_id=event_id, pets_of_user=pets_of_user
+            event_id=event_id, user_id=user.user_id
         )
 
         if event is not None:
@@ -131,16 +394,10 @@ class EventService(BaseService):
 
             await self.dal.delete_invalid_tasks(event=event)
 
-            pet: Optional[Pet] = await self.additional_dal.get_pet(
-                pet_id=updated_event.pet_id, user_id=user.user_id
-            )
-            if pet is None:
-                return
-
             await self._send_task_to_celery(
                 event=updated_event,
                 user=user,
-                pet_id=pet.pet_id,
+                pet=updated_event.pet,
                 scheduled_at=updated_event.scheduled_at,
                 timezone=parameters_for_update.get("timezone"),
             )
@@ -154,8 +411,10 @@ class EventService(BaseService):
         pet: Pet,
         task_id: UUID,
         timezone: str,
+        producer: Optional[Producer] = None,
     ) -> None:
-        """Sends a task to the celery application"""
+        """Sends a task to the celery application. The provided
+        producer is used to publish the message if it is passed"""
 
         msk_tz: datetime.tzinfo = pytz.timezone(timezone)
         scheduled_at: datetime = msk_tz.localize(scheduled_at)
@@ -167,56 +426,124 @@ class EventService(BaseService):
                     "title": event.title,
                     "content": event.content,
                     "pet": pet.name,
-                    "year": event.scheduled_at.year,
-                    "month": event.scheduled_at.month,
-                    "day": event.scheduled_at.day,
-                    "hour": event.scheduled_at.hour,
-                    "minute": event.scheduled_at.minute,
+                    "year": scheduled_at.year,
+                    "month": scheduled_at.month,
+                    "day": scheduled_at.day,
+                    "hour": scheduled_at.hour,
+                    "minute": scheduled_at.minute,
                 },
                 str(event.event_id),
                 str(task_id),
             ),
             eta=scheduled_at.astimezone(pytz.utc),
+            producer=producer,
+        )
+
+    @classmethod
+    def _create_tasks(cls, tasks: List[dict]) -> None:
+        """Sends the tasks to the celery application in one batch
+        publishing all the messages through the same producer"""
+
+        with send_notification_email.app.producer_or_acquire() as producer:
+            for task in tasks:
+                cls._create_task(**task, producer=producer)
+
+    @staticmethod
+    def _get_pending_occurrence(
+        scheduled_at: datetime, recurrence_rule: Optional[str], timezone: str
+    ) -> Optional[datetime]:
+        """Gets the local date of the occurrence the notification is to be
+        sent about: the date of a one-off event or the first occurrence of
+        a recurring event which is not in the past. Only this occurrence
+        is scheduled, the next one is scheduled by the celery application
+        after sending the notification. Returns None if there are no
+        more occurrences"""
+
+        if recurrence_rule is None:
+            return scheduled_at
+
+        return get_next_occurrence(
+            recurrence_rule=recurrence_rule,
+            start=scheduled_at,
+            after=max(to_local(datetime.utcnow(), timezone), scheduled_at),
+            inclusive=True,
         )
 
+    @classmethod
+    def _form_occurrence_data(cls, event: Event, occurrence: datetime) -> dict:
+        """Forms the data with the description of the occurrence of
+        the event. The occurrences of a recurring event before its
+        pending notification are considered as happened"""
+
+        event_data: dict = cls._form_event_data(event=event, is_detailed=False)
+
+        if event.recurrence_rule is not None:
+            event_data.update(
+                {
+                    "year": occurrence.year,
+                    "month": occurrence.month,
+                    "day": occurrence.day,
+                    "hour": occurrence.hour,
+                    "minute": occurrence.minute,
+                    "is_happened": event.is_happened
+                    or event.notify_at is None
+                    or to_utc(occurrence, event.timezone) < event.notify_at,
+                }
+            )
+
+        return event_data
+
     @staticmethod
     def _form_event_data(event: Event, is_detailed: bool) -> dict:
-        """Forms the data with the description of
-        the provided event for notification email"""
+        """Forms the data with the description of the provided event.
+        The fields follow ShowEventSchema in the same order, so the data
+        can be serialized without constructing the schema. The content
+        is only filled in the detailed description"""
 
-        event_data: dict = {
+        return {
             "event_id": event.event_id,
-            "title": event.title,
             "pet_id": event.pet_id,
+            "title": event.title,
+            "content": event.content if is_detailed else None,
             "year": event.scheduled_at.year,
             "month": event.scheduled_at.month,
             "day": event.scheduled_at.day,
             "hour": event.scheduled_at.hour,
             "minute": event.scheduled_at.minute,
             "is_happened": event.is_happened,
+            "recurrence_rule": event.recurrence_rule,
         }
 
-        if is_detailed:
-            event_data.update({"content": event.content})
-
-        return event_data
-
     async def _send_task_to_celery(
         self,
         event: Event,
         user: User,
-        pet_id: UUID,
+        pet: Pet,
         scheduled_at: datetime,
         timezone: str,
     ) -> None:
         """Creates a record about a task in database and then
-        sends this task to the celery application"""
+        sends this task to the celery application. In the database
+        scheduler mode no task is sent, since the due events
+        are claimed by the periodic task of the celery application.
+        For a recurring event only its pending occurrence is scheduled"""
 
-        task_id: UUID = await self.dal.create_task_in_database(event=event)
-        pet: Optional[Pet] = await self.additional_dal.get_pet(
-            pet_id=pet_id, user_id=user.user_id
+        scheduled_at: Optional[datetime] = self._get_pending_occurrence(
+            scheduled_at=scheduled_at,
+            recurrence_rule=event.recurrence_rule,
+            timezone=timezone,
+        )
+        if scheduled_at is None:
+            return
+
+        task_id: UUID = await self.dal.create_task_in_database(
+            event=event,
+            notify_at=to_utc(scheduled_at, timezone),
         )
 
+        if project_settings.NOTIFICATION_SCHEDULER_MODE == "database":
+            return
+
         self._create_task(
             scheduled_at=scheduled_at,
             event=event,
@@ -7,6 +7,16 @@ credentials_exception = HTTPException(
 )
 
 
+service_disabled_exception = HTTPException(
+    status_code=status.HTTP_404_NOT_FOUND, detail="Not Found"
+)
+
+
+service_token_exception = HTTPException(
+    status_code=status.HTTP_403_FORBIDDEN, detail="Invalid service token"
+)
+
+
 email_sending_exception = HTTPException(
     status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Cannot send email"
 )
@@ -1,21 +1,55 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 import uvicorn
 from fastapi import APIRouter
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from src.config import project_settings
+from src.database import engine_manager
 from src.event.routes import event_router
+from src.metrics import QueryMetricsMiddleware
+from src.metrics import RequestMetricsMiddleware
 from src.pet.routes import pet_router
+from src.routes import metrics_router
+from src.routes import service_router
+from src.smtp import async_smtp_pool
+from src.templates import template_registry
 from src.user.routes import user_router
+from src.user.services.hashing import hashing_executor
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Creates the database engine and compiles email templates when
+    the application starts. Releases the engine, the hashing pool
+    and smtp connections when it shuts down"""
+
+    engine_manager.init()
+    template_registry.load()
+    yield
+    await engine_manager.dispose()
+    hashing_executor.shutdown()
+    await async_smtp_pool.close()
 
 
-app = FastAPI(title=project_settings.APP_TITLE)
+app = FastAPI(
+    title=project_settings.APP_TITLE,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+app.add_middleware(QueryMetricsMiddleware)
+app.add_middleware(RequestMetricsMiddleware)
 
 
 main_router = APIRouter(prefix=project_settings.API_URL_PREFIX)
 main_router.include_router(user_router)
 main_router.include_router(pet_router)
 main_router.include_router(event_router)
+main_router.include_router(service_router)
 app.include_router(main_router)
+app.include_router(metrics_router)
 
 
 if __name__ == "__main__":
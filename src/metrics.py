@@ -0,0 +1,185 @@
+import time
+from contextvars import ContextVar
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from prometheus_client import Gauge
+from prometheus_client import Histogram
+from sqlalchemy import Engine
+from sqlalchemy import event
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+
+REQUEST_LATENCY: Histogram = Histogram(
+    "pettracker_request_latency_seconds",
+    "Time spent on handling a request",
+    ["method", "route", "status"],
+)
+REQUESTS_IN_PROGRESS: Gauge = Gauge(
+    "pettracker_requests_in_progress",
+    "Number of requests being handled at the moment",
+    ["method"],
+)
+DB_QUERIES_PER_REQUEST: Histogram = Histogram(
+    "pettracker_db_queries_per_request",
+    "Number of SQL statements executed while handling a request",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+DB_TIME_PER_REQUEST: Histogram = Histogram(
+    "pettracker_db_time_per_request_seconds",
+    "Total time spent on SQL statements while handling a request",
+    ["route"],
+)
+DB_SLOWEST_QUERY: Histogram = Histogram(
+    "pettracker_db_slowest_query_seconds",
+    "Duration of the slowest SQL statement executed while handling a request",
+    ["route"],
+)
+
+
+class QueryStats:
+    """Class collecting the SQL statements executed in the current context"""
+
+    def __init__(self):
+        """Initializes QueryStats with no statements recorded"""
+
+        self.count: int = 0
+        self.total: float = 0.0
+        self.slowest: float = 0.0
+        self.slowest_statement: Optional[str] = None
+
+    def add(self, statement: str, duration: float) -> None:
+        """Records the statement and the time it took to execute it"""
+
+        self.count += 1
+        self.total += duration
+        if duration > self.slowest:
+            self.slowest = duration
+            self.slowest_statement = statement
+
+    def get_server_timing(self) -> str:
+        """Returns the stats formatted as the value of Server-Timing header"""
+
+        return (
+            f'db;desc="{self.count} queries";dur={self.total * 1000:.3f}, '
+            f"db-slowest;dur={self.slowest * 1000:.3f}"
+        )
+
+
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def get_query_stats() -> Optional[QueryStats]:
+    """Returns the stats of the current request if they are collected"""
+
+    return _query_stats.get()
+
+
+# the start time is kept on the execution context of the statement,
+# so a failed statement does not leave it on the pooled connection
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    context._query_started_at = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _stop_query_timer(conn, cursor, statement, parameters, context, executemany):
+    started_at: Optional[float] = getattr(context, "_query_started_at", None)
+    if started_at is None:
+        return
+
+    query_stats: Optional[QueryStats] = _query_stats.get()
+    if query_stats is not None:
+        query_stats.add(statement, time.perf_counter() - started_at)
+
+
+class QueryMetricsMiddleware:
+    """Middleware that collects the SQL statements executed by each request.
+    The number of statements, the total database time and the slowest
+    statement are returned in Server-Timing header and observed
+    in Prometheus histograms labelled by the route"""
+
+    def __init__(self, app: ASGIApp):
+        """Initializes QueryMetricsMiddleware by binding the wrapped app to it"""
+
+        self.app: ASGIApp = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        query_stats: QueryStats = QueryStats()
+        token = _query_stats.set(query_stats)
+
+        async def send_with_server_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers: List[Tuple[bytes, bytes]] = list(message.get("headers", []))
+                headers.append(
+                    (b"server-timing", query_stats.get_server_timing().encode())
+                )
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        finally:
+            _query_stats.reset(token)
+
+            route: str = _get_route_path(scope)
+            DB_QUERIES_PER_REQUEST.labels(route=route).observe(query_stats.count)
+            DB_TIME_PER_REQUEST.labels(route=route).observe(query_stats.total)
+            DB_SLOWEST_QUERY.labels(route=route).observe(query_stats.slowest)
+
+
+class RequestMetricsMiddleware:
+    """Middleware that observes the latency of each request and
+    the number of requests in progress. The latency is labelled
+    by the route the request was routed to, which is only known
+    after the request is handled, so the requests in progress
+    are labelled by the method only"""
+
+    def __init__(self, app: ASGIApp):
+        """Initializes RequestMetricsMiddleware by binding the wrapped app to it"""
+
+        self.app: ASGIApp = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method: str = scope["method"]
+        response_status: int = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal response_status
+            if message["type"] == "http.response.start":
+                response_status = message["status"]
+            await send(message)
+
+        REQUESTS_IN_PROGRESS.labels(method=method).inc()
+        started_at: float = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            REQUEST_LATENCY.labels(
+                method=method,
+                route=_get_route_path(scope),
+                status=str(response_status),
+            ).observe(time.perf_counter() - started_at)
+            REQUESTS_IN_PROGRESS.labels(method=method).dec()
+
+
+def _get_route_path(scope: Scope) -> str:
+    """Returns the path template of the route that handled the request,
+    so the requests to the same endpoint share one label. The route
+    is put to the scope by the router, so the request must be routed"""
+
+    return getattr(scope.get("route"), "path", "unmatched")
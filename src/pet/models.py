@@ -4,6 +4,7 @@ from enum import Enum
 
 from sqlalchemy import Enum as SQLAlchemyEnum
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import String
 from sqlalchemy import text
 from sqlalchemy import UUID
@@ -50,3 +51,7 @@ class Pet(Base):
 
     def __eq__(self, other):
         return str(self.pet_id) == str(other.pet_id)
+
+
+Index("ix_pet_owner_id_created_at_pet_id", Pet.owner_id, Pet.created_at, Pet.pet_id)
+Index("ix_pet_owner_id_name_pet_id", Pet.owner_id, Pet.name, Pet.pet_id)
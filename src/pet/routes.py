@@ -1,21 +1,41 @@
+from datetime import datetime
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from uuid import UUID
 
 from fastapi import APIRouter
 from fastapi import Depends
+from fastapi import Header
 from fastapi import HTTPException
+from fastapi import Query
+from fastapi import Response
 from fastapi import status
 from starlette.responses import JSONResponse
 
+from src.cache import cache_response
+from src.cache import get_cache_key
+from src.cache import get_cached_response
+from src.cache import to_response
+from src.conditional import get_documented_responses
+from src.conditional import get_etag
+from src.conditional import get_not_modified_response
+from src.conditional import get_validators
+from src.conditional import is_not_modified
 from src.dependencies import get_current_user
+from src.event.dependencies import get_event_service
+from src.event.schemas import ShowEventSchema
+from src.event.services.services import EventService
 from src.pet.dependencies import get_pet_service
 from src.pet.models import Pet
 from src.pet.schemas import PetCreationSchema
+from src.pet.schemas import PetSortingEnum
 from src.pet.schemas import ShowPetInDetailSchema
 from src.pet.schemas import ShowPetSchema
 from src.pet.schemas import UpdatePetSchema
 from src.pet.services.services import PetService
+from src.serialization import serialize_trusted
 from src.user.models import User
 
 
@@ -55,47 +75,210 @@ async def add_pet(
     )
 
 
-@pet_router.get("/", response_model=ShowPetInDetailSchema)
+@pet_router.get("/", responses=get_documented_responses(ShowPetInDetailSchema))
 async def get_pet(
     pet_id: UUID,
+    upcoming_events: int = Query(default=10, ge=0, le=100),
+    recent_events: int = Query(default=10, ge=0, le=100),
+    if_none_match: Optional[str] = Header(default=None),
     user: User = Depends(get_current_user),
     pet_service: PetService = Depends(get_pet_service),
-) -> ShowPetInDetailSchema:
-    """Endpoint that returns a pet with the provided id"""
+) -> Response:
+    """Endpoint that returns a pet with the provided id together with
+    the nearest upcoming and the latest happened events. The rest
+    of the events are available by the /pet/events endpoint.
+    The response is cached until the data of the user changes.
+    The pet is not sent again if neither it nor its events
+    have changed since the request with the provided ETag"""
 
-    pet, events = await pet_service.get_pet_by_id(pet_id=pet_id, user_id=user.user_id)
+    cache_key: str = get_cache_key(
+        "/pet/",
+        pet_id=pet_id,
+        upcoming_events=upcoming_events,
+        recent_events=recent_events,
+    )
+    generation, cached_response = await get_cached_response(
+        user_id=user.user_id, route="/pet/", key=cache_key
+    )
+    if cached_response is not None:
+        if is_not_modified(cached_response.headers, if_none_match):
+            return get_not_modified_response(cached_response.headers)
+        return to_response(cached_response)
+
+    version: Optional[tuple] = await pet_service.get_pet_version(
+        pet_id=pet_id, user_id=user.user_id
+    )
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Pet with this id not found"
+        )
+
+    validators: Dict[str, str] = get_validators(get_etag(cache_key, *version))
+    if is_not_modified(validators, if_none_match):
+        return get_not_modified_response(validators)
+
+    pet, events = await pet_service.get_pet_by_id(
+        pet_id=pet_id,
+        user_id=user.user_id,
+        upcoming_limit=upcoming_events,
+        recent_limit=recent_events,
+    )
 
     if pet is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Pet with this id not found"
         )
 
-    return ShowPetInDetailSchema(
-        pet_id=pet.pet_id,
-        name=pet.name,
-        species=pet.species,
-        breed=pet.breed,
-        gender=pet.gender,
-        weight=pet.weight,
-        events=events,
+    cached_response = await cache_response(
+        user_id=user.user_id,
+        generation=generation,
+        key=cache_key,
+        content=serialize_trusted(
+            {
+                "pet_id": pet.pet_id,
+                "name": pet.name,
+                "species": pet.species,
+                "breed": pet.breed,
+                "gender": pet.gender,
+                "weight": pet.weight,
+                "events": events,
+            }
+        ),
+        headers=validators,
+    )
+    return to_response(cached_response)
+
+
+@pet_router.get("/events", responses=get_documented_responses(List[ShowEventSchema]))
+async def get_pet_events(
+    pet_id: UUID,
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    if_none_match: Optional[str] = Header(default=None),
+    user: User = Depends(get_current_user),
+    event_service: EventService = Depends(get_event_service),
+) -> Response:
+    """Endpoint that returns a page of events of the pet with the provided
+    id ordered by the scheduled date in descending order. If there are
+    more events, the cursor of the next page is returned
+    in the X-Next-Cursor header. The page is not sent again if
+    the events of the pet have not changed since the request
+    with the provided ETag"""
+
+    version: Tuple[Optional[datetime], int] = await event_service.get_events_version(
+        user=user, pet_id=pet_id
+    )
+    validators: Dict[str, str] = get_validators(
+        get_etag(
+            get_cache_key("/pet/events", pet_id=pet_id, limit=limit, cursor=cursor),
+            *version,
+        )
     )
+    if is_not_modified(validators, if_none_match):
+        return get_not_modified_response(validators)
 
+    try:
+        events_data, next_cursor = await event_service.get_list_of_events(
+            user=user, limit=limit, cursor=cursor, pet_id=pet_id
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Incorrect cursor",
+        )
 
-@pet_router.get("/list-of-pets", response_model=List[ShowPetSchema])
+    if not events_data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="There are no events of the pet with this id",
+        )
+
+    headers: Dict[str, str] = dict(validators)
+    if next_cursor is not None:
+        headers["X-Next-Cursor"] = next_cursor
+
+    return Response(
+        content=serialize_trusted(events_data),
+        headers=headers,
+        media_type="application/json",
+    )
+
+
+@pet_router.get(
+    "/list-of-pets", responses=get_documented_responses(List[ShowPetSchema])
+)
 async def get_list_of_pets(
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    sort: PetSortingEnum = PetSortingEnum.created_at,
+    species: Optional[str] = Query(default=None, min_length=1, max_length=30),
+    name: Optional[str] = Query(default=None, min_length=1, max_length=30),
+    if_none_match: Optional[str] = Header(default=None),
     user: User = Depends(get_current_user),
     pet_service: PetService = Depends(get_pet_service),
-) -> List[Pet]:
-    """Endpoint that returns list of pets belonged to the current user"""
+) -> Response:
+    """Endpoint that returns a page of pets belonged to the current user.
+    Pets can be filtered by species and by the beginning of the name.
+    If there are more pets, the cursor of the next page is returned
+    in the X-Next-Cursor header. The page is not sent again if the pets
+    have not changed since the request with the provided ETag.
+    The page is cached until the data of the user changes"""
 
-    pets: List[Pet] = await pet_service.get_list_of_pets(user=user)
+    cache_key: str = get_cache_key(
+        "/pet/list-of-pets",
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+        species=species,
+        name=name,
+    )
+    generation, cached_response = await get_cached_response(
+        user_id=user.user_id, route="/pet/list-of-pets", key=cache_key
+    )
+    if cached_response is not None:
+        if is_not_modified(cached_response.headers, if_none_match):
+            return get_not_modified_response(cached_response.headers)
+        return to_response(cached_response)
+
+    version: Tuple[Optional[datetime], int] = await pet_service.get_pets_version(
+        user=user
+    )
+    validators: Dict[str, str] = get_validators(get_etag(cache_key, *version))
+    if is_not_modified(validators, if_none_match):
+        return get_not_modified_response(validators)
+
+    try:
+        pets_data, next_cursor = await pet_service.get_list_of_pets(
+            user=user,
+            limit=limit,
+            sort=sort,
+            cursor=cursor,
+            species=species,
+            name=name,
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Incorrect cursor",
+        )
 
-    if not pets:
+    if not pets_data:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="This user does not have pets"
         )
 
-    return pets
+    headers: Dict[str, str] = dict(validators)
+    if next_cursor is not None:
+        headers["X-Next-Cursor"] = next_cursor
+
+    cached_response = await cache_response(
+        user_id=user.user_id,
+        generation=generation,
+        key=cache_key,
+        content=serialize_trusted(pets_data),
+        headers=headers,
+    )
+    return to_response(cached_response)
 
 
 @pet_router.delete("/")
@@ -1,3 +1,4 @@
+from enum import Enum
 from typing import List
 from typing import Optional
 from uuid import UUID
@@ -21,6 +22,13 @@ class PetCreationSchema(PetValidationMixin, BaseModel):
     weight: Optional[float] = None
 
 
+class PetSortingEnum(str, Enum):
+    """Enum class that represents options of sorting the list of pets"""
+
+    created_at = "created_at"
+    name = "name"
+
+
 class ShowPetSchema(BaseModel):
     """Schema representing general information about a pet"""
 
@@ -1,13 +1,26 @@
+from datetime import datetime
 from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import Union
 from uuid import UUID
 
+from sqlalchemy import func
 from sqlalchemy import Result
+from sqlalchemy import Row
+from sqlalchemy import Select
 from sqlalchemy import select
+from sqlalchemy import Subquery
+from sqlalchemy import tuple_
+from sqlalchemy import union_all
+from sqlalchemy.orm import load_only
 from sqlalchemy.orm import selectinload
 
+from src.cache import invalidate_cached_responses
+from src.event.models import Event
 from src.pet.models import Pet
 from src.pet.models import PetGenderEnum
+from src.pet.schemas import PetSortingEnum
 from src.services import BaseDAL
 from src.user.models import User
 
@@ -39,7 +52,8 @@ class PetDAL(BaseDAL):
             self.db_session.add(pet)
             await self.db_session.flush()
 
-            return pet
+        await invalidate_cached_responses(user.user_id)
+        return pet
 
     async def get_pet(self, pet_id: UUID, user_id: UUID) -> Optional[Pet]:
         """Gets a pet from database by the provided id.
@@ -53,22 +67,140 @@ class PetDAL(BaseDAL):
             )
             return result.scalars().first()
 
-    async def get_pets(self, user: User) -> List[Pet]:
-        """Gets a list of pets belonged to the provided user from database"""
+    async def get_pet_by_owner(self, pet_id: UUID, user_id: UUID) -> Optional[Pet]:
+        """Gets a pet from database by the provided id if it belongs
+        to the provided user. Events of the pet are not loaded"""
 
         async with self.db_session.begin():
             result: Result = await self.db_session.execute(
-                select(Pet).filter_by(owner_id=user.user_id)
+                select(Pet).filter_by(pet_id=pet_id, owner_id=user_id)
             )
+            return result.scalars().first()
+
+    async def get_pets_by_owner(self, pet_ids: List[UUID], user_id: UUID) -> List[Pet]:
+        """Gets the pets with the provided ids from database which
+        belong to the provided user. Events of the pets are not loaded"""
 
+        async with self.db_session.begin():
+            result: Result = await self.db_session.execute(
+                select(Pet).filter(Pet.pet_id.in_(pet_ids), Pet.owner_id == user_id)
+            )
             return result.scalars().all()
 
+    async def get_pet_events_window(
+        self, pet_id: UUID, upcoming_limit: int, recent_limit: int
+    ) -> List[Event]:
+        """Gets a bounded window of the events of the provided pet from
+        database: the nearest events that have not happened yet and
+        the latest happened ones. Both parts are sorted and limited
+        by database and returned in one list ordered by the scheduled
+        date in descending order"""
+
+        upcoming: Select = (
+            select(Event.event_id)
+            .filter(Event.pet_id == pet_id, Event.is_happened == False)
+            .order_by(Event.scheduled_at, Event.event_id)
+            .limit(upcoming_limit)
+        )
+        recent: Select = (
+            select(Event.event_id)
+            .filter(Event.pet_id == pet_id, Event.is_happened == True)
+            .order_by(Event.scheduled_at.desc(), Event.event_id.desc())
+            .limit(recent_limit)
+        )
+
+        window: Subquery = union_all(upcoming, recent).subquery("window")
+
+        async with self.db_session.begin():
+            result: Result = await self.db_session.execute(
+                select(Event)
+                .join(window, Event.event_id == window.c.event_id)
+                .options(
+                    load_only(
+                        Event.event_id,
+                        Event.title,
+                        Event.pet_id,
+                        Event.scheduled_at,
+                        Event.is_happened,
+                        Event.recurrence_rule,
+                    )
+                )
+                .order_by(Event.scheduled_at.desc(), Event.event_id.desc())
+            )
+            return result.scalars().all()
+
+    async def get_pets_page(
+        self,
+        user_id: UUID,
+        limit: int,
+        sort: PetSortingEnum = PetSortingEnum.created_at,
+        cursor: Optional[Tuple[Union[datetime, str], UUID]] = None,
+        species: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> List[Row]:
+        """Gets a page of pets of the provided user from database as rows
+        containing only the identifier, the name and the creation date.
+        Pets are ordered by the provided sorting parameter and "pet_id".
+        The page starts after the pet the provided cursor points to"""
+
+        sort_column = getattr(Pet, sort.value)
+        query: Select = select(Pet.pet_id, Pet.name, Pet.created_at).filter(
+            Pet.owner_id == user_id
+        )
+
+        if cursor is not None:
+            query = query.filter(tuple_(sort_column, Pet.pet_id) > cursor)
+        if species is not None:
+            query = query.filter(Pet.species == species)
+        if name is not None:
+            query = query.filter(Pet.name.istartswith(name, autoescape=True))
+
+        query = query.order_by(sort_column, Pet.pet_id).limit(limit)
+
+        async with self.db_session.begin():
+            result: Result = await self.db_session.execute(query)
+            return result.all()
+
+    async def get_pets_version(self, user_id: UUID) -> Row:
+        """Gets the version of the pets of the provided user: the date
+        of the latest update and the number of pets. The number changes
+        when a pet is deleted, unlike the date"""
+
+        async with self.db_session.begin():
+            result: Result = await self.db_session.execute(
+                select(
+                    func.max(Pet.updated_at).label("updated_at"),
+                    func.count().label("count"),
+                ).filter(Pet.owner_id == user_id)
+            )
+            return result.one()
+
+    async def get_pet_version(self, pet_id: UUID, user_id: UUID) -> Optional[Row]:
+        """Gets the version of the pet with its events if the pet belongs
+        to the provided user: the dates of the latest update of the pet
+        and of its events and the number of the events"""
+
+        async with self.db_session.begin():
+            result: Result = await self.db_session.execute(
+                select(
+                    Pet.updated_at,
+                    func.max(Event.updated_at).label("events_updated_at"),
+                    func.count(Event.event_id).label("events_count"),
+                )
+                .outerjoin(Event, Event.pet_id == Pet.pet_id)
+                .filter(Pet.pet_id == pet_id, Pet.owner_id == user_id)
+                .group_by(Pet.pet_id)
+            )
+            return result.first()
+
     async def delete_pet(self, pet: Pet) -> None:
         """Deletes the provided pass from database"""
 
         async with self.db_session.begin():
             await self.db_session.delete(pet)
 
+        await invalidate_cached_responses(pet.owner_id)
+
     async def update_pet(
         self,
         pet: Pet,
@@ -80,4 +212,5 @@ class PetDAL(BaseDAL):
             for key, value in parameters_for_update.items():
                 setattr(pet, key, value)
 
-            return pet
+        await invalidate_cached_responses(pet.owner_id)
+        return pet
@@ -1,11 +1,17 @@
-import operator
+import base64
+from datetime import datetime
 from typing import List
 from typing import Optional
 from typing import Tuple
+from typing import Union
 from uuid import UUID
 
+from sqlalchemy import Row
+
+from src.event.models import Event
 from src.pet.models import Pet
 from src.pet.models import PetGenderEnum
+from src.pet.schemas import PetSortingEnum
 from src.services import BaseService
 from src.user.models import User
 
@@ -35,46 +41,128 @@ class PetService(BaseService):
         )
         return pet
 
-    async def get_pet_by_id(
+    async def get_pet_version(
         self, pet_id: UUID, user_id: UUID
+    ) -> Optional[Tuple[datetime, Optional[datetime], int]]:
+        """Gets the dates of the latest update of the pet and of its events
+        and the number of the events without loading the pet and its events.
+        Returns None if the user does not have the pet"""
+
+        version: Optional[Row] = await self.dal.get_pet_version(
+            pet_id=pet_id, user_id=user_id
+        )
+        if version is None:
+            return None
+        return version.updated_at, version.events_updated_at, version.events_count
+
+    async def get_pets_version(self, user: User) -> Tuple[Optional[datetime], int]:
+        """Gets the date of the latest update and the number of the pets
+        of the user without loading the pets themselves"""
+
+        version: Row = await self.dal.get_pets_version(user_id=user.user_id)
+        return version.updated_at, version.count
+
+    async def get_pet_by_id(
+        self, pet_id: UUID, user_id: UUID, upcoming_limit: int, recent_limit: int
     ) -> [Tuple[Optional[Pet], List[dict]]]:
-        """Gets a pet by its id"""
+        """Gets a pet by its id with a bounded window of its events:
+        not more than the provided number of upcoming and recent ones"""
 
-        pet: Optional[Pet] = await self.dal.get_pet(pet_id=pet_id, user_id=user_id)
+        pet: Optional[Pet] = await self.dal.get_pet_by_owner(
+            pet_id=pet_id, user_id=user_id
+        )
 
         if pet is None:
             return None, []
 
-        return pet, self._form_event_data_for_pet(pet=pet)
+        events: List[Event] = await self.dal.get_pet_events_window(
+            pet_id=pet_id, upcoming_limit=upcoming_limit, recent_limit=recent_limit
+        )
+        return pet, self._form_event_data_for_pet(events=events)
+
+    @staticmethod
+    def _form_event_data_for_pet(events: List[Event]) -> List[dict]:
+        """Forms data containing a list of the provided events of a pet
+        keeping their order, since they are sorted by database. The fields
+        follow ShowEventSchema in the same order, so the data can be
+        serialized without constructing the schema"""
+
+        return [
+            {
+                "event_id": event.event_id,
+                "pet_id": event.pet_id,
+                "title": event.title,
+                "content": None,
+                "year": event.scheduled_at.year,
+                "month": event.scheduled_at.month,
+                "day": event.scheduled_at.day,
+                "hour": event.scheduled_at.hour,
+                "minute": event.scheduled_at.minute,
+                "is_happened": event.is_happened,
+                "recurrence_rule": event.recurrence_rule,
+            }
+            for event in events
+        ]
+
+    async def get_list_of_pets(
+        self,
+        user: User,
+        limit: int,
+        sort: PetSortingEnum = PetSortingEnum.created_at,
+        cursor: Optional[str] = None,
+        species: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        """Gets a page containing general information about pets of the
+        provided user and the cursor pointing to the next page if it
+        exists. Raises ValueError if the cursor is malformed"""
+
+        rows: List[Row] = await self.dal.get_pets_page(
+            user_id=user.user_id,
+            limit=limit + 1,
+            sort=sort,
+            cursor=self._decode_cursor(cursor, sort) if cursor is not None else None,
+            species=species,
+            name=name,
+        )
+
+        next_cursor: Optional[str] = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = self._encode_cursor(row=rows[-1], sort=sort)
+
+        pets_data: List[dict] = [
+            {"pet_id": row.pet_id, "name": row.name} for row in rows
+        ]
+        return pets_data, next_cursor
+
+    @staticmethod
+    def _encode_cursor(row: Row, sort: PetSortingEnum) -> str:
+        """Forms an opaque cursor pointing to the pet of the provided row"""
+
+        value: Union[datetime, str] = getattr(row, sort.value)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+
+        raw_cursor: str = f"{sort.value}|{row.pet_id}|{value}"
+        return base64.urlsafe_b64encode(raw_cursor.encode()).decode()
 
     @staticmethod
-    def _form_event_data_for_pet(pet: Pet) -> List[dict]:
-        """Forms data containing a list of events belonged to the provided pet"""
-
-        events = []
-        for event in sorted(
-            pet.events, key=operator.attrgetter("scheduled_at"), reverse=True
-        ):
-            events.append(
-                {
-                    "event_id": event.event_id,
-                    "title": event.title,
-                    "pet_id": event.pet_id,
-                    "year": event.scheduled_at.year,
-                    "month": event.scheduled_at.month,
-                    "day": event.scheduled_at.day,
-                    "hour": event.scheduled_at.hour,
-                    "minute": event.scheduled_at.minute,
-                    "is_happened": event.is_happened,
-                }
-            )
-        return events
-
-    async def get_list_of_pets(self, user: User) -> List[Pet]:
-        """Gets a list of pets belonged to the provided user"""
-
-        pets: List[Pet] = await self.dal.get_pets(user=user)
-        return pets
+    def _decode_cursor(
+        cursor: str, sort: PetSortingEnum
+    ) -> Tuple[Union[datetime, str], UUID]:
+        """Gets the value of the sorting parameter and the id of the pet
+        the cursor points to. Raises ValueError if the cursor is malformed
+        or was formed for another sorting parameter"""
+
+        raw_cursor: str = base64.urlsafe_b64decode(cursor.encode()).decode()
+        cursor_sort, pet_id, value = raw_cursor.split("|", 2)
+        if cursor_sort != sort.value:
+            raise ValueError("Cursor was formed for another sorting parameter")
+
+        if sort == PetSortingEnum.created_at:
+            return datetime.fromisoformat(value), UUID(pet_id)
+        return value, UUID(pet_id)
 
     async def delete_pet_by_id(self, pet_id: UUID, user_id: UUID) -> None:
         """Deletes a pet with the provided id"""
@@ -0,0 +1,71 @@
+from fastapi import APIRouter
+from fastapi import Depends
+from fastapi import Query
+from fastapi import Response
+from prometheus_client import CONTENT_TYPE_LATEST
+from prometheus_client import generate_latest
+
+from src.config import project_settings
+from src.database import engine_manager
+from src.dependencies import verify_service_token
+from src.event.dependencies import get_event_service
+from src.event.services.services import EventService
+from src.templates import template_registry
+from src.user.services.hashing import hashing_executor
+
+
+service_router: APIRouter = APIRouter(
+    prefix="/service",
+    tags=[
+        "service",
+    ],
+    dependencies=[Depends(verify_service_token)],
+)
+
+metrics_router: APIRouter = APIRouter(
+    tags=[
+        "service",
+    ],
+)
+
+
+@metrics_router.get(path="/metrics", include_in_schema=False)
+async def get_metrics() -> Response:
+    """Endpoint that returns the metrics of the application
+    in Prometheus text format"""
+
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+@service_router.get(path="/db-pool")
+async def get_db_pool_stats() -> dict:
+    """Endpoint that returns the state of the database connection pool"""
+
+    return engine_manager.get_pool_stats()
+
+
+@service_router.get(path="/hashing")
+async def get_hashing_stats() -> dict:
+    """Endpoint that returns the state of the password hashing pool"""
+
+    return hashing_executor.get_stats()
+
+
+@service_router.get(path="/templates")
+async def get_templates_stats() -> dict:
+    """Endpoint that returns the loaded email templates and their render timings"""
+
+    return template_registry.get_stats()
+
+
+@service_router.get(path="/notification-lag")
+async def get_notification_lag_report(
+    hours: int = Query(
+        default=24, ge=1, le=24 * project_settings.NOTIFICATION_LAG_RETENTION_DAYS
+    ),
+    event_service: EventService = Depends(get_event_service),
+) -> dict:
+    """Endpoint that returns the percentiles of the lag of sending
+    notifications for every hour of the provided period"""
+
+    return await event_service.get_notification_lag_report(hours=hours)
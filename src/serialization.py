@@ -0,0 +1,39 @@
+from functools import lru_cache
+from typing import Any
+from uuid import UUID
+
+import orjson
+from pydantic import TypeAdapter
+
+
+def serialize(response_type: Any, data: Any) -> bytes:
+    """Validates the data as the provided response type
+    and serializes the result to JSON"""
+
+    type_adapter: TypeAdapter = _get_type_adapter(response_type)
+    return type_adapter.dump_json(type_adapter.validate_python(data))
+
+
+def serialize_trusted(data: Any) -> bytes:
+    """Serializes the data formed by the services straight to JSON
+    without constructing a Pydantic model for every item. The data must
+    already have the shape of the response schema: the same fields
+    in the same order and the values of the final types"""
+
+    return orjson.dumps(data, default=_serialize_unsupported)
+
+
+def _serialize_unsupported(value: Any) -> Any:
+    """Serializes the values which orjson does not support natively,
+    such as UUID subclasses returned by asyncpg"""
+
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+@lru_cache(maxsize=None)
+def _get_type_adapter(response_type: Any) -> TypeAdapter:
+    """Creates the adapter serializing the response type once"""
+
+    return TypeAdapter(response_type)
@@ -0,0 +1,377 @@
+import asyncio
+import os
+import smtplib
+import ssl
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from contextlib import contextmanager
+from email.message import Message
+from typing import AsyncIterator
+from typing import Callable
+from typing import Deque
+from typing import Iterator
+from typing import Optional
+from typing import Union
+
+import aiosmtplib
+
+from src.config import project_settings
+
+
+class PooledConnection:
+    """Connection to a smtp server kept by a pool together
+    with the data needed to decide whether it can be reused"""
+
+    def __init__(self, client: Union[smtplib.SMTP, aiosmtplib.SMTP]):
+        """Initializes PooledConnection by binding the connected client to it"""
+
+        self.client: Union[smtplib.SMTP, aiosmtplib.SMTP] = client
+        self.sent_messages: int = 0
+        self.last_used_at: float = time.monotonic()
+
+    @property
+    def idle_seconds(self) -> float:
+        return time.monotonic() - self.last_used_at
+
+
+class BaseSMTPConnectionPool:
+    """Base class for the pools of smtp connections. A connection is
+    returned to the pool after sending, checked with NOOP before reuse
+    if it was idle for a while, and closed after sending
+    the configured number of messages"""
+
+    def __init__(
+        self,
+        size: int,
+        max_messages_per_connection: int,
+        keepalive_seconds: int,
+        max_idle_seconds: int,
+    ):
+        """Initializes the pool by binding its capacity and
+        the limits that decide whether a connection is reused"""
+
+        self.size: int = size
+        self.max_messages_per_connection: int = max_messages_per_connection
+        self.keepalive_seconds: int = keepalive_seconds
+        self.max_idle_seconds: int = max_idle_seconds
+        self._idle: Deque[PooledConnection] = deque()
+
+        self.opened: int = 0
+        self.reused: int = 0
+
+        # functions receiving the duration of opening a connection
+        # and of sending a message in seconds, used for metrics
+        self.on_connect: Optional[Callable[[float], None]] = None
+        self.on_send: Optional[Callable[[float], None]] = None
+
+    def _is_exhausted(self, connection: PooledConnection) -> bool:
+        """Checks whether the connection must be closed instead of
+        returning to the pool"""
+
+        return (
+            connection.sent_messages >= self.max_messages_per_connection
+            or len(self._idle) >= self.size
+        )
+
+
+class SMTPConnectionPool(BaseSMTPConnectionPool):
+    """Thread-safe pool of smtplib connections used by synchronous code.
+    A forked process starts with an empty pool, since the sockets
+    of the parent process cannot be shared"""
+
+    def __init__(self, connect: Callable[[], smtplib.SMTP], **kwargs):
+        """Initializes SMTPConnectionPool by binding the function
+        that opens a new authenticated connection"""
+
+        super().__init__(**kwargs)
+        self.connect: Callable[[], smtplib.SMTP] = connect
+        self._lock: threading.Lock = threading.Lock()
+        self._pid: int = os.getpid()
+
+    def send_message(self, message: Message) -> None:
+        """Sends the message using a pooled connection. If the server
+        has already closed the connection, the message is sent again
+        using a new one"""
+
+        started_at: float = time.perf_counter()
+        try:
+            for attempt in range(2):
+                try:
+                    with self.connection() as client:
+                        client.send_message(message)
+                    return
+                except smtplib.SMTPServerDisconnected:
+                    if attempt:
+                        raise
+        finally:
+            if self.on_send is not None:
+                self.on_send(time.perf_counter() - started_at)
+
+    @contextmanager
+    def connection(self) -> Iterator[smtplib.SMTP]:
+        """Provides a healthy connection returning it to the pool afterwards.
+        The connection is dropped if it turned out to be broken"""
+
+        connection: PooledConnection = self._acquire()
+        try:
+            yield connection.client
+        except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused):
+            # the server rejected the message, but the connection is fine
+            self._release(connection)
+            raise
+        except BaseException:
+            connection.client.close()
+            raise
+        else:
+            self._release(connection)
+
+    def close(self) -> None:
+        """Closes all the idle connections"""
+
+        with self._lock:
+            connections: list = list(self._idle)
+            self._idle.clear()
+
+        for connection in connections:
+            self._close(connection)
+
+    def _acquire(self) -> PooledConnection:
+        while True:
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._idle.clear()
+                    self._pid = os.getpid()
+                connection: Optional[PooledConnection] = (
+                    self._idle.pop() if self._idle else None
+                )
+
+            if connection is None:
+                self.opened += 1
+                started_at: float = time.perf_counter()
+                client: smtplib.SMTP = self.connect()
+                if self.on_connect is not None:
+                    self.on_connect(time.perf_counter() - started_at)
+                return PooledConnection(client)
+
+            if self._is_healthy(connection):
+                self.reused += 1
+                return connection
+            self._close(connection)
+
+    def _is_healthy(self, connection: PooledConnection) -> bool:
+        if connection.idle_seconds > self.max_idle_seconds:
+            return False
+        if connection.idle_seconds <= self.keepalive_seconds:
+            return connection.client.sock is not None
+
+        try:
+            return connection.client.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _release(self, connection: PooledConnection) -> None:
+        connection.sent_messages += 1
+        with self._lock:
+            if not self._is_exhausted(connection):
+                connection.last_used_at = time.monotonic()
+                self._idle.append(connection)
+                return
+
+        self._close(connection)
+
+    @staticmethod
+    def _close(connection: PooledConnection) -> None:
+        try:
+            connection.client.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.client.close()
+
+
+class AsyncSMTPConnectionPool(BaseSMTPConnectionPool):
+    """Pool of aiosmtplib connections used by the application. No more
+    than the size of the pool connections are used at once, the other
+    senders wait for a connection to be released. The connections belong
+    to the event loop they were opened in, so the pool is emptied
+    when it is used from another loop"""
+
+    def __init__(self, connect: Callable, **kwargs):
+        """Initializes AsyncSMTPConnectionPool by binding the coroutine
+        function that opens a new authenticated connection"""
+
+        super().__init__(**kwargs)
+        self.connect: Callable = connect
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def send_message(self, message: Message) -> None:
+        """Sends the message using a pooled connection. If the server
+        has already closed the connection, the message is sent again
+        using a new one"""
+
+        for attempt in range(2):
+            try:
+                async with self.connection() as client:
+                    await client.send_message(message)
+                return
+            except aiosmtplib.SMTPServerDisconnected:
+                if attempt:
+                    raise
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[aiosmtplib.SMTP]:
+        """Provides a healthy connection returning it to the pool afterwards.
+        The connection is dropped if it turned out to be broken"""
+
+        self._bind_to_running_loop()
+        async with self._semaphore:
+            connection: PooledConnection = await self._acquire()
+            try:
+                yield connection.client
+            except (
+                aiosmtplib.SMTPResponseException,
+                aiosmtplib.SMTPRecipientsRefused,
+            ):
+                # the server rejected the message, but the connection is fine
+                await self._release(connection)
+                raise
+            except BaseException:
+                connection.client.close()
+                raise
+            else:
+                await self._release(connection)
+
+    async def close(self) -> None:
+        """Closes all the idle connections"""
+
+        while self._idle:
+            await self._close(self._idle.pop())
+
+    def _bind_to_running_loop(self) -> None:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._idle.clear()
+            self._semaphore = asyncio.Semaphore(self.size)
+            self._loop = loop
+
+    async def _acquire(self) -> PooledConnection:
+        while self._idle:
+            connection: PooledConnection = self._idle.pop()
+            if await self._is_healthy(connection):
+                self.reused += 1
+                return connection
+            await self._close(connection)
+
+        self.opened += 1
+        return PooledConnection(await self.connect())
+
+    async def _is_healthy(self, connection: PooledConnection) -> bool:
+        if connection.idle_seconds > self.max_idle_seconds:
+            return False
+        if connection.idle_seconds <= self.keepalive_seconds:
+            return connection.client.is_connected
+
+        try:
+            return (await connection.client.noop()).code == 250
+        except (aiosmtplib.SMTPException, OSError):
+            return False
+
+    async def _release(self, connection: PooledConnection) -> None:
+        connection.sent_messages += 1
+        if not self._is_exhausted(connection):
+            connection.last_used_at = time.monotonic()
+            self._idle.append(connection)
+            return
+
+        await self._close(connection)
+
+    @staticmethod
+    async def _close(connection: PooledConnection) -> None:
+        try:
+            await connection.client.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            connection.client.close()
+
+
+def _connect_to_smtp_server() -> smtplib.SMTP:
+    """Connects to a smtp server using data from project settings"""
+
+    context: ssl.SSLContext = _create_ssl_context()
+
+    server: smtplib.SMTP
+    if project_settings.MAIL_SSL_TLS:
+        server = smtplib.SMTP_SSL(
+            project_settings.MAIL_SERVER,
+            project_settings.MAIL_PORT,
+            timeout=project_settings.SMTP_TIMEOUT_SECONDS,
+            context=context,
+        )
+    else:
+        server = smtplib.SMTP(
+            project_settings.MAIL_SERVER,
+            project_settings.MAIL_PORT,
+            timeout=project_settings.SMTP_TIMEOUT_SECONDS,
+        )
+
+    try:
+        if not project_settings.MAIL_SSL_TLS and project_settings.MAIL_STARTTLS:
+            server.starttls(context=context)
+
+        if project_settings.USE_CREDENTIALS:
+            server.login(project_settings.MAIL_USERNAME, project_settings.MAIL_PASSWORD)
+    except BaseException:
+        server.close()
+        raise
+
+    return server
+
+
+async def _async_connect_to_smtp_server() -> aiosmtplib.SMTP:
+    """Connects to a smtp server asynchronously using data from project settings"""
+
+    server: aiosmtplib.SMTP = aiosmtplib.SMTP(
+        hostname=project_settings.MAIL_SERVER,
+        port=project_settings.MAIL_PORT,
+        timeout=project_settings.SMTP_TIMEOUT_SECONDS,
+        use_tls=project_settings.MAIL_SSL_TLS,
+        start_tls=project_settings.MAIL_STARTTLS,
+        tls_context=_create_ssl_context(),
+    )
+    await server.connect()
+
+    try:
+        if project_settings.USE_CREDENTIALS:
+            await server.login(
+                project_settings.MAIL_USERNAME, project_settings.MAIL_PASSWORD
+            )
+    except BaseException:
+        server.close()
+        raise
+
+    return server
+
+
+def _create_ssl_context() -> ssl.SSLContext:
+    """Creates the TLS context checking certificates if it is configured"""
+
+    context: ssl.SSLContext = ssl.create_default_context()
+    if not project_settings.VALIDATE_CERTS:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+_pool_settings: dict = {
+    "size": project_settings.SMTP_POOL_SIZE,
+    "max_messages_per_connection": project_settings.SMTP_MAX_MESSAGES_PER_CONNECTION,
+    "keepalive_seconds": project_settings.SMTP_KEEPALIVE_SECONDS,
+    "max_idle_seconds": project_settings.SMTP_MAX_IDLE_SECONDS,
+}
+
+smtp_pool: SMTPConnectionPool = SMTPConnectionPool(
+    connect=_connect_to_smtp_server, **_pool_settings
+)
+async_smtp_pool: AsyncSMTPConnectionPool = AsyncSMTPConnectionPool(
+    connect=_async_connect_to_smtp_server, **_pool_settings
+)
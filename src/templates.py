@@ -0,0 +1,100 @@
+import os
+import time
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from jinja2 import BytecodeCache
+from jinja2 import Environment
+from jinja2 import FileSystemBytecodeCache
+from jinja2 import FileSystemLoader
+from jinja2 import Template
+
+from src.config import project_settings
+
+
+TEMPLATES_FOLDERS: List[str] = [
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), app, "templates")
+    for app in ("event", "user")
+]
+
+
+class TemplateRegistry:
+    """Registry of the email templates shared by the whole process.
+    The templates are compiled once by the load method, so rendering
+    does not touch the disk. Render time is tracked for every template"""
+
+    def __init__(self, folders: List[str], bytecode_cache_dir: Optional[str] = None):
+        """Initializes TemplateRegistry by creating the jinja environment
+        that never checks the templates for changes. If the directory for
+        bytecode cache is provided, compiled templates are stored there"""
+
+        bytecode_cache: Optional[BytecodeCache] = None
+        if bytecode_cache_dir:
+            os.makedirs(bytecode_cache_dir, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+
+        self.env: Environment = Environment(
+            loader=FileSystemLoader(folders),
+            cache_size=-1,
+            auto_reload=False,
+            bytecode_cache=bytecode_cache,
+        )
+        self._templates: Dict[str, Template] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def load(self) -> None:
+        """Compiles all the templates found in the folders of the registry"""
+
+        for template_name in self.env.list_templates(extensions=["html"]):
+            self.get_template(template_name)
+
+    def get_template(self, template_name: str) -> Template:
+        """Gets the compiled template compiling it if it is not loaded yet"""
+
+        template: Optional[Template] = self._templates.get(template_name)
+        if template is None:
+            template = self.env.get_template(template_name)
+            self._templates[template_name] = template
+        return template
+
+    def render(self, template_name: str, **context) -> str:
+        """Renders the template with the provided context"""
+
+        template: Template = self.get_template(template_name)
+
+        started_at: float = time.perf_counter()
+        result: str = template.render(**context)
+        self._track(template_name, time.perf_counter() - started_at)
+
+        return result
+
+    def get_stats(self) -> dict:
+        """Returns the loaded templates and their render timings in milliseconds"""
+
+        return {
+            "loaded": sorted(self._templates),
+            "renders": {
+                template_name: {
+                    "count": int(stats["count"]),
+                    "total_ms": round(stats["total"] * 1000, 3),
+                    "avg_ms": round(stats["total"] / stats["count"] * 1000, 3),
+                    "max_ms": round(stats["max"] * 1000, 3),
+                }
+                for template_name, stats in self._stats.items()
+            },
+        }
+
+    def _track(self, template_name: str, duration: float) -> None:
+        stats: Dict[str, float] = self._stats.setdefault(
+            template_name, {"count": 0, "total": 0.0, "max": 0.0}
+        )
+        stats["count"] += 1
+        stats["total"] += duration
+        stats["max"] = max(stats["max"], duration)
+
+
+template_registry: TemplateRegistry = TemplateRegistry(
+    folders=TEMPLATES_FOLDERS,
+    bytecode_cache_dir=project_settings.TEMPLATES_BYTECODE_CACHE_DIR,
+)
@@ -2,6 +2,8 @@ import datetime
 import uuid
 from uuid import UUID
 
+from sqlalchemy import JSON
+from sqlalchemy import String
 from sqlalchemy import text
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
@@ -35,3 +37,28 @@ class User(Base):
 
     def __eq__(self, other):
         return self.email == other.email
+
+
+class OutgoingEmail(Base):
+    """Model representing an email sent to the user by the celery
+    application together with the status of its delivery. The email
+    is rendered from the template and the context when it is sent,
+    so the confirmation token is not stored"""
+
+    __tablename__ = "outgoing_email"
+
+    email_id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    recipients: Mapped[str] = mapped_column(String(300))
+    subject: Mapped[str] = mapped_column(String(200))
+    template_name: Mapped[str] = mapped_column(String(100))
+    context: Mapped[dict] = mapped_column(JSON)
+    status: Mapped[str] = mapped_column(String(20), default="pending")
+    attempts: Mapped[int] = mapped_column(default=0)
+    last_error: Mapped[str] = mapped_column(String(500), nullable=True)
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        server_default=text("TIMEZONE ('utc', now())")
+    )
+    sent_at: Mapped[datetime.datetime] = mapped_column(nullable=True)
+
+    def __repr__(self):
+        return f"Email №{self.email_id} ({self.status})"
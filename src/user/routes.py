@@ -1,7 +1,12 @@
+from typing import Dict
+from typing import Optional
+
 from aiosmtplib import SMTPDataError
 from aiosmtplib import SMTPRecipientsRefused
 from fastapi import Depends
+from fastapi import Header
 from fastapi import HTTPException
+from fastapi import Response
 from fastapi import status
 from fastapi.routing import APIRouter
 from fastapi.security import OAuth2PasswordRequestForm
@@ -9,6 +14,10 @@ from jose import JWTError
 from sqlalchemy.exc import IntegrityError
 from starlette.responses import JSONResponse
 
+from src.conditional import get_etag
+from src.conditional import get_not_modified_response
+from src.conditional import get_validators
+from src.conditional import is_not_modified
 from src.dependencies import get_current_user
 from src.exceptions import email_sending_exception
 from src.user.dependencies import get_user_service
@@ -78,9 +87,23 @@ async def verify_email(
 
 
 @user_router.get(path="/", response_model=ShowUserSchema)
-async def get_user(user: User = Depends(get_current_user)) -> User:
-    """Endpoint that returns user data for profile"""
+async def get_user(
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+    if_modified_since: Optional[str] = Header(default=None),
+    user: User = Depends(get_current_user),
+) -> User:
+    """Endpoint that returns user data for profile. The data is not
+    sent again if it has not changed since the request with
+    the provided ETag or since the provided date"""
+
+    validators: Dict[str, str] = get_validators(
+        get_etag("/user/", user.user_id, user.updated_at), user.updated_at
+    )
+    if is_not_modified(validators, if_none_match, if_modified_since):
+        return get_not_modified_response(validators)
 
+    response.headers.update(validators)
     return user
 
 
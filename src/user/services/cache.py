@@ -0,0 +1,179 @@
+import json
+import time
+from abc import ABC
+from abc import abstractmethod
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional
+from typing import Tuple
+from uuid import UUID
+
+from redis import asyncio as redis
+from sqlalchemy.orm import make_transient_to_detached
+
+from src.config import project_settings
+from src.user.models import User
+
+
+USER_PRINCIPAL_FIELDS: Tuple[str, ...] = (
+    "user_id",
+    "username",
+    "email",
+    "created_at",
+    "updated_at",
+    "is_active",
+)
+
+
+def dump_user(user: User) -> dict:
+    """Forms the data of the provided user that is stored in the cache.
+    The password hash is not cached, so it is never kept in Redis"""
+
+    return {field: getattr(user, field) for field in USER_PRINCIPAL_FIELDS}
+
+
+def load_user(data: dict) -> User:
+    """Creates a detached user object from the cached data.
+    The object behaves as if it was loaded from database
+    by a session that is already closed. The password hash
+    is not loaded and must be read from database"""
+
+    user: User = User(**data)
+    make_transient_to_detached(user)
+    return user
+
+
+class BaseUserCache(ABC):
+    """Base class for the caches of authenticated users
+    keyed by the subject of the access token"""
+
+    @abstractmethod
+    async def get(self, subject: str) -> Optional[dict]:
+        """Gets the user data by the token subject"""
+
+    @abstractmethod
+    async def set(self, subject: str, data: dict) -> None:
+        """Saves the user data for the token subject"""
+
+    @abstractmethod
+    async def invalidate(self, subject: str) -> None:
+        """Removes the user data for the token subject"""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Removes all the cached user data"""
+
+
+class DisabledUserCache(BaseUserCache):
+    """Cache that stores nothing, so every user is loaded from database"""
+
+    async def get(self, subject: str) -> Optional[dict]:
+        return None
+
+    async def set(self, subject: str, data: dict) -> None:
+        pass
+
+    async def invalidate(self, subject: str) -> None:
+        pass
+
+    async def clear(self) -> None:
+        pass
+
+
+class InMemoryUserCache(BaseUserCache):
+    """Per-process LRU cache whose entries expire after the provided TTL.
+    Only suitable when the users are changed by the same process,
+    since the changes in other processes do not invalidate it"""
+
+    def __init__(self, max_size: int, ttl: int):
+        """Initializes InMemoryUserCache by binding
+        its capacity and time to live of the entries"""
+
+        self.max_size: int = max_size
+        self.ttl: int = ttl
+        self._entries: OrderedDict[str, Tuple[float, dict]] = OrderedDict()
+
+    async def get(self, subject: str) -> Optional[dict]:
+        entry: Optional[Tuple[float, dict]] = self._entries.get(subject)
+        if entry is None:
+            return None
+
+        expires_at, data = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(subject, None)
+            return None
+
+        self._entries.move_to_end(subject)
+        return dict(data)
+
+    async def set(self, subject: str, data: dict) -> None:
+        self._entries[subject] = (time.monotonic() + self.ttl, dict(data))
+        self._entries.move_to_end(subject)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, subject: str) -> None:
+        self._entries.pop(subject, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class RedisUserCache(BaseUserCache):
+    """Cache shared by all the application processes that is stored in Redis"""
+
+    KEY_PREFIX: str = "user-principal:"
+
+    def __init__(self, url: str, ttl: int):
+        """Initializes RedisUserCache by creating a Redis client"""
+
+        self.ttl: int = ttl
+        self.client: redis.Redis = redis.from_url(url)
+
+    async def get(self, subject: str) -> Optional[dict]:
+        raw_data: Optional[bytes] = await self.client.get(self.KEY_PREFIX + subject)
+        if raw_data is None:
+            return None
+
+        data: dict = json.loads(raw_data)
+        data["user_id"] = UUID(data["user_id"])
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+        data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+        return data
+
+    async def set(self, subject: str, data: dict) -> None:
+        await self.client.set(
+            self.KEY_PREFIX + subject, json.dumps(data, default=str), ex=self.ttl
+        )
+
+    async def invalidate(self, subject: str) -> None:
+        await self.client.delete(self.KEY_PREFIX + subject)
+
+    async def clear(self) -> None:
+        async for key in self.client.scan_iter(match=self.KEY_PREFIX + "*"):
+            await self.client.delete(key)
+
+
+def _create_user_cache() -> BaseUserCache:
+    """Creates the user cache configured by project settings. Redis
+    is used by default and is the only storage, so the invalidation made
+    by any process is seen by all of them at once. The in-memory cache
+    is only used when Redis is disabled for a single process"""
+
+    if not project_settings.USER_CACHE_ENABLED:
+        return DisabledUserCache()
+
+    if project_settings.USER_CACHE_REDIS_ENABLED:
+        return RedisUserCache(
+            url=project_settings.USER_CACHE_REDIS_URL,
+            ttl=project_settings.USER_CACHE_REDIS_TTL_SECONDS,
+        )
+
+    return InMemoryUserCache(
+        max_size=project_settings.USER_CACHE_MAX_SIZE,
+        ttl=project_settings.USER_CACHE_LOCAL_TTL_SECONDS,
+    )
+
+
+user_cache: BaseUserCache = _create_user_cache()
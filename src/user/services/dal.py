@@ -1,3 +1,5 @@
+from datetime import datetime
+from typing import List
 from typing import Optional
 from uuid import UUID
 
@@ -8,7 +10,9 @@ from sqlalchemy import update
 from sqlalchemy.orm import selectinload
 
 from src.services import BaseDAL
+from src.user.models import OutgoingEmail
 from src.user.models import User
+from src.user.services.cache import user_cache
 
 
 class UserDAL(BaseDAL):
@@ -24,6 +28,15 @@ class UserDAL(BaseDAL):
             result: Result = await self.db_session.execute(query)
             return result.scalars().first()
 
+    async def get_hashed_password(self, user_id: UUID) -> Optional[str]:
+        """Gets the password hash of the user from database"""
+
+        async with self.db_session.begin():
+            result: Result = await self.db_session.execute(
+                select(User.hashed_password).filter_by(user_id=user_id)
+            )
+            return result.scalar_one_or_none()
+
     async def update_username_and_password(
         self,
         username: str,
@@ -82,6 +95,8 @@ class UserDAL(BaseDAL):
                 update(User).filter_by(user_id=user.user_id).values(is_active=False)
             )
 
+        await user_cache.invalidate(user.email)
+
     async def change_username(self, user: User, new_username: str) -> User:
         """Changes username of the provided user"""
 
@@ -92,7 +107,10 @@ class UserDAL(BaseDAL):
                 .values(username=new_username)
                 .returning(User)
             )
-            return result.scalars().first()
+            updated_user: User = result.scalars().first()
+
+        await user_cache.invalidate(user.email)
+        return updated_user
 
     async def change_password(self, user: User, new_password: str) -> User:
         """Changes password of the provided user"""
@@ -104,14 +122,22 @@ class UserDAL(BaseDAL):
                 .values(hashed_password=new_password)
                 .returning(User)
             )
-            return result.scalars().first()
+            updated_user: User = result.scalars().first()
+
+        await user_cache.invalidate(user.email)
+        return updated_user
 
     async def change_email(self, user: User, new_email: str) -> User:
         """Changes email of the provided user"""
 
+        old_email: str = user.email
+
         async with self.db_session.begin():
             setattr(user, "email", new_email)
-            return user
+
+        await user_cache.invalidate(old_email)
+        await user_cache.invalidate(new_email)
+        return user
 
     async def get_user_by_username(self, username: str) -> Optional[User]:
         """Gets user from database by its username"""
@@ -121,3 +147,44 @@ class UserDAL(BaseDAL):
                 select(User).filter_by(username=username)
             )
             return result.scalars().first()
+
+    async def create_outgoing_email(
+        self, recipients: List[str], subject: str, template_name: str, context: dict
+    ) -> OutgoingEmail:
+        """Saves the email that is going to be sent by the celery application"""
+
+        async with self.db_session.begin():
+            outgoing_email: OutgoingEmail = OutgoingEmail(
+                recipients=",".join(recipients),
+                subject=subject,
+                template_name=template_name,
+                context=context,
+            )
+            self.db_session.add(outgoing_email)
+            await self.db_session.flush()
+
+            return outgoing_email
+
+    async def register_email_delivery(self, email_id: UUID) -> None:
+        """Marks the outgoing email as sent"""
+
+        async with self.db_session.begin():
+            await self.db_session.execute(
+                update(OutgoingEmail)
+                .where(OutgoingEmail.email_id == email_id)
+                .values(
+                    status="sent",
+                    attempts=OutgoingEmail.attempts + 1,
+                    sent_at=datetime.utcnow(),
+                )
+            )
+
+    async def register_email_failure(self, email_id: UUID, error: str) -> None:
+        """Marks the outgoing email as failed saving the error"""
+
+        async with self.db_session.begin():
+            await self.db_session.execute(
+                update(OutgoingEmail)
+                .where(OutgoingEmail.email_id == email_id)
+                .values(status="failed", last_error=error[:500])
+            )
@@ -1,40 +1,29 @@
-import os
-from datetime import datetime
-from datetime import timedelta
+from email.mime.text import MIMEText
 from typing import List
 from typing import Optional
 
-from fastapi_mail import ConnectionConfig
-from fastapi_mail import FastMail
-from fastapi_mail import MessageSchema
-from jinja2 import Environment
-from jinja2 import FileSystemLoader
-from jinja2 import Template
-from jose import jwt
+from kombu.exceptions import OperationalError
 from pydantic import EmailStr
 
 from src.config import project_settings
+from src.smtp import async_smtp_pool
+from src.user.models import OutgoingEmail
 from src.user.models import User
+from src.user.services.dal import UserDAL
+from src.worker.celery import send_user_email
+from src.worker.services.email import render_user_email
 
 
 class EmailService:
-    """Service that enables to send emails asynchronously"""
-
-    def __init__(self):
-        """Initializes EmailService by creating
-        an email sending configuration"""
-
-        self.email_conf: ConnectionConfig = ConnectionConfig(
-            MAIL_USERNAME=project_settings.MAIL_USERNAME,
-            MAIL_PASSWORD=project_settings.MAIL_PASSWORD,
-            MAIL_FROM=project_settings.MAIL_FROM,
-            MAIL_PORT=project_settings.MAIL_PORT,
-            MAIL_SERVER=project_settings.MAIL_SERVER,
-            MAIL_STARTTLS=project_settings.MAIL_STARTTLS,
-            MAIL_SSL_TLS=project_settings.MAIL_SSL_TLS,
-            USE_CREDENTIALS=project_settings.USE_CREDENTIALS,
-            VALIDATE_CERTS=project_settings.VALIDATE_CERTS,
-        )
+    """Service that enables to send emails without waiting for
+    the smtp server. The emails are saved to database and sent
+    by the celery application, unless inline delivery is configured"""
+
+    def __init__(self, dal: UserDAL):
+        """Initializes EmailService by binding the DAL
+        service that saves outgoing emails"""
+
+        self.dal: UserDAL = dal
 
     async def send_email(
         self,
@@ -43,60 +32,67 @@ class EmailService:
         template_name: str,
         instance: Optional[User] = None,
     ) -> None:
-        """Sends email with email confirmation token"""
-
-        token: str = self._create_token_for_email_confirmation(
+        """Sends email with email confirmation token. By default the email
+        is only enqueued, so the delivery status is tracked by the record
+        in database. Inline delivery sends it through the smtp connection
+        pool of the application and raises the errors of the smtp server.
+        If the email can not be enqueued, it is marked as failed
+        and sent inline"""
+
+        context: dict = self._get_context_for_email_confirmation(
             email=email[0], instance=instance
         )
 
-        message: MessageSchema = MessageSchema(
-            subject=subject,
+        if project_settings.USER_EMAIL_DELIVERY == "inline":
+            await self._send_inline(
+                email=email,
+                subject=subject,
+                body=render_user_email(template_name, context),
+            )
+            return
+
+        outgoing_email: OutgoingEmail = await self.dal.create_outgoing_email(
             recipients=email,
-            body=self._get_template_for_email_confirmation(
-                token=token, template_name=template_name
-            ),
-            subtype="html",
+            subject=subject,
+            template_name=template_name,
+            context=context,
         )
 
-        fm: FastMail = FastMail(self.email_conf)
+        try:
+            send_user_email.delay(email_id=str(outgoing_email.email_id))
+        except OperationalError as err:
+            await self.dal.register_email_failure(
+                outgoing_email.email_id, error=f"Could not enqueue email: {err}"
+            )
+            await self._send_inline(
+                email=email,
+                subject=subject,
+                body=render_user_email(template_name, context),
+            )
+            await self.dal.register_email_delivery(outgoing_email.email_id)
+
+    @staticmethod
+    async def _send_inline(email: List[EmailStr], subject: str, body: str) -> None:
+        """Sends the email through the smtp connection pool of the application"""
+
+        message: MIMEText = MIMEText(body, "html")
+        message["From"] = project_settings.MAIL_FROM
+        message["To"] = ", ".join(email)
+        message["Subject"] = subject
 
-        await fm.send_message(message=message)
+        await async_smtp_pool.send_message(message)
 
     @staticmethod
-    def _create_token_for_email_confirmation(
+    def _get_context_for_email_confirmation(
         email: str, instance: Optional[User] = None
-    ) -> str:
-        """Creates email confirmation token using jwt module"""
-
-        current_time: datetime = datetime.utcnow()
-        expiration_time: datetime = current_time + timedelta(
-            seconds=project_settings.MAIL_CONFIRMATION_TOKEN_EXPIRE_SECONDS
-        )
+    ) -> dict:
+        """Forms the data the email confirmation token is created from
+        when the email is sent"""
 
-        token_data: dict = {
-            "email": email,
-            "exp": expiration_time,
-        }
+        context: dict = {"email": email}
 
         if instance is not None:
             if email != instance.email:
-                token_data.update({"current_user_id": str(instance.user_id)})
-
-        token: str = jwt.encode(
-            token_data,
-            project_settings.SECRET_KEY,
-            algorithm=project_settings.ALGORITHM,
-        )
+                context["current_user_id"] = str(instance.user_id)
 
-        return token
-
-    @staticmethod
-    def _get_template_for_email_confirmation(token: str, template_name: str) -> str:
-        """Gets and renders template for email confirmation"""
-
-        templates_folder: str = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "..", "templates")
-        )
-        env: Environment = Environment(loader=FileSystemLoader(templates_folder))
-        template: Template = env.get_template(template_name)
-        return template.render(frontend_url=project_settings.FRONTEND_URL, token=token)
+        return context
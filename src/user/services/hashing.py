@@ -1,20 +1,155 @@
+import asyncio
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Callable
+from typing import Optional
+
 from passlib.context import CryptContext
 
 from src.config import project_settings
 
 
+_process_pwd_context: Optional[CryptContext] = None
+
+
+def _create_pwd_context() -> CryptContext:
+    """Creates the password hashing context configured by project settings"""
+
+    return CryptContext(
+        schemes=[
+            project_settings.PWD_SCHEMA,
+        ],
+        deprecated=project_settings.PWD_DEPRECATED,
+    )
+
+
+def _get_process_pwd_context() -> CryptContext:
+    """Gets the hashing context of the current process. Worker processes
+    of the hashing pool create their own context on the first call"""
+
+    global _process_pwd_context
+
+    if _process_pwd_context is None:
+        _process_pwd_context = _create_pwd_context()
+    return _process_pwd_context
+
+
+def _verify(secret: str, hashed: str) -> bool:
+    """Function run by the hashing pool for password verification"""
+
+    return _get_process_pwd_context().verify(secret, hashed)
+
+
+def _hash(password: str) -> str:
+    """Function run by the hashing pool for password hashing"""
+
+    return _get_process_pwd_context().hash(password)
+
+
+class HashingExecutor:
+    """Bounded pool that runs CPU-bound password hashing outside
+    of the event loop. Calls exceeding the number of workers wait
+    in a queue, and the queue depth is tracked for monitoring"""
+
+    def __init__(self, executor_type: str, max_workers: int):
+        """Initializes HashingExecutor by binding the type of the pool
+        (thread or process) and the maximum number of concurrent hashing calls"""
+
+        if executor_type not in ("thread", "process"):
+            raise ValueError("Hashing executor type must be 'thread' or 'process'")
+
+        self.executor_type: str = executor_type
+        self.max_workers: int = max_workers
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.in_flight: int = 0
+        self.queued: int = 0
+        self.peak_queued: int = 0
+        self.completed: int = 0
+
+    def _get_executor(self) -> Executor:
+        """Gets the pool creating it on the first call"""
+
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="hashing"
+                )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Gets the semaphore limiting concurrency for the running event loop"""
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def run(self, func: Callable, *args: Any) -> Any:
+        """Runs the provided function in the pool without blocking the event loop"""
+
+        semaphore: asyncio.Semaphore = self._get_semaphore()
+
+        if semaphore.locked():
+            self.queued += 1
+            self.peak_queued = max(self.peak_queued, self.queued)
+            try:
+                await semaphore.acquire()
+            finally:
+                self.queued -= 1
+        else:
+            await semaphore.acquire()
+
+        self.in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), func, *args
+            )
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            semaphore.release()
+
+    def get_stats(self) -> dict:
+        """Returns the current state of the hashing pool"""
+
+        return {
+            "executor_type": self.executor_type,
+            "max_workers": self.max_workers,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "peak_queued": self.peak_queued,
+            "completed": self.completed,
+        }
+
+    def shutdown(self) -> None:
+        """Shuts the pool down waiting for the running calls to finish"""
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+hashing_executor: HashingExecutor = HashingExecutor(
+    executor_type=project_settings.PWD_HASHING_EXECUTOR,
+    max_workers=project_settings.PWD_HASHING_MAX_WORKERS,
+)
+
+
 class Hasher:
     """Class that enables to work with password hashing"""
 
     def __init__(self):
         """Configures the schema of password hashing"""
 
-        self.pwd_context: CryptContext = CryptContext(
-            schemes=[
-                project_settings.PWD_SCHEMA,
-            ],
-            deprecated=project_settings.PWD_DEPRECATED,
-        )
+        self.pwd_context: CryptContext = _create_pwd_context()
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Checks whether the provided password matches the hashed one"""
@@ -25,3 +160,17 @@ class Hasher:
         """Gets the hash of the provided password"""
 
         return self.pwd_context.hash(password)
+
+    @staticmethod
+    async def async_verify_password(plain_password: str, hashed_password: str) -> bool:
+        """Checks whether the provided password matches the hashed one
+        using the hashing pool, so the event loop is not blocked"""
+
+        return await hashing_executor.run(_verify, hashed_password, plain_password)
+
+    @staticmethod
+    async def async_get_password_hash(password: str) -> str:
+        """Gets the hash of the provided password using the hashing pool,
+        so the event loop is not blocked"""
+
+        return await hashing_executor.run(_hash, password)
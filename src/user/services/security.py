@@ -20,6 +20,25 @@ def create_jwt_token(email: str, exp_timedelta: timedelta) -> str:
     )
 
 
+def create_email_confirmation_token(
+    email: str, current_user_id: Optional[str] = None
+) -> str:
+    """Creates email confirmation token using jwt module. The id
+    of the current user is added when the email is being changed"""
+
+    token_data: dict = {
+        "email": email,
+        "exp": datetime.utcnow()
+        + timedelta(seconds=project_settings.MAIL_CONFIRMATION_TOKEN_EXPIRE_SECONDS),
+    }
+    if current_user_id is not None:
+        token_data["current_user_id"] = current_user_id
+
+    return jwt.encode(
+        token_data, project_settings.SECRET_KEY, algorithm=project_settings.ALGORITHM
+    )
+
+
 def get_email_from_jwt_token(token: str) -> Optional[str]:
     """Retrieves user's email from token payload"""
 
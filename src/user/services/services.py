@@ -22,7 +22,7 @@ class UserService(BaseService):
 
         super().__init__(db_session=db_session, dal_class=dal_class)
         self.hasher: Hasher = Hasher()
-        self.email: EmailService = EmailService()
+        self.email: EmailService = EmailService(dal=self.dal)
 
     async def create_user(self, username: str, email: str, password: str) -> None:
         """Creates new user or update the current one
@@ -37,7 +37,7 @@ class UserService(BaseService):
 
             await self.dal.update_username_and_password(
                 username=username,
-                password=self.hasher.get_password_hash(password),
+                password=await self.hasher.async_get_password_hash(password),
                 user=user,
             )
 
@@ -45,7 +45,7 @@ class UserService(BaseService):
             user: User = await self.dal.create_new_user(
                 username=username,
                 email=email,
-                hashed_password=self.hasher.get_password_hash(password),
+                hashed_password=await self.hasher.async_get_password_hash(password),
             )
 
         await self.email.send_email(
@@ -91,7 +91,7 @@ class UserService(BaseService):
         if not user.is_active:
             raise ValueError("User does not exist")
 
-        if not self.hasher.verify_password(user.hashed_password, password):
+        if not await self.hasher.async_verify_password(user.hashed_password, password):
             raise ValueError("Passwords do not match")
 
         access_token: str = security.create_jwt_token(
@@ -139,14 +139,21 @@ class UserService(BaseService):
         old_password: str,
         new_password: str,
     ) -> User:
-        """Changes user's password if the provided old password is correct"""
+        """Changes user's password if the provided old password is correct.
+        The password hash is read from database, since it is not cached
+        together with the current user"""
 
-        if not self.hasher.verify_password(user.hashed_password, old_password):
+        hashed_password: Optional[str] = await self.dal.get_hashed_password(
+            user_id=user.user_id
+        )
+        if hashed_password is None or not await self.hasher.async_verify_password(
+            hashed_password, old_password
+        ):
             raise ValueError("Incorrect old password")
 
         updated_user: Optional[User] = await self.dal.change_password(
             user=user,
-            new_password=self.hasher.get_password_hash(new_password),
+            new_password=await self.hasher.async_get_password_hash(new_password),
         )
 
         return updated_user
@@ -228,7 +235,7 @@ class UserService(BaseService):
 
         updated_user: User = await self.dal.change_password(
             user=user,
-            new_password=self.hasher.get_password_hash(new_password),
+            new_password=await self.hasher.async_get_password_hash(new_password),
         )
 
         return updated_user
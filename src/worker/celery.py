@@ -1,22 +1,79 @@
 import logging
 import os
+import smtplib
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from typing import List
 from typing import Optional
+from typing import Set
+from typing import Tuple
 from uuid import UUID
+from uuid import uuid4
 
 from celery import Celery
+from celery import current_task
+from celery.signals import task_postrun
+from celery.signals import task_prerun
+from celery.signals import worker_init
+from celery.signals import worker_process_init
+from celery.signals import worker_process_shutdown
+from redis.exceptions import LockError
+from redis.lock import Lock
+from sqlalchemy import Row
 
 from src.config import project_settings
-from src.event.models import Event
-from src.event.models import TaskRecord
+from src.database import sync_engine_manager
+from src.event.recurrence import get_next_occurrence
+from src.event.recurrence import to_local
+from src.event.recurrence import to_utc
+from src.smtp import smtp_pool
+from src.templates import template_registry
+from src.user.models import OutgoingEmail
 from src.worker.database import db_session_manager
 from src.worker.logging import CeleryLogger
+from src.worker.metrics import get_due_at
+from src.worker.metrics import late_notification
+from src.worker.metrics import LATE_NOTIFICATIONS
+from src.worker.metrics import mark_process_dead
+from src.worker.metrics import NOTIFICATION_LAG
+from src.worker.metrics import observe_task_runtime
+from src.worker.metrics import SMTP_CONNECT_TIME
+from src.worker.metrics import SMTP_SEND_TIME
+from src.worker.metrics import start_metrics_server
+from src.worker.metrics import start_task_timer
+from src.worker.services.buffer import notification_buffer
 from src.worker.services.dal import CeleryDAL
+from src.worker.services.email import render_user_email
 from src.worker.services.email import send_email
+from src.worker.services.email import send_emails
+from src.worker.services.email import send_html_email
 
 celery: Celery = Celery("worker")
 celery.conf.broker_url = project_settings.CELERY_BROKER_URL
 celery.conf.result_backend = project_settings.CELERY_RESULT_BACKEND_URL
 
+celery.conf.beat_schedule = {}
+
+if project_settings.NOTIFICATION_SCHEDULER_MODE == "database":
+    celery.conf.beat_schedule["dispatch-due-notifications"] = {
+        "task": "dispatch_due_notifications",
+        "schedule": project_settings.NOTIFICATION_SCHEDULER_INTERVAL_SECONDS,
+    }
+
+if project_settings.NOTIFICATION_DISPATCH_MODE == "batch":
+    celery.conf.beat_schedule["flush-notification-buffer"] = {
+        "task": "flush_notification_buffer",
+        "schedule": project_settings.NOTIFICATION_BATCH_FLUSH_INTERVAL_SECONDS,
+    }
+
+celery.conf.beat_schedule["purge-notification-deliveries"] = {
+    "task": "purge_notification_deliveries",
+    "schedule": project_settings.NOTIFICATION_LAG_PURGE_INTERVAL_SECONDS,
+}
+
+NOTIFICATION_EMAIL_SUBJECT: str = "Уведомление о событии (PetTracker)"
+
 
 log_dir: str = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 logger: CeleryLogger = CeleryLogger(
@@ -25,6 +82,60 @@ logger: CeleryLogger = CeleryLogger(
     log_file=os.path.join(log_dir, "worker.log"),
 )
 
+smtp_pool.on_connect = SMTP_CONNECT_TIME.observe
+smtp_pool.on_send = SMTP_SEND_TIME.observe
+
+
+@worker_init.connect
+def load_templates(**kwargs) -> None:
+    """Compiles email templates before the pool processes are forked,
+    so every process starts with the templates already in memory.
+    Starts the server exposing the worker metrics if its port is set"""
+
+    template_registry.load()
+
+    if project_settings.WORKER_METRICS_PORT:
+        start_metrics_server(port=project_settings.WORKER_METRICS_PORT)
+
+
+@worker_process_init.connect
+def create_database_engine(**kwargs) -> None:
+    """Creates the database engine of the worker process once,
+    so all the tasks of the process share its connection pool"""
+
+    sync_engine_manager.init(on_checkout=logger.log_pool_checkout)
+
+
+@worker_process_shutdown.connect
+def close_smtp_connections(**kwargs) -> None:
+    """Closes the pooled smtp and database connections of the worker process"""
+
+    smtp_pool.close()
+    sync_engine_manager.dispose()
+    mark_process_dead()
+
+
+@late_notification.connect
+def log_late_notification(event_id: str, lag: float, **kwargs) -> None:
+    """Writes a warning about the notification sent
+    later than the alert threshold"""
+
+    logger.log_late_notification(event_id=event_id, lag=lag)
+
+
+@task_prerun.connect
+def start_measuring_task(task_id: str, **kwargs) -> None:
+    """Remembers the moment the task started running"""
+
+    start_task_timer(task_id)
+
+
+@task_postrun.connect
+def finish_measuring_task(task_id: str, task, state: str = None, **kwargs) -> None:
+    """Observes the runtime of the finished task"""
+
+    observe_task_runtime(task_id=task_id, task_name=task.name, state=state)
+
 
 @celery.task(name="send_notification_email")
 @db_session_manager
@@ -38,30 +149,426 @@ def send_notification_email(
     """
     Celery task that sends notification email containing
     information about event. The task is executed at the time
-    specified in the scheduled_at parameter of the event
+    specified in the scheduled_at parameter of the event. In the batch
+    dispatch mode the notification is only put to the buffer
+    that is flushed by the flush_notification_buffer task
     """
 
+    notify_at: Optional[str] = _get_task_eta()
+
+    if project_settings.NOTIFICATION_DISPATCH_MODE == "batch":
+        notification_buffer.push(
+            {
+                "email": email,
+                "body": body,
+                "event_id": str(event_id),
+                "task_id": str(task_id),
+                "notify_at": notify_at,
+            }
+        )
+        return
+
     try:
-        task_record: Optional[TaskRecord] = celery_dal.get_task_record_by_id(task_id)
-        if task_record is None:
+        claim: Row = celery_dal.claim_task(task_id=task_id, event_id=event_id)
+        if not claim.is_task_claimed:
             logger.log_not_found_message(message=f"Task with id {task_id} not found")
             return
 
-        event: Optional[Event] = celery_dal.get_event_by_id(event_id)
-        if event is None:
+        if not claim.is_event_claimed:
             logger.log_not_found_message(message=f"Event with id {event_id} not found")
             return
 
-        celery_dal.update_event_when_performing_task(event)
+        if claim.is_recurring:
+            _schedule_next_occurrences(celery_dal, [UUID(str(event_id))])
 
-        send_email(
-            subject="Уведомление о событии (PetTracker)", data=body, to_email=email
+        send_email(subject=NOTIFICATION_EMAIL_SUBJECT, data=body, to_email=email)
+        _register_deliveries(
+            celery_dal, [{"event_id": str(event_id), "notify_at": notify_at}]
         )
 
     except Exception as err:
         logger.log_error(err)
         return
 
+
+@celery.task(name="dispatch_due_notifications")
+@db_session_manager
+def dispatch_due_notifications(celery_dal: CeleryDAL) -> int:
+    """
+    Periodic celery task that claims the events whose notification
+    is due in batches and sends a notification email task for each
+    of them. In the batch dispatch mode one task sending the whole
+    batch is sent instead. Returns the number of the dispatched notifications
+    """
+
+    batch_size: int = project_settings.NOTIFICATION_SCHEDULER_BATCH_SIZE
+    dispatched: int = 0
+
+    while True:
+        events: List[Row] = celery_dal.claim_due_events(
+            now=datetime.utcnow(), batch_size=batch_size
+        )
+        _schedule_next_occurrences(
+            celery_dal,
+            [event.event_id for event in events if event.recurrence_rule is not None],
+        )
+
+        if project_settings.NOTIFICATION_DISPATCH_MODE == "batch":
+            if events:
+                send_notification_batch.delay(
+                    notifications=[
+                        {
+                            "email": event.email,
+                            "body": _form_notification_body(event),
+                            "event_id": str(event.event_id),
+                            "notify_at": event.notify_at.isoformat(),
+                        }
+                        for event in events
+                    ]
+                )
+        else:
+            for event in events:
+                send_due_notification_email.delay(
+                    email=event.email,
+                    body=_form_notification_body(event),
+                    event_id=str(event.event_id),
+                    notify_at=event.notify_at.isoformat(),
+                )
+
+        dispatched += len(events)
+        if len(events) < batch_size:
+            return dispatched
+
+
+@celery.task(name="send_due_notification_email")
+@db_session_manager
+def send_due_notification_email(
+    celery_dal: CeleryDAL,
+    email: str,
+    body: dict,
+    event_id: Optional[str] = None,
+    notify_at: Optional[str] = None,
+) -> None:
+    """
+    Celery task that sends notification email about
+    the event claimed by the dispatch_due_notifications task
+    """
+
+    try:
+        send_email(subject=NOTIFICATION_EMAIL_SUBJECT, data=body, to_email=email)
+        _register_deliveries(
+            celery_dal, [{"event_id": event_id, "notify_at": notify_at}]
+        )
+
+    except Exception as err:
+        logger.log_error(err)
+
+
+@celery.task(name="flush_notification_buffer")
+@db_session_manager
+def flush_notification_buffer(celery_dal: CeleryDAL) -> int:
+    """
+    Periodic celery task of the batch dispatch mode. Takes the buffered
+    notifications in batches, sends the batch over one smtp session and
+    then completes their tasks with bulk queries. The notifications are
+    removed from the buffer only after they are sent, the ones left
+    by a crashed worker are restored and sent again. The notifications
+    whose events were changed or deleted are skipped. Returns the number
+    of the sent notifications
+    """
+
+    lock: Lock = notification_buffer.lock()
+    if not lock.acquire():
+        return 0
+
+    batch_size: int = project_settings.NOTIFICATION_BATCH_SIZE
+    sent: int = 0
+
+    try:
+        notification_buffer.restore()
+
+        while True:
+            notifications: List[dict] = notification_buffer.pop_batch(batch_size)
+
+            if notifications:
+                pending_task_ids: Set[UUID] = celery_dal.get_existing_task_ids(
+                    task_ids=[
+                        UUID(notification["task_id"]) for notification in notifications
+                    ]
+                )
+                # the same task may be buffered twice, e.g. when the broker
+                # redelivers its message, so it is sent only once
+                pending_notifications: List[dict] = list(
+                    {
+                        notification["task_id"]: notification
+                        for notification in notifications
+                        if UUID(notification["task_id"]) in pending_task_ids
+                    }.values()
+                )
+                sent += _send_notifications(celery_dal, pending_notifications)
+
+                completed_task_ids: Set[UUID] = celery_dal.complete_tasks(
+                    task_ids=list(pending_task_ids)
+                )
+                _schedule_next_occurrences(
+                    celery_dal,
+                    [
+                        UUID(notification["event_id"])
+                        for notification in pending_notifications
+                        if UUID(notification["task_id"]) in completed_task_ids
+                    ],
+                )
+                notification_buffer.ack(notifications)
+
+            if len(notifications) < batch_size:
+                return sent
+
     finally:
-        if task_record is not None:
-            celery_dal.delete_completed_task(task_record)
+        try:
+            lock.release()
+        except LockError:
+            pass
+
+
+@celery.task(name="purge_notification_deliveries")
+@db_session_manager
+def purge_notification_deliveries(celery_dal: CeleryDAL) -> int:
+    """
+    Periodic celery task that deletes the deliveries of the notifications
+    older than the longest period of the lag report, so the table
+    does not grow without bound. Returns the number of the deleted deliveries
+    """
+
+    return celery_dal.delete_notification_deliveries(
+        before=datetime.utcnow()
+        - timedelta(days=project_settings.NOTIFICATION_LAG_RETENTION_DAYS)
+    )
+
+
+@celery.task(name="send_notification_batch")
+@db_session_manager
+def send_notification_batch(celery_dal: CeleryDAL, notifications: List[dict]) -> int:
+    """
+    Celery task that sends the batch of notifications claimed by
+    the dispatch_due_notifications task over one smtp session
+    """
+
+    return _send_notifications(celery_dal, notifications)
+
+
+def _send_notifications(celery_dal: CeleryDAL, notifications: List[dict]) -> int:
+    """Sends the notifications logging the failed ones and registers
+    the delivery of the sent ones. Returns the number of the sent notifications"""
+
+    failures: List[Tuple[str, Exception]] = send_emails(
+        subject=NOTIFICATION_EMAIL_SUBJECT,
+        notifications=[
+            (notification["email"], notification["body"])
+            for notification in notifications
+        ],
+    )
+    for _, err in failures:
+        logger.log_error(err)
+
+    failed_emails: Set[str] = {to_email for to_email, _ in failures}
+    _register_deliveries(
+        celery_dal,
+        [
+            notification
+            for notification in notifications
+            if notification["email"] not in failed_emails
+        ],
+    )
+
+    return len(notifications) - len(failures)
+
+
+def _register_deliveries(celery_dal: CeleryDAL, notifications: List[dict]) -> None:
+    """Saves the time each sent notification was due at and the lag
+    of sending it, and observes the lag. The late_notification signal
+    is sent for the notifications exceeding the alert threshold.
+    The notifications without the due time are skipped"""
+
+    sent_at: datetime = datetime.utcnow()
+    deliveries: List[dict] = []
+
+    for notification in notifications:
+        due_at: Optional[datetime] = get_due_at(notification.get("notify_at"))
+        if due_at is None or notification.get("event_id") is None:
+            continue
+
+        lag: float = max((sent_at - due_at).total_seconds(), 0)
+        NOTIFICATION_LAG.observe(lag)
+        if lag > project_settings.NOTIFICATION_LAG_ALERT_SECONDS:
+            LATE_NOTIFICATIONS.inc()
+            late_notification.send(
+                sender=None, event_id=notification["event_id"], lag=lag
+            )
+
+        deliveries.append(
+            {
+                "event_id": UUID(notification["event_id"]),
+                "due_at": due_at,
+                "sent_at": sent_at,
+                "lag_ms": int(lag * 1000),
+            }
+        )
+
+    if deliveries:
+        celery_dal.create_notification_deliveries(deliveries)
+
+
+def _schedule_next_occurrences(celery_dal: CeleryDAL, event_ids: List[UUID]) -> None:
+    """Schedules the notification about the next occurrence of every
+    recurring event among the provided ones, whose pending occurrence
+    has just been claimed. The occurrences missed while the notification
+    was late are skipped. The events without more occurrences stay happened"""
+
+    if not event_ids:
+        return
+
+    now: datetime = datetime.utcnow()
+    occurrences: List[dict] = []
+    tasks: List[Tuple[UUID, Row, datetime]] = []
+
+    for event in celery_dal.get_recurring_events(event_ids):
+        occurrence: Optional[datetime] = get_next_occurrence(
+            recurrence_rule=event.recurrence_rule,
+            start=event.scheduled_at,
+            after=to_local(max(event.notify_at or now, now), event.timezone),
+        )
+        if occurrence is None:
+            continue
+
+        occurrences.append(
+            {
+                "event_id": event.event_id,
+                "notify_at": to_utc(occurrence, event.timezone),
+                "is_happened": False,
+            }
+        )
+        tasks.append((uuid4(), event, occurrence))
+
+    if not occurrences:
+        return
+
+    is_eta_mode: bool = project_settings.NOTIFICATION_SCHEDULER_MODE != "database"
+    celery_dal.schedule_occurrences(
+        occurrences,
+        task_records=[
+            {"task_id": task_id, "event_id": event.event_id}
+            for task_id, event, _ in tasks
+        ]
+        if is_eta_mode
+        else [],
+        owner_ids=[event.owner_id for _, event, _ in tasks],
+    )
+    if not is_eta_mode:
+        return
+
+    for (task_id, event, occurrence), scheduled in zip(tasks, occurrences):
+        send_notification_email.apply_async(
+            (
+                event.email,
+                _form_notification_body(event, occurrence=occurrence),
+                str(event.event_id),
+                str(task_id),
+            ),
+            eta=scheduled["notify_at"].replace(tzinfo=timezone.utc),
+        )
+
+
+def _get_task_eta() -> Optional[str]:
+    """Returns the time the current task was scheduled to run at"""
+
+    if current_task is None:
+        return None
+    return current_task.request.eta
+
+
+def _form_notification_body(event: Row, occurrence: Optional[datetime] = None) -> dict:
+    """Forms the data for notification email about the claimed event.
+    For a recurring event the date of its occurrence is used, which is
+    the pending one if the occurrence is not provided"""
+
+    if occurrence is None:
+        occurrence = event.scheduled_at
+        if event.recurrence_rule is not None:
+            occurrence = to_local(event.notify_at, event.timezone)
+
+    return {
+        "title": event.title,
+        "content": event.content,
+        "pet": event.pet_name,
+        "year": occurrence.year,
+        "month": occurrence.month,
+        "day": occurrence.day,
+        "hour": occurrence.hour,
+        "minute": occurrence.minute,
+    }
+
+
+@celery.task(
+    name="send_user_email",
+    autoretry_for=(OSError,),
+    max_retries=project_settings.USER_EMAIL_MAX_RETRIES,
+    retry_backoff=project_settings.USER_EMAIL_RETRY_BACKOFF_SECONDS,
+    retry_backoff_max=project_settings.USER_EMAIL_RETRY_BACKOFF_MAX_SECONDS,
+    retry_jitter=True,
+)
+@db_session_manager
+def send_user_email(celery_dal: CeleryDAL, email_id: UUID) -> None:
+    """
+    Celery task that sends the outgoing email saved by the application
+    (email confirmation, email change or password reset). Temporary
+    failures are retried with exponential backoff, and the result
+    of every attempt is saved to the record of the email. The email
+    is rendered on every attempt, so its confirmation token is fresh
+    """
+
+    outgoing_email: Optional[OutgoingEmail] = celery_dal.get_outgoing_email_by_id(
+        email_id
+    )
+    if outgoing_email is None:
+        logger.log_not_found_message(message=f"Email with id {email_id} not found")
+        return
+
+    if outgoing_email.status == "sent":
+        return
+
+    try:
+        send_html_email(
+            subject=outgoing_email.subject,
+            body=render_user_email(
+                outgoing_email.template_name, outgoing_email.context
+            ),
+            recipients=outgoing_email.recipients.split(","),
+        )
+
+    except OSError as err:
+        logger.log_error(err)
+
+        is_permanent: bool = _is_permanent_smtp_failure(err)
+        celery_dal.register_email_failure(
+            outgoing_email.email_id,
+            error=str(err),
+            is_final=is_permanent
+            or send_user_email.request.retries >= send_user_email.max_retries,
+        )
+        if not is_permanent:
+            raise
+        return
+
+    celery_dal.register_email_delivery(outgoing_email.email_id)
+
+
+def _is_permanent_smtp_failure(error: OSError) -> bool:
+    """Checks whether the smtp server rejected the email,
+    so sending it again makes no sense"""
+
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return True
+
+    return isinstance(error, smtplib.SMTPResponseException) and (
+        500 <= error.smtp_code < 600
+    )
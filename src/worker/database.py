@@ -3,7 +3,7 @@ from typing import Callable
 
 from sqlalchemy.orm import Session
 
-from src.database import database_settings
+from src.database import sync_engine_manager
 from src.worker.services.dal import CeleryDAL
 
 
@@ -14,7 +14,7 @@ def db_session_manager(func: Callable) -> Callable:
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        db_session: Session = database_settings.session()
+        db_session: Session = sync_engine_manager.session()
         celery_dal: CeleryDAL = CeleryDAL(db_session=db_session)
 
         try:
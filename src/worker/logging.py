@@ -1,5 +1,7 @@
 import logging
 
+from sqlalchemy.pool import Pool
+
 
 class CeleryLogger:
     """Class representing logger for the celery tasks"""
@@ -28,3 +30,20 @@ class CeleryLogger:
         an exception occurs in celery task"""
 
         self.logger.error(error_message)
+
+    def log_late_notification(self, event_id: str, lag: float) -> None:
+        """Writes a warning when the notification was sent
+        later than the alert threshold"""
+
+        self.logger.warning(
+            f"Notification about event with id {event_id} was sent {lag:.1f} s late"
+        )
+
+    def log_pool_checkout(self, duration: float, pool: Pool) -> None:
+        """Writes the time spent on getting a database connection
+        from the pool and the current state of the pool"""
+
+        self.logger.debug(
+            f"Database connection checked out in {duration * 1000:.3f} ms "
+            f"({pool.status()})"
+        )
@@ -0,0 +1,141 @@
+import glob
+import os
+import time
+from datetime import datetime
+from datetime import timezone
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+from typing import Union
+
+import redis
+from celery.utils.dispatch import Signal
+from prometheus_client import CollectorRegistry
+from prometheus_client import Counter
+from prometheus_client import Histogram
+from prometheus_client import multiprocess
+from prometheus_client import REGISTRY
+from prometheus_client import start_http_server
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+from src.config import project_settings
+from src.worker.services.buffer import notification_buffer
+
+
+TASK_RUNTIME: Histogram = Histogram(
+    "pettracker_worker_task_runtime_seconds",
+    "Time spent on running a celery task",
+    ["task", "state"],
+)
+SMTP_CONNECT_TIME: Histogram = Histogram(
+    "pettracker_smtp_connect_seconds",
+    "Time spent on opening and authenticating a new smtp connection",
+)
+SMTP_SEND_TIME: Histogram = Histogram(
+    "pettracker_smtp_send_seconds",
+    "Time spent on sending one email including getting a pooled connection",
+)
+NOTIFICATION_LAG: Histogram = Histogram(
+    "pettracker_notification_lag_seconds",
+    "Time between the moment the notification was due and the moment it was sent",
+    buckets=(0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600),
+)
+LATE_NOTIFICATIONS: Counter = Counter(
+    "pettracker_late_notifications",
+    "Number of notifications sent later than the alert threshold",
+)
+
+# sent for every notification whose lag exceeded the alert threshold
+# with the identifier of the event and the lag in seconds
+late_notification: Signal = Signal(
+    name="late_notification", providing_args={"event_id", "lag"}
+)
+
+_task_started_at: Dict[str, float] = {}
+
+
+class QueueLengthCollector(Collector):
+    """Collector reporting the number of messages waiting in the celery
+    queue and the number of buffered notifications at scrape time"""
+
+    def __init__(self, url: str, queue: str = "celery"):
+        """Initializes QueueLengthCollector by creating a Redis client
+        for the broker and binding the name of the watched queue"""
+
+        self.client: redis.Redis = redis.Redis.from_url(url)
+        self.queue: str = queue
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        queue_length: GaugeMetricFamily = GaugeMetricFamily(
+            "pettracker_worker_queue_length",
+            "Number of messages waiting in the queue",
+            labels=["queue"],
+        )
+        try:
+            queue_length.add_metric([self.queue], self.client.llen(self.queue))
+            queue_length.add_metric(
+                [notification_buffer.KEY],
+                notification_buffer.client.llen(notification_buffer.KEY),
+            )
+        except redis.RedisError:
+            return
+        yield queue_length
+
+
+def start_metrics_server(port: int) -> None:
+    """Starts the HTTP server exposing the worker metrics. If prometheus
+    multiprocess mode is enabled, the metrics of all the pool processes
+    are collected from the files left in its directory"""
+
+    multiprocess_dir: Optional[str] = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    registry: CollectorRegistry = REGISTRY
+
+    if multiprocess_dir:
+        os.makedirs(multiprocess_dir, exist_ok=True)
+        for file_name in glob.glob(os.path.join(multiprocess_dir, "*.db")):
+            os.remove(file_name)
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+
+    registry.register(QueueLengthCollector(url=project_settings.CELERY_BROKER_URL))
+    start_http_server(port, registry=registry)
+
+
+def mark_process_dead() -> None:
+    """Removes the metrics of the live gauges of the finished pool process"""
+
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def start_task_timer(task_id: str) -> None:
+    """Remembers the moment the task started running"""
+
+    _task_started_at[task_id] = time.perf_counter()
+
+
+def observe_task_runtime(task_id: str, task_name: str, state: Optional[str]) -> None:
+    """Observes the runtime of the finished task"""
+
+    started_at: Optional[float] = _task_started_at.pop(task_id, None)
+    if started_at is not None:
+        TASK_RUNTIME.labels(task=task_name, state=state or "UNKNOWN").observe(
+            time.perf_counter() - started_at
+        )
+
+
+def get_due_at(notify_at: Optional[Union[str, datetime]]) -> Optional[datetime]:
+    """Converts the time the notification was due at to naive UTC datetime
+    as the notify_at column of the events. Naive datetimes are UTC already"""
+
+    if notify_at is None:
+        return None
+
+    if isinstance(notify_at, str):
+        notify_at = datetime.fromisoformat(notify_at)
+    if notify_at.tzinfo is not None:
+        notify_at = notify_at.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return notify_at
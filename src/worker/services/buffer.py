@@ -0,0 +1,84 @@
+import json
+from typing import List
+from typing import Optional
+
+import redis
+from redis.lock import Lock
+
+from src.config import project_settings
+
+
+class NotificationBuffer:
+    """Redis list that keeps the notifications whose time has come
+    until they are sent in batches by the flush task. The taken
+    notifications are moved to the processing list and removed from it
+    only when they are sent, so the notifications taken by a crashed
+    worker are restored by the next flush"""
+
+    KEY: str = "notification-buffer"
+    PROCESSING_KEY: str = "notification-buffer:processing"
+    LOCK_KEY: str = "notification-buffer:lock"
+    # the lock is released when the worker holding it crashes
+    LOCK_TIMEOUT_SECONDS: int = 600
+
+    def __init__(self, url: str):
+        """Initializes NotificationBuffer by creating a Redis client.
+        The client connects on the first command"""
+
+        self.client: redis.Redis = redis.Redis.from_url(url)
+
+    def push(self, notification: dict) -> None:
+        """Adds the notification to the end of the buffer"""
+
+        self.client.rpush(self.KEY, json.dumps(notification))
+
+    def pop_batch(self, size: int) -> List[dict]:
+        """Moves up to the provided number of notifications from
+        the beginning of the buffer to the processing list atomically
+        and returns them"""
+
+        with self.client.pipeline(transaction=True) as pipeline:
+            for _ in range(size):
+                pipeline.lmove(self.KEY, self.PROCESSING_KEY, "LEFT", "RIGHT")
+            raw_notifications: List[Optional[bytes]] = pipeline.execute()
+
+        return [
+            json.loads(raw_notification)
+            for raw_notification in raw_notifications
+            if raw_notification is not None
+        ]
+
+    def ack(self, notifications: List[dict]) -> None:
+        """Removes the handled notifications from the processing list.
+        They are serialized the same way as when they were pushed"""
+
+        if not notifications:
+            return
+
+        with self.client.pipeline(transaction=False) as pipeline:
+            for notification in notifications:
+                pipeline.lrem(self.PROCESSING_KEY, 1, json.dumps(notification))
+            pipeline.execute()
+
+    def restore(self) -> int:
+        """Moves the notifications left in the processing list by
+        a crashed worker back to the beginning of the buffer.
+        Returns the number of the restored notifications"""
+
+        restored: int = 0
+        while self.client.lmove(self.PROCESSING_KEY, self.KEY, "RIGHT", "LEFT"):
+            restored += 1
+        return restored
+
+    def lock(self) -> Lock:
+        """Creates the lock allowing only one flush at a time, since
+        the flush restores everything found in the processing list"""
+
+        return self.client.lock(
+            self.LOCK_KEY, timeout=self.LOCK_TIMEOUT_SECONDS, blocking=False
+        )
+
+
+notification_buffer: NotificationBuffer = NotificationBuffer(
+    url=project_settings.NOTIFICATION_BUFFER_REDIS_URL
+)
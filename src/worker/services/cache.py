@@ -0,0 +1,76 @@
+from typing import Iterable
+from typing import List
+from typing import Optional
+from uuid import UUID
+
+import redis
+
+from src.cache import RedisResponseCache
+from src.config import project_settings
+
+
+class ResponseCacheInvalidator:
+    """Client removing the cached responses of the users whose events
+    are changed by the celery application from the shared response cache"""
+
+    def __init__(self, url: str, ttl: int):
+        """Initializes ResponseCacheInvalidator by creating a Redis client.
+        The client connects on the first command"""
+
+        self.ttl: int = ttl
+        self.client: redis.Redis = redis.Redis.from_url(url)
+
+    def invalidate(self, user_ids: Iterable[Optional[UUID]]) -> None:
+        """Removes all the cached responses of the provided users.
+        The errors of Redis are ignored, since the notification must
+        be sent anyway and the cached responses expire after their TTL"""
+
+        generation_keys: List[str] = [
+            RedisResponseCache.get_generation_key(user_id)
+            for user_id in set(user_ids)
+            if user_id is not None
+        ]
+        if not generation_keys:
+            return
+
+        try:
+            with self.client.pipeline(transaction=False) as pipeline:
+                for generation_key in generation_keys:
+                    pipeline.incr(generation_key)
+                    pipeline.expire(
+                        generation_key,
+                        self.ttl * RedisResponseCache.GENERATION_TTL_FACTOR,
+                    )
+                pipeline.execute()
+        except redis.RedisError:
+            pass
+
+
+def _create_response_cache_invalidator() -> Optional[ResponseCacheInvalidator]:
+    """Creates the invalidator if the shared response cache is enabled.
+    The responses cached in memory of the application processes
+    can not be reached by the celery application"""
+
+    if not (
+        project_settings.RESPONSE_CACHE_ENABLED
+        and project_settings.RESPONSE_CACHE_REDIS_ENABLED
+    ):
+        return None
+
+    return ResponseCacheInvalidator(
+        url=project_settings.RESPONSE_CACHE_REDIS_URL,
+        ttl=project_settings.RESPONSE_CACHE_TTL_SECONDS,
+    )
+
+
+response_cache_invalidator: Optional[
+    ResponseCacheInvalidator
+] = _create_response_cache_invalidator()
+
+
+def invalidate_cached_responses(user_ids: Iterable[Optional[UUID]]) -> None:
+    """Removes all the cached responses of the provided users
+    if the shared response cache is enabled"""
+
+    if response_cache_invalidator is not None:
+        response_cache_invalidator.invalidate(user_ids)
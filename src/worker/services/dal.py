@@ -1,43 +1,269 @@
+from datetime import datetime
+from typing import List
 from typing import Optional
+from typing import Set
 from uuid import UUID
 
+from sqlalchemy import CTE
+from sqlalchemy import delete
+from sqlalchemy import exists
+from sqlalchemy import insert
 from sqlalchemy import Result
+from sqlalchemy import Row
 from sqlalchemy import select
+from sqlalchemy import update
 
 from src.event.models import Event
+from src.event.models import NotificationDelivery
 from src.event.models import TaskRecord
+from src.pet.models import Pet
 from src.services import BaseDAL
+from src.user.models import OutgoingEmail
+from src.user.models import User
+from src.worker.services.cache import invalidate_cached_responses
 
 
 class CeleryDAL(BaseDAL):
     """Class representing DAL service that enables
     celery app to work with database"""
 
-    def get_task_record_by_id(self, task_id: UUID) -> Optional[TaskRecord]:
-        """Gets task record from database by its identifier"""
+    def claim_task(self, task_id: UUID, event_id: UUID) -> Row:
+        """Claims the task in one statement: deletes the task record and
+        marks the event as happened only if the record has been deleted.
+        Only one of the concurrent claims of the same task succeeds,
+        so a redelivered task never sends the notification twice.
+        Also returns whether the claimed event is recurring and
+        the owner of its pet, whose cached responses are invalidated"""
+
+        deleted_task: CTE = (
+            delete(TaskRecord)
+            .where(TaskRecord.task_id == task_id)
+            .returning(TaskRecord.event_id)
+            .cte("deleted_task")
+        )
+        updated_event: CTE = (
+            update(Event)
+            .where(Event.event_id == event_id, exists(select(deleted_task.c.event_id)))
+            .values(is_happened=True)
+            .returning(Event.event_id, Event.pet_id, Event.recurrence_rule)
+            .cte("updated_event")
+        )
+
+        with self.db_session.begin():
+            result: Result = self.db_session.execute(
+                select(
+                    exists(select(deleted_task.c.event_id)).label("is_task_claimed"),
+                    exists(select(updated_event.c.event_id)).label("is_event_claimed"),
+                    exists(
+                        select(updated_event.c.event_id).where(
+                            updated_event.c.recurrence_rule.is_not(None)
+                        )
+                    ).label("is_recurring"),
+                    select(Pet.owner_id)
+                    .where(Pet.pet_id == updated_event.c.pet_id)
+                    .scalar_subquery()
+                    .label("owner_id"),
+                )
+            )
+            claim: Row = result.one()
+
+        if claim.is_event_claimed:
+            invalidate_cached_responses([claim.owner_id])
+        return claim
+
+    def claim_due_events(self, now: datetime, batch_size: int) -> List[Row]:
+        """Claims a batch of the pending events whose notification is due
+        and marks them as happened. The rows locked by the concurrent
+        claims are skipped, so every event is claimed only once.
+        The cached responses of the owners of the events are invalidated"""
+
+        with self.db_session.begin():
+            result: Result = self.db_session.execute(
+                select(
+                    Event.event_id,
+                    Event.title,
+                    Event.content,
+                    Event.scheduled_at,
+                    Event.notify_at,
+                    Event.recurrence_rule,
+                    Event.timezone,
+                    Pet.name.label("pet_name"),
+                    Pet.owner_id,
+                    User.email,
+                )
+                .join(Event.pet)
+                .join(Pet.owner)
+                .filter(Event.is_happened == False, Event.notify_at <= now)
+                .order_by(Event.notify_at)
+                .limit(batch_size)
+                .with_for_update(of=Event, skip_locked=True)
+            )
+            events: List[Row] = list(result.all())
+
+            if events:
+                event_ids: List[UUID] = [event.event_id for event in events]
+                self.db_session.execute(
+                    update(Event)
+                    .where(Event.event_id.in_(event_ids))
+                    .values(is_happened=True)
+                )
+                self.db_session.execute(
+                    delete(TaskRecord).where(TaskRecord.event_id.in_(event_ids))
+                )
+
+        invalidate_cached_responses(event.owner_id for event in events)
+        return events
+
+    def get_existing_task_ids(self, task_ids: List[UUID]) -> Set[UUID]:
+        """Gets the identifiers of the provided tasks whose records
+        still exist, i.e. whose events were not changed or deleted"""
 
         with self.db_session.begin():
             result: Result = self.db_session.execute(
-                select(TaskRecord).filter_by(task_id=task_id)
+                select(TaskRecord.task_id).filter(TaskRecord.task_id.in_(task_ids))
             )
-            return result.scalars().first()
+            return set(result.scalars().all())
 
-    def get_event_by_id(self, event_id: UUID) -> Optional[Event]:
-        """Gets event from database by its identifier"""
+    def complete_tasks(self, task_ids: List[UUID]) -> Set[UUID]:
+        """Marks the events of the provided tasks as happened and deletes
+        the task records. Returns the identifiers of the tasks that were
+        completed, the tasks whose records no longer exist are skipped.
+        The records locked by a concurrent change of the event are waited
+        for rather than skipped. The cached responses of the owners
+        of the events are invalidated"""
 
         with self.db_session.begin():
-            result = self.db_session.execute(select(Event).filter_by(event_id=event_id))
-            return result.scalars().first()
+            result: Result = self.db_session.execute(
+                select(TaskRecord.task_id, TaskRecord.event_id, Pet.owner_id)
+                .join(Event, Event.event_id == TaskRecord.event_id)
+                .join(Event.pet)
+                .filter(TaskRecord.task_id.in_(task_ids))
+                .with_for_update(of=TaskRecord)
+            )
+            task_records: List[Row] = list(result.all())
+
+            if task_records:
+                self.db_session.execute(
+                    update(Event)
+                    .where(
+                        Event.event_id.in_(
+                            [task_record.event_id for task_record in task_records]
+                        )
+                    )
+                    .values(is_happened=True)
+                )
+                self.db_session.execute(
+                    delete(TaskRecord).where(
+                        TaskRecord.task_id.in_(
+                            [task_record.task_id for task_record in task_records]
+                        )
+                    )
+                )
 
-    def update_event_when_performing_task(self, event: Event) -> None:
-        """Sets the parameter is_happened of the event to True
-        after the task is completed"""
+        invalidate_cached_responses(
+            task_record.owner_id for task_record in task_records
+        )
+        return {task_record.task_id for task_record in task_records}
+
+    def get_recurring_events(self, event_ids: List[UUID]) -> List[Row]:
+        """Gets the data required for scheduling the next occurrence
+        of the recurring events among the provided ones"""
 
         with self.db_session.begin():
-            setattr(event, "is_happened", True)
+            result: Result = self.db_session.execute(
+                select(
+                    Event.event_id,
+                    Event.title,
+                    Event.content,
+                    Event.scheduled_at,
+                    Event.notify_at,
+                    Event.recurrence_rule,
+                    Event.timezone,
+                    Pet.name.label("pet_name"),
+                    Pet.owner_id,
+                    User.email,
+                )
+                .join(Event.pet)
+                .join(Pet.owner)
+                .filter(
+                    Event.event_id.in_(event_ids), Event.recurrence_rule.is_not(None)
+                )
+            )
+            return list(result.all())
 
-    def delete_completed_task(self, task_record: TaskRecord):
-        """Deletes completed task from database after it is completed"""
+    def schedule_occurrences(
+        self, occurrences: List[dict], task_records: List[dict], owner_ids: List[UUID]
+    ) -> None:
+        """Saves the UTC time the notification about the next occurrence
+        of every provided event is due at, makes these events pending
+        again and creates the records about their celery tasks.
+        The cached responses of the provided owners are invalidated"""
 
         with self.db_session.begin():
-            self.db_session.delete(task_record)
+            self.db_session.execute(update(Event), occurrences)
+            if task_records:
+                self.db_session.execute(insert(TaskRecord), task_records)
+
+        invalidate_cached_responses(owner_ids)
+
+    def create_notification_deliveries(self, deliveries: List[dict]) -> None:
+        """Saves the due and the actual send time of the sent notifications"""
+
+        with self.db_session.begin():
+            self.db_session.execute(insert(NotificationDelivery), deliveries)
+
+    def delete_notification_deliveries(self, before: datetime) -> int:
+        """Deletes the deliveries of the notifications that were due
+        before the provided time. Returns the number of the deleted ones"""
+
+        with self.db_session.begin():
+            result: Result = self.db_session.execute(
+                delete(NotificationDelivery).where(NotificationDelivery.due_at < before)
+            )
+            return result.rowcount
+
+    def get_outgoing_email_by_id(self, email_id: UUID) -> Optional[OutgoingEmail]:
+        """Gets outgoing email from database by its identifier. The email
+        is detached from the session, so its data stays available
+        after the transaction is committed"""
+
+        with self.db_session.begin():
+            result: Result = self.db_session.execute(
+                select(OutgoingEmail).filter_by(email_id=email_id)
+            )
+            outgoing_email: Optional[OutgoingEmail] = result.scalars().first()
+            if outgoing_email is not None:
+                self.db_session.expunge(outgoing_email)
+
+            return outgoing_email
+
+    def register_email_delivery(self, email_id: UUID) -> None:
+        """Marks the outgoing email as sent"""
+
+        with self.db_session.begin():
+            self.db_session.execute(
+                update(OutgoingEmail)
+                .where(OutgoingEmail.email_id == email_id)
+                .values(
+                    status="sent",
+                    attempts=OutgoingEmail.attempts + 1,
+                    sent_at=datetime.utcnow(),
+                )
+            )
+
+    def register_email_failure(
+        self, email_id: UUID, error: str, is_final: bool
+    ) -> None:
+        """Saves the error of the failed delivery attempt. The email
+        is marked as failed if it is not going to be retried"""
+
+        with self.db_session.begin():
+            self.db_session.execute(
+                update(OutgoingEmail)
+                .where(OutgoingEmail.email_id == email_id)
+                .values(
+                    status="failed" if is_final else "retrying",
+                    attempts=OutgoingEmail.attempts + 1,
+                    last_error=error[:500],
+                )
+            )
@@ -1,34 +1,63 @@
-import os
 import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-
-from jinja2 import Environment
-from jinja2 import FileSystemLoader
-from jinja2 import Template
+from typing import List
+from typing import Tuple
 
 from src.config import project_settings
+from src.smtp import smtp_pool
+from src.templates import template_registry
+from src.user.services.security import create_email_confirmation_token
 
 
 def send_email(subject: str, data: dict, to_email: str) -> None:
-    """Sends notification email"""
+    """Sends notification email using a connection
+    from the smtp connection pool of the worker process"""
 
-    server: smtplib.SMTP = _connect_to_smtp_server()
     message: MIMEMultipart = _form_email_message(to_email, subject, data)
+    smtp_pool.send_message(message)
+
+
+def send_emails(
+    subject: str, notifications: List[Tuple[str, dict]]
+) -> List[Tuple[str, Exception]]:
+    """Sends notification emails one after another. The pool hands
+    the same connection back for every message, so the whole batch
+    is sent over one smtp session. Returns the emails that were not sent
+    together with the errors"""
+
+    failures: List[Tuple[str, Exception]] = []
+
+    for to_email, data in notifications:
+        try:
+            smtp_pool.send_message(_form_email_message(to_email, subject, data))
+        except (smtplib.SMTPException, OSError) as err:
+            failures.append((to_email, err))
 
-    server.sendmail(project_settings.MAIL_FROM, to_email, message.as_string())
-    server.quit()
+    return failures
 
 
-def _connect_to_smtp_server() -> smtplib.SMTP:
-    """Connects to a smtp server using data from project settings"""
+def send_html_email(subject: str, body: str, recipients: List[str]) -> None:
+    """Sends the email with already rendered html body"""
 
-    server: smtplib.SMTP = smtplib.SMTP(
-        project_settings.MAIL_SERVER, project_settings.MAIL_PORT
+    message: MIMEText = MIMEText(body, "html")
+    message["From"] = project_settings.MAIL_FROM
+    message["To"] = ", ".join(recipients)
+    message["Subject"] = subject
+
+    smtp_pool.send_message(message)
+
+
+def render_user_email(template_name: str, context: dict) -> str:
+    """Renders the email to the user with the confirmation token created
+    from the provided context. The token is created when the email is sent,
+    so it is valid in every retried email and is never stored"""
+
+    return template_registry.render(
+        template_name,
+        frontend_url=project_settings.FRONTEND_URL,
+        token=create_email_confirmation_token(**context),
     )
-    server.starttls()
-    server.login(project_settings.MAIL_FROM, project_settings.MAIL_PASSWORD)
-    return server
 
 
 def _form_email_message(to_email: str, subject: str, data: dict) -> MIMEMultipart:
@@ -44,18 +73,6 @@ def _form_email_message(to_email: str, subject: str, data: dict) -> MIMEMultipar
 
 
 def _get_template_for_event(data: dict) -> str:
-    """Creates an html template for notification email"""
-
-    templates_folder: str = os.path.abspath(
-        os.path.join(
-            os.path.dirname(__file__),
-            "..",
-            "..",
-            "event",
-            "templates",
-        )
-    )
+    """Renders an html template for notification email"""
 
-    env: Environment = Environment(loader=FileSystemLoader(templates_folder))
-    template: Template = env.get_template("event_notification.html")
-    return template.render(**data)
+    return template_registry.render("event_notification.html", **data)
@@ -1,3 +1,4 @@
+import json
 import os
 from datetime import datetime
 from datetime import timedelta
@@ -6,6 +7,7 @@ from typing import Callable
 from typing import Generator
 from typing import Optional
 from typing import Tuple
+from unittest.mock import patch
 
 import pytest
 from celery import Celery
@@ -26,11 +28,13 @@ from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import sessionmaker
 
+from src.cache import response_cache
 from src.config import project_settings
 from src.dependencies import get_db_session
 from src.main import app
 from src.pet.models import PetGenderEnum
 from src.user.models import User
+from src.user.services.cache import user_cache
 from src.user.services.security import create_jwt_token
 
 load_dotenv()
@@ -45,7 +49,14 @@ TEST_SYNC_DATABASE_URL: str = (
     f"{os.getenv('TEST_DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('TEST_DB_NAME')}"
 )
 
-TABLES: list[str] = ["user", "pet", "event", "task_record"]
+TABLES: list[str] = [
+    "user",
+    "pet",
+    "event",
+    "task_record",
+    "outgoing_email",
+    "notification_delivery",
+]
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -84,8 +95,10 @@ async def get_async_session(
 
 @pytest.fixture(scope="function", autouse=True)
 async def clean_tables(get_async_session: AsyncSession) -> None:
-    """Fixture that cleans tables before each test function"""
+    """Fixture that cleans tables and the caches before each test function"""
 
+    await user_cache.clear()
+    await response_cache.clear()
     async with get_async_session.begin():
         for table_for_cleaning in TABLES:
             await get_async_session.execute(
@@ -196,6 +209,15 @@ def create_user_in_database(pg_pool: pool.SimpleConnectionPool) -> Callable:
     return create_user_in_database
 
 
+@pytest.fixture
+def service_headers() -> Generator[dict, Any, None]:
+    """Fixture that enables the service endpoints and returns
+    the headers authorizing the requests to them"""
+
+    with patch.object(project_settings, "SERVICE_TOKEN", "some_service_token"):
+        yield {"X-Service-Token": "some_service_token"}
+
+
 def create_test_auth_headers_for_user(email: str) -> dict:
     access_token: str = create_jwt_token(
         email=email,
@@ -324,8 +346,12 @@ def _get_event_data_dict(event: Optional[tuple]) -> dict:
         event_data["title"] = event[1]
         event_data["content"] = event[2]
         event_data["scheduled_at"] = event[3]
+        event_data["updated_at"] = event[5]
         event_data["pet_id"] = event[6]
         event_data["is_happened"] = event[7]
+        event_data["notify_at"] = event[8]
+        event_data["recurrence_rule"] = event[9]
+        event_data["timezone"] = event[10]
 
     return event_data
 
@@ -341,16 +367,29 @@ def create_event_in_database(pg_pool: pool.SimpleConnectionPool) -> Callable:
         scheduled_at: datetime,
         pet_id: str,
         is_happened: bool,
+        notify_at: Optional[datetime] = None,
+        recurrence_rule: Optional[str] = None,
+        timezone: Optional[str] = None,
     ) -> None:
         connection = pg_pool.getconn()
         with connection.cursor() as cursor:
             try:
                 cursor.execute(
                     """
-                    INSERT INTO event (event_id, title, content, scheduled_at, pet_id, is_happened)
-                    VALUES (%s, %s, %s, %s, %s, %s);
+                    INSERT INTO event (event_id, title, content, scheduled_at, pet_id, is_happened, notify_at, recurrence_rule, timezone)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s);
                     """,
-                    (event_id, title, content, scheduled_at, pet_id, is_happened),
+                    (
+                        event_id,
+                        title,
+                        content,
+                        scheduled_at,
+                        pet_id,
+                        is_happened,
+                        notify_at,
+                        recurrence_rule,
+                        timezone,
+                    ),
                 )
                 connection.commit()
             finally:
@@ -405,6 +444,149 @@ def create_task_in_database(pg_pool: pool.SimpleConnectionPool) -> Callable:
     return create_task_in_database
 
 
+@pytest.fixture
+def create_outgoing_email_in_database(pg_pool: pool.SimpleConnectionPool) -> Callable:
+    """Fixture that returns function for creating an outgoing email
+    in the database"""
+
+    def create_outgoing_email_in_database(
+        email_id: str,
+        recipients: str,
+        subject: str,
+        template_name: str,
+        context: dict,
+        status: str = "pending",
+    ) -> None:
+        connection = pg_pool.getconn()
+        with connection.cursor() as cursor:
+            try:
+                cursor.execute(
+                    """
+                    INSERT INTO outgoing_email (email_id, recipients, subject, template_name, context, status, attempts)
+                    VALUES (%s, %s, %s, %s, %s, %s, 0);
+                    """,
+                    (
+                        email_id,
+                        recipients,
+                        subject,
+                        template_name,
+                        json.dumps(context),
+                        status,
+                    ),
+                )
+                connection.commit()
+            finally:
+                pg_pool.putconn(connection)
+
+    return create_outgoing_email_in_database
+
+
+@pytest.fixture
+def get_outgoing_email_from_database(pg_pool: pool.SimpleConnectionPool) -> Callable:
+    """Fixture that returns function for getting the outgoing emails
+    from the database by their recipients"""
+
+    def get_outgoing_email_from_database_by_recipients(recipients: str) -> dict:
+        connection = pg_pool.getconn()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT email_id, subject, template_name, context, status, attempts, last_error, sent_at
+                    FROM outgoing_email WHERE recipients = %s
+                    """,
+                    (recipients,),
+                )
+                outgoing_email: Optional[Tuple] = cursor.fetchone()
+        finally:
+            pg_pool.putconn(connection)
+
+        if outgoing_email is None:
+            return dict()
+
+        return dict(
+            zip(
+                (
+                    "email_id",
+                    "subject",
+                    "template_name",
+                    "context",
+                    "status",
+                    "attempts",
+                    "last_error",
+                    "sent_at",
+                ),
+                outgoing_email,
+            )
+        )
+
+    return get_outgoing_email_from_database_by_recipients
+
+
+@pytest.fixture
+def create_notification_delivery_in_database(
+    pg_pool: pool.SimpleConnectionPool,
+) -> Callable:
+    """Fixture that returns function for creating a record about
+    the delivery of a notification in the database"""
+
+    def create_notification_delivery_in_database(
+        event_id: str, due_at: datetime, lag_ms: int
+    ) -> None:
+        connection = pg_pool.getconn()
+        with connection.cursor() as cursor:
+            try:
+                cursor.execute(
+                    """
+                    INSERT INTO notification_delivery (delivery_id, event_id, due_at, sent_at, lag_ms)
+                    VALUES (gen_random_uuid(), %s, %s, %s, %s);
+                    """,
+                    (
+                        event_id,
+                        due_at,
+                        due_at + timedelta(milliseconds=lag_ms),
+                        lag_ms,
+                    ),
+                )
+                connection.commit()
+            finally:
+                pg_pool.putconn(connection)
+
+    return create_notification_delivery_in_database
+
+
+@pytest.fixture
+def get_notification_deliveries_from_database(
+    pg_pool: pool.SimpleConnectionPool,
+) -> Callable:
+    """Fixture that returns function for getting the records about
+    the delivery of the notifications about the event from the database"""
+
+    def get_notification_deliveries_from_database_by_event_id(
+        event_id: str,
+    ) -> list[dict]:
+        connection = pg_pool.getconn()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT due_at, sent_at, lag_ms
+                    FROM notification_delivery WHERE event_id = %s
+                    """,
+                    (event_id,),
+                )
+                deliveries: list[Tuple] = cursor.fetchall()
+        finally:
+            pg_pool.putconn(connection)
+
+        return [
+            dict(zip(("due_at", "sent_at", "lag_ms"), delivery))
+            for delivery in deliveries
+        ]
+
+    return get_notification_deliveries_from_database_by_event_id
+
+
 @pytest.fixture(scope="session")
 def celery_config() -> dict:
     """Fixture that returns the configuration for the test celery application"""
@@ -147,6 +147,70 @@ async def test_create_event_successfully_task_sent(
         )
 
 
+async def test_create_event_successfully_database_scheduler(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    async_client: AsyncClient,
+    get_task_from_database: Callable,
+    get_event_from_database: Callable,
+):
+    with patch.object(EventService, "_create_task") as mock_create_task, patch(
+        "src.event.services.services.project_settings.NOTIFICATION_SCHEDULER_MODE",
+        "database",
+    ):
+        user_data: dict = {
+            "user_id": str(uuid4()),
+            "username": "some_username",
+            "email": "some_email@email.ru",
+            "hashed_password": Hasher().get_password_hash("1234"),
+            "is_active": True,
+        }
+        create_user_in_database(**user_data)
+
+        pet_data: dict = {
+            "pet_id": str(uuid4()),
+            "name": "Some name",
+            "species": "Cat",
+            "breed": "Some breed",
+            "weight": 15,
+            "owner_id": user_data["user_id"],
+            "gender": "male",
+        }
+        create_pet_in_database(**pet_data)
+
+        event_data: dict = {
+            "title": "Some title",
+            "year": datetime.now().year + 1,
+            "month": 10,
+            "day": 10,
+            "hour": 10,
+            "minute": 10,
+            "timezone": "Europe/Moscow",
+            "pet_id": pet_data["pet_id"],
+        }
+
+        response: Response = await async_client.post(
+            "/api/v1/event/",
+            json=event_data,
+            headers=create_test_auth_headers_for_user(user_data["email"]),
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        event_data_from_database: dict = get_event_from_database(event_data["title"])
+        assert event_data_from_database["notify_at"] == datetime(
+            year=event_data["year"],
+            month=event_data["month"],
+            day=event_data["day"],
+            hour=event_data["hour"] - 3,
+            minute=event_data["minute"],
+        )
+        task: Tuple = get_task_from_database(event_data_from_database["event_id"])
+        assert task is not None
+
+        mock_create_task.assert_not_called()
+
+
 async def test_create_event_no_auth(async_client: AsyncClient):
     response: Response = await async_client.post("/api/v1/event/", json={})
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,211 @@
+from datetime import datetime
+from typing import Callable
+from typing import List
+from typing import Tuple
+from unittest.mock import MagicMock
+from unittest.mock import patch
+from uuid import uuid4
+
+from fastapi import status
+from httpx import AsyncClient
+from httpx import Response
+
+from src.event.services.services import EventService
+from src.user.services.hashing import Hasher
+from src.worker.celery import send_notification_email
+from tests.conftest import create_test_auth_headers_for_user
+
+
+def _create_user_with_pet(
+    create_user_in_database: Callable, create_pet_in_database: Callable
+) -> Tuple[dict, dict]:
+    user_data: dict = {
+        "user_id": str(uuid4()),
+        "username": uuid4().hex,
+        "email": f"{uuid4().hex}@email.ru",
+        "hashed_password": Hasher().get_password_hash("1234"),
+        "is_active": True,
+    }
+    create_user_in_database(**user_data)
+
+    pet_data: dict = {
+        "pet_id": str(uuid4()),
+        "name": "Some name",
+        "species": "Cat",
+        "breed": "Some breed",
+        "weight": 15,
+        "owner_id": user_data["user_id"],
+        "gender": "male",
+    }
+    create_pet_in_database(**pet_data)
+
+    return user_data, pet_data
+
+
+def _get_event_data(title: str, pet_id: str) -> dict:
+    return {
+        "title": title,
+        "content": "Some content",
+        "year": datetime.now().year + 1,
+        "month": 10,
+        "day": 10,
+        "hour": 10,
+        "minute": 10,
+        "timezone": "Europe/Moscow",
+        "pet_id": pet_id,
+    }
+
+
+async def test_create_events_in_bulk_successfully(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    async_client: AsyncClient,
+    get_event_from_database: Callable,
+    get_task_from_database: Callable,
+):
+    with patch.object(EventService, "_create_tasks") as mock_create_tasks:
+        user_data, pet_data = _create_user_with_pet(
+            create_user_in_database, create_pet_in_database
+        )
+        _, foreign_pet_data = _create_user_with_pet(
+            create_user_in_database, create_pet_in_database
+        )
+
+        events_data: List[dict] = [
+            _get_event_data("First title", pet_data["pet_id"]),
+            _get_event_data("Foreign title", foreign_pet_data["pet_id"]),
+            _get_event_data("Second title", pet_data["pet_id"]),
+        ]
+
+        response: Response = await async_client.post(
+            "/api/v1/event/bulk",
+            json={"events": events_data},
+            headers=create_test_auth_headers_for_user(user_data["email"]),
+        )
+        response_data: List[dict] = response.json()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [result["index"] for result in response_data] == [0, 1, 2]
+        assert [result["is_created"] for result in response_data] == [
+            True,
+            False,
+            True,
+        ]
+        assert response_data[1]["event"] is None
+        assert response_data[1]["detail"] is not None
+        assert response_data[0]["event"]["title"] == "First title"
+        assert response_data[2]["event"]["title"] == "Second title"
+
+        for result in (response_data[0], response_data[2]):
+            created_event: dict = get_event_from_database(result["event"]["title"])
+            assert str(created_event["event_id"]) == result["event"]["event_id"]
+            assert created_event["notify_at"] == datetime(
+                year=events_data[0]["year"], month=10, day=10, hour=7, minute=10
+            )
+            assert get_task_from_database(created_event["event_id"]) is not None
+
+        assert get_event_from_database("Foreign title") == {}
+
+        mock_create_tasks.assert_called_once()
+        tasks: List[dict] = mock_create_tasks.call_args.args[0]
+        assert [task["event"].title for task in tasks] == [
+            "First title",
+            "Second title",
+        ]
+        assert tasks[0]["user"].email == user_data["email"]
+        assert str(tasks[0]["pet"].pet_id) == pet_data["pet_id"]
+
+
+async def test_create_events_in_bulk_without_future_occurrences(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    async_client: AsyncClient,
+    get_event_from_database: Callable,
+):
+    with patch.object(EventService, "_create_tasks") as mock_create_tasks:
+        user_data, pet_data = _create_user_with_pet(
+            create_user_in_database, create_pet_in_database
+        )
+        event_data: dict = _get_event_data("Finished title", pet_data["pet_id"])
+        event_data["recurrence_rule"] = "FREQ=DAILY;UNTIL=20200101T000000"
+
+        response: Response = await async_client.post(
+            "/api/v1/event/bulk",
+            json={"events": [event_data]},
+            headers=create_test_auth_headers_for_user(user_data["email"]),
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [result["is_created"] for result in response.json()] == [True]
+        assert get_event_from_database("Finished title")["notify_at"] is None
+        mock_create_tasks.assert_not_called()
+
+
+async def test_create_events_in_bulk_no_owned_pets(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    async_client: AsyncClient,
+):
+    with patch.object(EventService, "_create_tasks") as mock_create_tasks:
+        user_data, _ = _create_user_with_pet(
+            create_user_in_database, create_pet_in_database
+        )
+
+        response: Response = await async_client.post(
+            "/api/v1/event/bulk",
+            json={"events": [_get_event_data("Some title", str(uuid4()))]},
+            headers=create_test_auth_headers_for_user(user_data["email"]),
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()[0]["is_created"] is False
+        mock_create_tasks.assert_not_called()
+
+
+async def test_create_events_in_bulk_empty_list(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    async_client: AsyncClient,
+):
+    user_data, _ = _create_user_with_pet(
+        create_user_in_database, create_pet_in_database
+    )
+
+    response: Response = await async_client.post(
+        "/api/v1/event/bulk",
+        json={"events": []},
+        headers=create_test_auth_headers_for_user(user_data["email"]),
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_create_tasks_uses_one_producer():
+    producer: MagicMock = MagicMock()
+
+    with patch.object(
+        send_notification_email.app, "producer_or_acquire"
+    ) as mock_producer_or_acquire, patch.object(
+        send_notification_email, "apply_async"
+    ) as mock_apply_async:
+        mock_producer_or_acquire.return_value.__enter__.return_value = producer
+
+        EventService._create_tasks(
+            [
+                {
+                    "scheduled_at": datetime(2030, 10, 10, 10, 10),
+                    "event": MagicMock(scheduled_at=datetime(2030, 10, 10, 10, 10)),
+                    "user": MagicMock(),
+                    "pet": MagicMock(),
+                    "task_id": uuid4(),
+                    "timezone": "Europe/Moscow",
+                }
+                for _ in range(3)
+            ]
+        )
+
+    mock_producer_or_acquire.assert_called_once()
+    assert mock_apply_async.call_count == 3
+    assert all(
+        call.kwargs["producer"] is producer for call in mock_apply_async.call_args_list
+    )
@@ -283,3 +283,223 @@ async def test_get_list_of_events_another_users_event(
     assert event_from_response["day"] == event_data["scheduled_at"].day
     assert event_from_response["hour"] == event_data["scheduled_at"].hour
     assert event_from_response["minute"] == event_data["scheduled_at"].minute
+
+
+async def test_get_list_of_events_pagination(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    async_client: AsyncClient,
+):
+    user_data: dict = {
+        "user_id": str(uuid4()),
+        "username": "some_username",
+        "email": "some_email@email.ru",
+        "hashed_password": Hasher().get_password_hash("1234"),
+        "is_active": True,
+    }
+    create_user_in_database(**user_data)
+
+    pet_data: dict = {
+        "pet_id": str(uuid4()),
+        "name": "Some name",
+        "species": "Cat",
+        "breed": "Some breed",
+        "weight": 15,
+        "owner_id": user_data["user_id"],
+        "gender": "male",
+    }
+    create_pet_in_database(**pet_data)
+
+    event_ids: list = []
+    for minutes in (5, 10, 15):
+        event_data: dict = {
+            "event_id": str(uuid4()),
+            "title": "some title",
+            "content": "some content",
+            "scheduled_at": datetime.now() + timedelta(minutes=minutes),
+            "pet_id": pet_data["pet_id"],
+            "is_happened": False,
+        }
+        create_event_in_database(**event_data)
+        event_ids.insert(0, event_data["event_id"])
+
+    headers: dict = create_test_auth_headers_for_user(user_data["email"])
+    first_response: Response = await async_client.get(
+        "/api/v1/event/list-of-events?limit=2", headers=headers
+    )
+
+    assert first_response.status_code == status.HTTP_200_OK
+    assert [e["event_id"] for e in first_response.json()] == event_ids[:2]
+    next_cursor: str = first_response.headers["X-Next-Cursor"]
+
+    second_response: Response = await async_client.get(
+        "/api/v1/event/list-of-events",
+        params={"limit": 2, "cursor": next_cursor},
+        headers=headers,
+    )
+
+    assert second_response.status_code == status.HTTP_200_OK
+    assert [e["event_id"] for e in second_response.json()] == event_ids[2:]
+    assert "X-Next-Cursor" not in second_response.headers
+
+
+async def test_get_list_of_events_filters(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    async_client: AsyncClient,
+):
+    user_data: dict = {
+        "user_id": str(uuid4()),
+        "username": "some_username",
+        "email": "some_email@email.ru",
+        "hashed_password": Hasher().get_password_hash("1234"),
+        "is_active": True,
+    }
+    create_user_in_database(**user_data)
+
+    pet_ids: list = [str(uuid4()), str(uuid4())]
+    for pet_id in pet_ids:
+        create_pet_in_database(
+            pet_id=pet_id,
+            name="Some name",
+            species="Cat",
+            breed="Some breed",
+            weight=15,
+            owner_id=user_data["user_id"],
+            gender="male",
+        )
+
+    happened_event_data: dict = {
+        "event_id": str(uuid4()),
+        "title": "some title",
+        "content": "some content",
+        "scheduled_at": datetime.now() - timedelta(days=1),
+        "pet_id": pet_ids[0],
+        "is_happened": True,
+    }
+    create_event_in_database(**happened_event_data)
+
+    upcoming_event_data: dict = {
+        "event_id": str(uuid4()),
+        "title": "some title",
+        "content": "some content",
+        "scheduled_at": datetime.now() + timedelta(days=1),
+        "pet_id": pet_ids[1],
+        "is_happened": False,
+    }
+    create_event_in_database(**upcoming_event_data)
+
+    headers: dict = create_test_auth_headers_for_user(user_data["email"])
+
+    response: Response = await async_client.get(
+        "/api/v1/event/list-of-events",
+        params={"is_happened": True},
+        headers=headers,
+    )
+    assert [e["event_id"] for e in response.json()] == [happened_event_data["event_id"]]
+
+    response = await async_client.get(
+        "/api/v1/event/list-of-events",
+        params={"pet_id": pet_ids[1]},
+        headers=headers,
+    )
+    assert [e["event_id"] for e in response.json()] == [upcoming_event_data["event_id"]]
+
+    response = await async_client.get(
+        "/api/v1/event/list-of-events",
+        params={"scheduled_from": datetime.now().isoformat()},
+        headers=headers,
+    )
+    assert [e["event_id"] for e in response.json()] == [upcoming_event_data["event_id"]]
+
+    response = await async_client.get(
+        "/api/v1/event/list-of-events",
+        params={"scheduled_to": datetime.now().isoformat()},
+        headers=headers,
+    )
+    assert [e["event_id"] for e in response.json()] == [happened_event_data["event_id"]]
+
+
+async def test_get_list_of_events_filters_by_date_with_timezone(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    async_client: AsyncClient,
+):
+    user_data: dict = {
+        "user_id": str(uuid4()),
+        "username": "some_username",
+        "email": "some_email@email.ru",
+        "hashed_password": Hasher().get_password_hash("1234"),
+        "is_active": True,
+    }
+    create_user_in_database(**user_data)
+
+    pet_id: str = str(uuid4())
+    create_pet_in_database(
+        pet_id=pet_id,
+        name="Some name",
+        species="Cat",
+        breed="Some breed",
+        weight=15,
+        owner_id=user_data["user_id"],
+        gender="male",
+    )
+
+    event_ids: dict = {}
+    for timezone in ("Europe/Moscow", "Asia/Tokyo"):
+        event_ids[timezone] = str(uuid4())
+        create_event_in_database(
+            event_id=event_ids[timezone],
+            title="some title",
+            content="some content",
+            scheduled_at=datetime(2030, 1, 1, 12),
+            pet_id=pet_id,
+            is_happened=False,
+            timezone=timezone,
+        )
+
+    headers: dict = create_test_auth_headers_for_user(user_data["email"])
+
+    response: Response = await async_client.get(
+        "/api/v1/event/list-of-events",
+        params={"scheduled_from": "2030-01-01T06:00:00+00:00"},
+        headers=headers,
+    )
+    assert [e["event_id"] for e in response.json()] == [event_ids["Europe/Moscow"]]
+
+    response = await async_client.get(
+        "/api/v1/event/list-of-events",
+        params={"scheduled_to": "2030-01-01T12:00:00+03:00"},
+        headers=headers,
+    )
+    assert [e["event_id"] for e in response.json()] == [event_ids["Asia/Tokyo"]]
+
+    response = await async_client.get(
+        "/api/v1/event/list-of-events",
+        params={"scheduled_from": "2030-01-01T12:00:00"},
+        headers=headers,
+    )
+    assert len(response.json()) == 2
+
+
+async def test_get_list_of_events_incorrect_cursor(
+    create_user_in_database: Callable, async_client: AsyncClient
+):
+    user_data: dict = {
+        "user_id": str(uuid4()),
+        "username": "some_username",
+        "email": "some_email@email.ru",
+        "hashed_password": Hasher().get_password_hash("1234"),
+        "is_active": True,
+    }
+    create_user_in_database(**user_data)
+
+    response: Response = await async_client.get(
+        "/api/v1/event/list-of-events?cursor=incorrect_cursor",
+        headers=create_test_auth_headers_for_user(user_data["email"]),
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert response.json() == {"detail": "Incorrect cursor"}
@@ -0,0 +1,306 @@
+from datetime import datetime
+from typing import Callable
+from typing import List
+from unittest.mock import patch
+from uuid import uuid4
+
+from fastapi import status
+from httpx import AsyncClient
+from httpx import Response
+
+from src.event.recurrence import _get_rule
+from src.event.recurrence import get_next_occurrence
+from src.event.services.services import EventService
+from src.user.services.hashing import Hasher
+from tests.conftest import create_test_auth_headers_for_user
+
+
+def _create_user_with_pet(
+    create_user_in_database: Callable, create_pet_in_database: Callable
+) -> dict:
+    user_data: dict = {
+        "user_id": str(uuid4()),
+        "username": "some_username",
+        "email": "some_email@email.ru",
+        "hashed_password": Hasher().get_password_hash("1234"),
+        "is_active": True,
+    }
+    create_user_in_database(**user_data)
+
+    pet_data: dict = {
+        "pet_id": str(uuid4()),
+        "name": "Some name",
+        "species": "Cat",
+        "breed": "Some breed",
+        "weight": 15,
+        "owner_id": user_data["user_id"],
+        "gender": "male",
+    }
+    create_pet_in_database(**pet_data)
+
+    return {"email": user_data["email"], "pet_id": pet_data["pet_id"]}
+
+
+def _get_event_data(pet_id: str, recurrence_rule: str) -> dict:
+    return {
+        "title": "Give medicine",
+        "content": "Some content",
+        "year": datetime.now().year + 1,
+        "month": 1,
+        "day": 1,
+        "hour": 8,
+        "minute": 0,
+        "timezone": "Europe/Moscow",
+        "pet_id": pet_id,
+        "recurrence_rule": recurrence_rule,
+    }
+
+
+async def test_create_recurring_event(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    async_client: AsyncClient,
+    get_event_from_database: Callable,
+):
+    with patch.object(EventService, "_create_task") as mock_create_task:
+        owner: dict = _create_user_with_pet(
+            create_user_in_database, create_pet_in_database
+        )
+        event_data: dict = _get_event_data(owner["pet_id"], "freq=daily;count=30")
+
+        response: Response = await async_client.post(
+            "/api/v1/event/",
+            json=event_data,
+            headers=create_test_auth_headers_for_user(owner["email"]),
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["recurrence_rule"] == "FREQ=DAILY;COUNT=30"
+
+        created_event: dict = get_event_from_database(event_data["title"])
+        assert created_event["recurrence_rule"] == "FREQ=DAILY;COUNT=30"
+        assert created_event["timezone"] == "Europe/Moscow"
+        assert created_event["notify_at"] == datetime(event_data["year"], 1, 1, 5)
+
+        mock_create_task.assert_called_once()
+        assert mock_create_task.call_args.kwargs["scheduled_at"] == datetime(
+            event_data["year"], 1, 1, 8
+        )
+
+
+async def test_create_recurring_event_first_occurrence_matches_rule(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    async_client: AsyncClient,
+    get_event_from_database: Callable,
+):
+    with patch.object(EventService, "_create_task") as mock_create_task:
+        owner: dict = _create_user_with_pet(
+            create_user_in_database, create_pet_in_database
+        )
+        event_data: dict = _get_event_data(
+            owner["pet_id"], "FREQ=MONTHLY;BYMONTHDAY=15"
+        )
+
+        response: Response = await async_client.post(
+            "/api/v1/event/",
+            json=event_data,
+            headers=create_test_auth_headers_for_user(owner["email"]),
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert mock_create_task.call_args.kwargs["scheduled_at"] == datetime(
+            event_data["year"], 1, 15, 8
+        )
+
+
+async def test_create_recurring_event_invalid_rule(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    async_client: AsyncClient,
+):
+    owner: dict = _create_user_with_pet(create_user_in_database, create_pet_in_database)
+
+    for recurrence_rule in (
+        "FREQ=SOMETIMES",
+        "FREQ=MINUTELY;COUNT=10",
+        "FREQ=HOURLY;BYMINUTE=0,30",
+        "FREQ=DAILY;BYHOUR=8;BYSECOND=0,1",
+        "FREQ=DAILY;UNTIL=20300101Z",
+        "DTSTART:20300101T080000\nRRULE:FREQ=DAILY",
+    ):
+        response: Response = await async_client.post(
+            "/api/v1/event/",
+            json=_get_event_data(owner["pet_id"], recurrence_rule),
+            headers=create_test_auth_headers_for_user(owner["email"]),
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_create_recurring_event_with_utc_until(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    async_client: AsyncClient,
+    get_event_from_database: Callable,
+):
+    with patch.object(EventService, "_create_task"):
+        owner: dict = _create_user_with_pet(
+            create_user_in_database, create_pet_in_database
+        )
+        year: int = datetime.now().year + 1
+        event_data: dict = _get_event_data(
+            owner["pet_id"], f"FREQ=DAILY;UNTIL={year}0110T050000Z"
+        )
+
+        response: Response = await async_client.post(
+            "/api/v1/event/",
+            json=event_data,
+            headers=create_test_auth_headers_for_user(owner["email"]),
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert (
+            response.json()["recurrence_rule"] == f"FREQ=DAILY;UNTIL={year}0110T080000"
+        )
+        assert get_event_from_database(event_data["title"])["recurrence_rule"] == (
+            f"FREQ=DAILY;UNTIL={year}0110T080000"
+        )
+
+
+async def test_get_occurrences(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    async_client: AsyncClient,
+):
+    owner: dict = _create_user_with_pet(create_user_in_database, create_pet_in_database)
+
+    recurring_event_id: str = str(uuid4())
+    create_event_in_database(
+        event_id=recurring_event_id,
+        title="Give medicine",
+        content=None,
+        scheduled_at=datetime(2030, 1, 1, 8),
+        pet_id=owner["pet_id"],
+        is_happened=False,
+        notify_at=datetime(2030, 1, 2, 5),
+        recurrence_rule="FREQ=DAILY;COUNT=30",
+        timezone="Europe/Moscow",
+    )
+    create_event_in_database(
+        event_id=str(uuid4()),
+        title="Visit vet",
+        content=None,
+        scheduled_at=datetime(2030, 1, 2, 12),
+        pet_id=owner["pet_id"],
+        is_happened=False,
+    )
+    create_event_in_database(
+        event_id=str(uuid4()),
+        title="Outside of window",
+        content=None,
+        scheduled_at=datetime(2030, 2, 1, 12),
+        pet_id=owner["pet_id"],
+        is_happened=False,
+    )
+
+    response: Response = await async_client.get(
+        "/api/v1/event/occurrences",
+        params={
+            "scheduled_from": "2030-01-01T00:00:00",
+            "scheduled_to": "2030-01-04T00:00:00",
+        },
+        headers=create_test_auth_headers_for_user(owner["email"]),
+    )
+    response_data: List[dict] = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [
+        (event["title"], event["day"], event["hour"], event["is_happened"])
+        for event in response_data
+    ] == [
+        ("Give medicine", 1, 8, True),
+        ("Give medicine", 2, 8, False),
+        ("Visit vet", 2, 12, False),
+        ("Give medicine", 3, 8, False),
+    ]
+    assert response_data[0]["event_id"] == recurring_event_id
+    assert response_data[0]["recurrence_rule"] == "FREQ=DAILY;COUNT=30"
+
+    response = await async_client.get(
+        "/api/v1/event/occurrences",
+        params={
+            "scheduled_from": "2030-01-01T00:00:00",
+            "scheduled_to": "2030-12-31T00:00:00",
+            "limit": 5,
+        },
+        headers=create_test_auth_headers_for_user(owner["email"]),
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 5
+
+
+async def test_get_occurrences_window_with_timezone(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    async_client: AsyncClient,
+):
+    owner: dict = _create_user_with_pet(create_user_in_database, create_pet_in_database)
+    create_event_in_database(
+        event_id=str(uuid4()),
+        title="Give medicine",
+        content=None,
+        scheduled_at=datetime(2030, 1, 1, 8),
+        pet_id=owner["pet_id"],
+        is_happened=False,
+        recurrence_rule="FREQ=DAILY;COUNT=30",
+        timezone="Europe/Moscow",
+    )
+
+    for scheduled_from, scheduled_to, days in (
+        ("2030-01-02T06:00:00+00:00", "2030-01-04T06:00:00+00:00", [3, 4]),
+        ("2030-01-02T06:00:00", "2030-01-04T06:00:00", [2, 3]),
+    ):
+        response: Response = await async_client.get(
+            "/api/v1/event/occurrences",
+            params={"scheduled_from": scheduled_from, "scheduled_to": scheduled_to},
+            headers=create_test_auth_headers_for_user(owner["email"]),
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [event["day"] for event in response.json()] == days
+
+
+async def test_get_occurrences_incorrect_window(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    async_client: AsyncClient,
+):
+    owner: dict = _create_user_with_pet(create_user_in_database, create_pet_in_database)
+
+    for scheduled_from, scheduled_to in (
+        ("2030-01-04T00:00:00", "2030-01-01T00:00:00"),
+        ("2030-01-01T00:00:00", "2032-01-01T00:00:00"),
+        ("2030-01-01T00:00:00", "2030-01-04T00:00:00+03:00"),
+    ):
+        response: Response = await async_client.get(
+            "/api/v1/event/occurrences",
+            params={"scheduled_from": scheduled_from, "scheduled_to": scheduled_to},
+            headers=create_test_auth_headers_for_user(owner["email"]),
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_cached_rule_does_not_keep_occurrences():
+    start: datetime = datetime(2000, 1, 1, 10, 0)
+
+    next_occurrence: datetime = get_next_occurrence(
+        "FREQ=HOURLY", start, datetime(2001, 1, 1)
+    )
+
+    assert next_occurrence == datetime(2001, 1, 1, 1, 0)
+    assert _get_rule("FREQ=HOURLY", start)._cache is None
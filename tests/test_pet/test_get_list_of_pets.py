@@ -1,4 +1,6 @@
 from typing import Callable
+from typing import List
+from typing import Tuple
 from uuid import uuid4
 
 from fastapi import status
@@ -190,3 +192,163 @@ async def test_get_list_of_pets_inactive_user(
     )
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
     assert response.json() == {"detail": "Could not validate credentials"}
+
+
+def _create_pets(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    pets: List[Tuple[str, str]],
+) -> Tuple[dict, List[dict]]:
+    user_data: dict = {
+        "user_id": str(uuid4()),
+        "username": "some_username",
+        "email": "some_email@email.ru",
+        "hashed_password": Hasher().get_password_hash("1234"),
+        "is_active": True,
+    }
+    create_user_in_database(**user_data)
+
+    pets_data: List[dict] = []
+    for name, species in pets:
+        pet_data: dict = {
+            "pet_id": str(uuid4()),
+            "name": name,
+            "species": species,
+            "breed": "Some breed",
+            "weight": 15,
+            "owner_id": user_data["user_id"],
+            "gender": "male",
+        }
+        create_pet_in_database(**pet_data)
+        pets_data.append(pet_data)
+
+    return user_data, pets_data
+
+
+async def test_get_list_of_pets_pagination(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    async_client: AsyncClient,
+):
+    user_data, pets_data = _create_pets(
+        create_user_in_database,
+        create_pet_in_database,
+        [(f"Pet {number}", "Cat") for number in range(5)],
+    )
+
+    received_pets: List[dict] = []
+    params: dict = {"limit": 2}
+    for _ in range(3):
+        response: Response = await async_client.get(
+            "/api/v1/pet/list-of-pets",
+            params=params,
+            headers=create_test_auth_headers_for_user(user_data["email"]),
+        )
+        assert response.status_code == status.HTTP_200_OK
+        received_pets.extend(response.json())
+        params["cursor"] = response.headers.get("X-Next-Cursor")
+
+    assert params["cursor"] is None
+    assert received_pets == [
+        {"pet_id": pet_data["pet_id"], "name": pet_data["name"]}
+        for pet_data in pets_data
+    ]
+
+
+async def test_get_list_of_pets_sorting_and_filtering(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    async_client: AsyncClient,
+):
+    user_data, _ = _create_pets(
+        create_user_in_database,
+        create_pet_in_database,
+        [("Murka", "Cat"), ("Barsik", "Cat"), ("Bobik", "Dog"), ("Basya", "Cat")],
+    )
+    headers: dict = create_test_auth_headers_for_user(user_data["email"])
+
+    response: Response = await async_client.get(
+        "/api/v1/pet/list-of-pets", params={"sort": "name"}, headers=headers
+    )
+    assert [pet["name"] for pet in response.json()] == [
+        "Barsik",
+        "Basya",
+        "Bobik",
+        "Murka",
+    ]
+
+    response = await async_client.get(
+        "/api/v1/pet/list-of-pets",
+        params={"sort": "name", "limit": 1, "species": "Cat", "name": "ba"},
+        headers=headers,
+    )
+    assert [pet["name"] for pet in response.json()] == ["Barsik"]
+
+    response = await async_client.get(
+        "/api/v1/pet/list-of-pets",
+        params={
+            "sort": "name",
+            "species": "Cat",
+            "name": "ba",
+            "cursor": response.headers["X-Next-Cursor"],
+        },
+        headers=headers,
+    )
+    assert [pet["name"] for pet in response.json()] == ["Basya"]
+    assert "X-Next-Cursor" not in response.headers
+
+
+async def test_get_list_of_pets_not_modified(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    async_client: AsyncClient,
+):
+    user_data, _ = _create_pets(
+        create_user_in_database, create_pet_in_database, [("Murka", "Cat")]
+    )
+    headers: dict = create_test_auth_headers_for_user(user_data["email"])
+
+    response: Response = await async_client.get(
+        "/api/v1/pet/list-of-pets", headers=headers
+    )
+    etag: str = response.headers["ETag"]
+
+    response = await async_client.get(
+        "/api/v1/pet/list-of-pets", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+    response = await async_client.get(
+        "/api/v1/pet/list-of-pets",
+        params={"sort": "name"},
+        headers={**headers, "If-None-Match": 'W/"other"'},
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+
+async def test_get_list_of_pets_incorrect_cursor(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    async_client: AsyncClient,
+):
+    user_data, _ = _create_pets(
+        create_user_in_database,
+        create_pet_in_database,
+        [("Murka", "Cat"), ("Barsik", "Cat")],
+    )
+    headers: dict = create_test_auth_headers_for_user(user_data["email"])
+
+    response: Response = await async_client.get(
+        "/api/v1/pet/list-of-pets", params={"limit": 1}, headers=headers
+    )
+
+    for params in (
+        {"cursor": "incorrect"},
+        {"cursor": response.headers["X-Next-Cursor"], "sort": "name"},
+    ):
+        response = await async_client.get(
+            "/api/v1/pet/list-of-pets", params=params, headers=headers
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
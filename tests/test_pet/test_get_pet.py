@@ -389,3 +389,72 @@ async def test_get_pet_inactive_user(
     )
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
     assert response.json() == {"detail": "Could not validate credentials"}
+
+
+async def test_get_pet_loads_window_of_events(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    async_client: AsyncClient,
+):
+    user_data: dict = {
+        "user_id": str(uuid4()),
+        "username": "some_username",
+        "email": "some_email@email.ru",
+        "hashed_password": Hasher().get_password_hash("1234"),
+        "is_active": True,
+    }
+    create_user_in_database(**user_data)
+
+    pet_data: dict = {
+        "pet_id": str(uuid4()),
+        "name": "Some name",
+        "species": "Cat",
+        "breed": "Some breed",
+        "weight": 15,
+        "owner_id": user_data["user_id"],
+        "gender": "male",
+    }
+    create_pet_in_database(**pet_data)
+
+    now: datetime = datetime.now().replace(second=0, microsecond=0)
+    for number in range(1, 6):
+        create_event_in_database(
+            event_id=str(uuid4()),
+            title=f"upcoming {number}",
+            content=None,
+            scheduled_at=now + timedelta(days=number),
+            pet_id=pet_data["pet_id"],
+            is_happened=False,
+        )
+        create_event_in_database(
+            event_id=str(uuid4()),
+            title=f"recent {number}",
+            content=None,
+            scheduled_at=now - timedelta(days=number),
+            pet_id=pet_data["pet_id"],
+            is_happened=True,
+        )
+
+    response: Response = await async_client.get(
+        "/api/v1/pet/",
+        params={"pet_id": pet_data["pet_id"], "upcoming_events": 2, "recent_events": 3},
+        headers=create_test_auth_headers_for_user(user_data["email"]),
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [event["title"] for event in response.json()["events"]] == [
+        "upcoming 2",
+        "upcoming 1",
+        "recent 1",
+        "recent 2",
+        "recent 3",
+    ]
+
+    response = await async_client.get(
+        "/api/v1/pet/",
+        params={"pet_id": pet_data["pet_id"]},
+        headers=create_test_auth_headers_for_user(user_data["email"]),
+    )
+
+    assert len(response.json()["events"]) == 10
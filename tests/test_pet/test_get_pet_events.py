@@ -0,0 +1,112 @@
+from datetime import datetime
+from datetime import timedelta
+from typing import Callable
+from typing import List
+from uuid import uuid4
+
+from fastapi import status
+from httpx import AsyncClient
+from httpx import Response
+
+from src.user.services.hashing import Hasher
+from tests.conftest import create_test_auth_headers_for_user
+
+
+def _create_user_with_pet(
+    create_user_in_database: Callable, create_pet_in_database: Callable
+) -> dict:
+    user_data: dict = {
+        "user_id": str(uuid4()),
+        "username": uuid4().hex,
+        "email": f"{uuid4().hex}@email.ru",
+        "hashed_password": Hasher().get_password_hash("1234"),
+        "is_active": True,
+    }
+    create_user_in_database(**user_data)
+
+    pet_data: dict = {
+        "pet_id": str(uuid4()),
+        "name": "Some name",
+        "species": "Cat",
+        "breed": "Some breed",
+        "weight": 15,
+        "owner_id": user_data["user_id"],
+        "gender": "male",
+    }
+    create_pet_in_database(**pet_data)
+
+    return {"email": user_data["email"], "pet_id": pet_data["pet_id"]}
+
+
+async def test_get_pet_events_pagination(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    async_client: AsyncClient,
+):
+    owner: dict = _create_user_with_pet(create_user_in_database, create_pet_in_database)
+    another_pet_owner: dict = _create_user_with_pet(
+        create_user_in_database, create_pet_in_database
+    )
+
+    now: datetime = datetime.now().replace(second=0, microsecond=0)
+    for number in range(5):
+        create_event_in_database(
+            event_id=str(uuid4()),
+            title=f"title {number}",
+            content=None,
+            scheduled_at=now + timedelta(days=number),
+            pet_id=owner["pet_id"],
+            is_happened=False,
+        )
+    create_event_in_database(
+        event_id=str(uuid4()),
+        title="another title",
+        content=None,
+        scheduled_at=now,
+        pet_id=another_pet_owner["pet_id"],
+        is_happened=False,
+    )
+
+    titles: List[str] = []
+    params: dict = {"pet_id": owner["pet_id"], "limit": 2}
+    for _ in range(3):
+        response: Response = await async_client.get(
+            "/api/v1/pet/events",
+            params=params,
+            headers=create_test_auth_headers_for_user(owner["email"]),
+        )
+        assert response.status_code == status.HTTP_200_OK
+        titles.extend(event["title"] for event in response.json())
+        params["cursor"] = response.headers.get("X-Next-Cursor")
+
+    assert params["cursor"] is None
+    assert titles == [f"title {number}" for number in range(4, -1, -1)]
+
+
+async def test_get_pet_events_of_another_user(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    async_client: AsyncClient,
+):
+    owner: dict = _create_user_with_pet(create_user_in_database, create_pet_in_database)
+    another_pet_owner: dict = _create_user_with_pet(
+        create_user_in_database, create_pet_in_database
+    )
+    create_event_in_database(
+        event_id=str(uuid4()),
+        title="another title",
+        content=None,
+        scheduled_at=datetime.now(),
+        pet_id=another_pet_owner["pet_id"],
+        is_happened=False,
+    )
+
+    response: Response = await async_client.get(
+        "/api/v1/pet/events",
+        params={"pet_id": another_pet_owner["pet_id"]},
+        headers=create_test_auth_headers_for_user(owner["email"]),
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
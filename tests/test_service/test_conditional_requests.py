@@ -0,0 +1,351 @@
+from datetime import datetime
+from datetime import timedelta
+from typing import Callable
+from unittest.mock import patch
+from uuid import uuid4
+
+from fastapi import status
+from httpx import AsyncClient
+from httpx import Response
+from psycopg2 import pool
+
+from src.conditional import get_etag
+from src.conditional import get_last_modified
+from src.conditional import is_not_modified
+from src.event.services.services import EventService
+from src.user.services.hashing import Hasher
+from tests.conftest import create_test_auth_headers_for_user
+
+
+def _create_user_with_pet(
+    create_user_in_database: Callable, create_pet_in_database: Callable
+) -> dict:
+    user_data: dict = {
+        "user_id": str(uuid4()),
+        "username": "some_username",
+        "email": "some_email@email.ru",
+        "hashed_password": Hasher().get_password_hash("1234"),
+        "is_active": True,
+    }
+    create_user_in_database(**user_data)
+
+    pet_data: dict = {
+        "pet_id": str(uuid4()),
+        "name": "Some name",
+        "species": "Cat",
+        "breed": "Some breed",
+        "weight": 15,
+        "owner_id": user_data["user_id"],
+        "gender": "male",
+    }
+    create_pet_in_database(**pet_data)
+
+    return {"email": user_data["email"], "pet_id": pet_data["pet_id"]}
+
+
+def _create_event(create_event_in_database: Callable, pet_id: str, title: str) -> str:
+    event_id: str = str(uuid4())
+    create_event_in_database(
+        event_id=event_id,
+        title=title,
+        content="Some content",
+        scheduled_at=datetime(datetime.now().year + 1, 10, 10, 10, 10),
+        pet_id=pet_id,
+        is_happened=False,
+    )
+    return event_id
+
+
+def _move_updated_at_back(
+    pg_pool: pool.SimpleConnectionPool, table: str, column: str, value: str
+) -> None:
+    """Makes the row look changed a few seconds ago, as Last-Modified
+    is not sent while the second of the last change is not over"""
+
+    connection = pg_pool.getconn()
+    with connection.cursor() as cursor:
+        try:
+            cursor.execute(
+                f"""
+                UPDATE "{table}" SET updated_at = updated_at - INTERVAL '5 seconds'
+                WHERE {column} = %s;
+                """,
+                (value,),
+            )
+            connection.commit()
+        finally:
+            pg_pool.putconn(connection)
+
+
+def _get_queries_count(response: Response) -> int:
+    server_timing: str = response.headers["Server-Timing"]
+    return int(server_timing.split('desc="')[1].split(" ")[0])
+
+
+async def test_get_event_not_modified(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    async_client: AsyncClient,
+    pg_pool: pool.SimpleConnectionPool,
+):
+    with patch.object(EventService, "_create_task"):
+        owner: dict = _create_user_with_pet(
+            create_user_in_database, create_pet_in_database
+        )
+        event_id: str = _create_event(
+            create_event_in_database, owner["pet_id"], "Some title"
+        )
+        _move_updated_at_back(pg_pool, "event", "event_id", event_id)
+        headers: dict = create_test_auth_headers_for_user(owner["email"])
+
+        response: Response = await async_client.get(
+            "/api/v1/event/", params={"event_id": event_id}, headers=headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+        etag: str = response.headers["ETag"]
+        last_modified: str = response.headers["Last-Modified"]
+
+        response = await async_client.get(
+            "/api/v1/event/",
+            params={"event_id": event_id},
+            headers={**headers, "If-None-Match": etag},
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+        assert _get_queries_count(response) == 1
+
+        response = await async_client.get(
+            "/api/v1/event/",
+            params={"event_id": event_id},
+            headers={**headers, "If-Modified-Since": last_modified},
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        await async_client.patch(
+            "/api/v1/event/",
+            params={"event_id": event_id},
+            json={"title": "New title", "timezone": "Europe/Moscow"},
+            headers=headers,
+        )
+
+        response = await async_client.get(
+            "/api/v1/event/",
+            params={"event_id": event_id},
+            headers={**headers, "If-None-Match": etag},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != etag
+        assert response.json()["title"] == "New title"
+
+
+async def test_get_event_not_found_with_etag(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    async_client: AsyncClient,
+):
+    owner: dict = _create_user_with_pet(create_user_in_database, create_pet_in_database)
+
+    response: Response = await async_client.get(
+        "/api/v1/event/",
+        params={"event_id": str(uuid4())},
+        headers={
+            **create_test_auth_headers_for_user(owner["email"]),
+            "If-None-Match": "*",
+        },
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_get_list_of_events_etag_changes_after_deletion(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    async_client: AsyncClient,
+):
+    owner: dict = _create_user_with_pet(create_user_in_database, create_pet_in_database)
+    _create_event(create_event_in_database, owner["pet_id"], "First title")
+    event_id: str = _create_event(
+        create_event_in_database, owner["pet_id"], "Second title"
+    )
+    headers: dict = create_test_auth_headers_for_user(owner["email"])
+
+    response: Response = await async_client.get(
+        "/api/v1/event/list-of-events", headers=headers
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert "Last-Modified" not in response.headers
+    etag: str = response.headers["ETag"]
+
+    response = await async_client.get(
+        "/api/v1/event/list-of-events", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert _get_queries_count(response) == 1
+
+    await async_client.delete(
+        "/api/v1/event/", params={"event_id": event_id}, headers=headers
+    )
+
+    response = await async_client.get(
+        "/api/v1/event/list-of-events", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [event["title"] for event in response.json()] == ["First title"]
+
+
+async def test_get_pet_not_modified_until_events_change(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    async_client: AsyncClient,
+):
+    owner: dict = _create_user_with_pet(create_user_in_database, create_pet_in_database)
+    headers: dict = create_test_auth_headers_for_user(owner["email"])
+
+    response: Response = await async_client.get(
+        "/api/v1/pet/", params={"pet_id": owner["pet_id"]}, headers=headers
+    )
+    etag: str = response.headers["ETag"]
+
+    response = await async_client.get(
+        "/api/v1/pet/",
+        params={"pet_id": owner["pet_id"]},
+        headers={**headers, "If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert _get_queries_count(response) == 1
+
+    response = await async_client.get(
+        "/api/v1/pet/",
+        params={"pet_id": owner["pet_id"], "upcoming_events": 1},
+        headers={**headers, "If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    _create_event(create_event_in_database, owner["pet_id"], "Some title")
+
+    response = await async_client.get(
+        "/api/v1/pet/",
+        params={"pet_id": owner["pet_id"]},
+        headers={**headers, "If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [event["title"] for event in response.json()["events"]] == ["Some title"]
+
+
+async def test_get_pet_events_not_modified(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    async_client: AsyncClient,
+):
+    owner: dict = _create_user_with_pet(create_user_in_database, create_pet_in_database)
+    _create_event(create_event_in_database, owner["pet_id"], "Some title")
+    headers: dict = create_test_auth_headers_for_user(owner["email"])
+
+    response: Response = await async_client.get(
+        "/api/v1/pet/events", params={"pet_id": owner["pet_id"]}, headers=headers
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    response = await async_client.get(
+        "/api/v1/pet/events",
+        params={"pet_id": owner["pet_id"]},
+        headers={**headers, "If-None-Match": response.headers["ETag"]},
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+async def test_get_user_not_modified(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    async_client: AsyncClient,
+    pg_pool: pool.SimpleConnectionPool,
+):
+    owner: dict = _create_user_with_pet(create_user_in_database, create_pet_in_database)
+    _move_updated_at_back(pg_pool, "user", "email", owner["email"])
+    headers: dict = create_test_auth_headers_for_user(owner["email"])
+
+    response: Response = await async_client.get("/api/v1/user/", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    etag: str = response.headers["ETag"]
+
+    response = await async_client.get(
+        "/api/v1/user/",
+        headers={**headers, "If-Modified-Since": response.headers["Last-Modified"]},
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    await async_client.patch(
+        "/api/v1/user/change-username",
+        json={"username": "new_username"},
+        headers=headers,
+    )
+
+    response = await async_client.get(
+        "/api/v1/user/", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["username"] == "new_username"
+
+
+def test_is_not_modified():
+    etag: str = get_etag("/event/", 1)
+    headers: dict = {"ETag": etag, "Last-Modified": "Wed, 10 Oct 2029 10:10:10 GMT"}
+
+    assert is_not_modified(headers, f'W/"other", {etag}')
+    assert is_not_modified(headers, etag.removeprefix("W/"))
+    assert is_not_modified(headers, "*")
+    assert not is_not_modified(headers, 'W/"other"')
+    assert not is_not_modified(headers, 'W/"other"', "Wed, 10 Oct 2029 10:10:10 GMT")
+    assert is_not_modified(headers, None, "Wed, 10 Oct 2029 10:10:10 GMT")
+    assert not is_not_modified(headers, None, "Wed, 10 Oct 2029 10:10:09 GMT")
+    assert not is_not_modified(headers, None, "not a date")
+    assert not is_not_modified({"ETag": etag}, None, "Wed, 10 Oct 2029 10:10:10 GMT")
+
+
+def test_get_last_modified():
+    assert (
+        get_last_modified(datetime(2020, 10, 10, 10, 10, 10))
+        == "Sat, 10 Oct 2020 10:10:10 GMT"
+    )
+    assert (
+        get_last_modified(datetime(2020, 10, 10, 10, 10, 10, 1))
+        == "Sat, 10 Oct 2020 10:10:11 GMT"
+    )
+    assert get_last_modified(datetime.utcnow() + timedelta(microseconds=1)) is None
+
+
+async def test_get_event_changed_within_the_same_second(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    async_client: AsyncClient,
+):
+    with patch.object(EventService, "_create_task"):
+        owner: dict = _create_user_with_pet(
+            create_user_in_database, create_pet_in_database
+        )
+        event_id: str = _create_event(
+            create_event_in_database, owner["pet_id"], "Some title"
+        )
+        headers: dict = create_test_auth_headers_for_user(owner["email"])
+
+        with patch("src.conditional.datetime") as datetime_mock:
+            datetime_mock.utcnow.return_value = datetime(2000, 1, 1)
+            response: Response = await async_client.get(
+                "/api/v1/event/", params={"event_id": event_id}, headers=headers
+            )
+        assert response.status_code == status.HTTP_200_OK
+        assert "Last-Modified" not in response.headers
+
+        with patch("src.conditional.datetime") as datetime_mock:
+            datetime_mock.utcnow.return_value = datetime(2100, 1, 1)
+            response = await async_client.get(
+                "/api/v1/event/", params={"event_id": event_id}, headers=headers
+            )
+        assert response.status_code == status.HTTP_200_OK
+        assert "Last-Modified" in response.headers
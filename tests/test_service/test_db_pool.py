@@ -0,0 +1,70 @@
+from fastapi import status
+from httpx import AsyncClient
+from httpx import Response
+
+from src.database import engine_manager
+
+
+async def test_get_db_pool_stats_not_initialized(
+    async_client: AsyncClient, service_headers: dict
+):
+    await engine_manager.dispose()
+
+    response: Response = await async_client.get(
+        "/api/v1/service/db-pool", headers=service_headers
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"initialized": False}
+
+
+async def test_get_db_pool_stats_initialized(
+    async_client: AsyncClient, service_headers: dict
+):
+    engine_manager.init()
+
+    try:
+        response: Response = await async_client.get(
+            "/api/v1/service/db-pool", headers=service_headers
+        )
+        response_data: dict = response.json()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response_data["initialized"] is True
+        assert response_data["checked_out"] == 0
+        assert response_data["max_overflow"] == engine_manager.settings.DB_MAX_OVERFLOW
+    finally:
+        await engine_manager.dispose()
+
+
+async def test_engine_is_shared_between_sessions():
+    try:
+        first_engine = engine_manager.engine
+        second_engine = engine_manager.engine
+
+        assert first_engine is second_engine
+        assert engine_manager.async_session is engine_manager.async_session
+    finally:
+        await engine_manager.dispose()
+
+
+async def test_service_endpoints_require_token(
+    async_client: AsyncClient, service_headers: dict
+):
+    response: Response = await async_client.get("/api/v1/service/db-pool")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    response = await async_client.get(
+        "/api/v1/service/db-pool", headers={"X-Service-Token": "wrong_token"}
+    )
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+async def test_service_endpoints_disabled_without_token_setting(
+    async_client: AsyncClient,
+):
+    response: Response = await async_client.get(
+        "/api/v1/service/db-pool", headers={"X-Service-Token": "some_service_token"}
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
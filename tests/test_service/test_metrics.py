@@ -0,0 +1,31 @@
+from uuid import uuid4
+
+from fastapi import status
+from httpx import AsyncClient
+from httpx import Response
+
+
+async def test_get_metrics(async_client: AsyncClient, service_headers: dict):
+    await async_client.get("/api/v1/service/hashing", headers=service_headers)
+
+    response: Response = await async_client.get("/metrics")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'pettracker_request_latency_seconds_count{method="GET",'
+        'route="/api/v1/service/hashing",status="200"}'
+    ) in response.text
+    assert 'pettracker_requests_in_progress{method="GET"} 1.0' in response.text
+
+
+async def test_get_metrics_labels_unmatched_requests(async_client: AsyncClient):
+    await async_client.get(f"/api/v1/unknown/{uuid4()}")
+
+    response: Response = await async_client.get("/metrics")
+
+    assert (
+        'pettracker_request_latency_seconds_count{method="GET",'
+        'route="unmatched",status="404"}'
+    ) in response.text
+    assert "/api/v1/unknown/" not in response.text
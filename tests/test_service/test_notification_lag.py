@@ -0,0 +1,78 @@
+from datetime import datetime
+from datetime import timedelta
+from typing import Callable
+from uuid import uuid4
+
+from fastapi import status
+from httpx import AsyncClient
+from httpx import Response
+
+
+async def test_get_notification_lag_report(
+    async_client: AsyncClient,
+    create_notification_delivery_in_database: Callable,
+    service_headers: dict,
+):
+    current_hour: datetime = datetime.utcnow().replace(
+        minute=0, second=0, microsecond=0
+    )
+    previous_hour: datetime = current_hour - timedelta(hours=1)
+
+    for lag_ms in range(100, 10100, 100):
+        create_notification_delivery_in_database(
+            event_id=str(uuid4()), due_at=previous_hour, lag_ms=lag_ms
+        )
+    create_notification_delivery_in_database(
+        event_id=str(uuid4()), due_at=current_hour, lag_ms=90000
+    )
+    create_notification_delivery_in_database(
+        event_id=str(uuid4()), due_at=current_hour - timedelta(days=2), lag_ms=500
+    )
+
+    response: Response = await async_client.get(
+        "/api/v1/service/notification-lag", params={"hours": 3}, headers=service_headers
+    )
+    response_data: dict = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response_data["alert_threshold_seconds"] == 60
+    assert response_data["hours"] == [
+        {
+            "hour": previous_hour.isoformat(),
+            "notifications": 100,
+            "late": 0,
+            "p50_ms": 5050,
+            "p95_ms": 9505,
+            "p99_ms": 9901,
+            "max_ms": 10000,
+        },
+        {
+            "hour": current_hour.isoformat(),
+            "notifications": 1,
+            "late": 1,
+            "p50_ms": 90000,
+            "p95_ms": 90000,
+            "p99_ms": 90000,
+            "max_ms": 90000,
+        },
+    ]
+
+
+async def test_get_notification_lag_report_invalid_period(
+    async_client: AsyncClient, service_headers: dict
+):
+    response: Response = await async_client.get(
+        "/api/v1/service/notification-lag", params={"hours": 0}, headers=service_headers
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_get_notification_lag_report_requires_token(
+    async_client: AsyncClient, service_headers: dict
+):
+    response: Response = await async_client.get(
+        "/api/v1/service/notification-lag", params={"hours": 3}
+    )
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
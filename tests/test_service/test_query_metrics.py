@@ -0,0 +1,100 @@
+import uuid
+from typing import Callable
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from httpx import Response
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine
+from sqlalchemy import Engine
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+
+from src.metrics import _query_stats
+from src.metrics import QueryStats
+from src.user.services.hashing import Hasher
+from tests.conftest import create_test_auth_headers_for_user
+from tests.conftest import TEST_SYNC_DATABASE_URL
+
+
+def _get_observed_requests(route: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "pettracker_db_queries_per_request_count", {"route": route}
+        )
+        or 0
+    )
+
+
+async def test_query_metrics_are_collected_per_request(
+    async_client: AsyncClient, create_user_in_database: Callable
+):
+    user_data: dict = {
+        "user_id": str(uuid.uuid4()),
+        "username": "some_username",
+        "email": "some_email@email.ru",
+        "hashed_password": Hasher().get_password_hash("1234"),
+        "is_active": True,
+    }
+    create_user_in_database(**user_data)
+    route: str = "/api/v1/pet/list-of-pets"
+    observed_requests: float = _get_observed_requests(route)
+
+    response: Response = await async_client.get(
+        route, headers=create_test_auth_headers_for_user(user_data["email"])
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    server_timing: str = response.headers["server-timing"]
+    assert server_timing.startswith("db;desc=")
+    assert '"0 queries"' not in server_timing
+    assert "db-slowest;dur=" in server_timing
+
+    assert _get_observed_requests(route) == observed_requests + 1
+
+
+async def test_query_metrics_without_queries(
+    async_client: AsyncClient, service_headers: dict
+):
+    response: Response = await async_client.get(
+        "/api/v1/service/hashing", headers=service_headers
+    )
+
+    assert response.headers["server-timing"] == (
+        'db;desc="0 queries";dur=0.000, db-slowest;dur=0.000'
+    )
+
+
+def test_query_stats_keeps_slowest_statement():
+    query_stats: QueryStats = QueryStats()
+
+    query_stats.add("SELECT 1", 0.002)
+    query_stats.add("SELECT 2", 0.005)
+    query_stats.add("SELECT 3", 0.001)
+
+    assert query_stats.count == 3
+    assert round(query_stats.total, 3) == 0.008
+    assert query_stats.slowest_statement == "SELECT 2"
+
+
+def test_failed_statement_does_not_break_query_timing():
+    engine: Engine = create_engine(url=TEST_SYNC_DATABASE_URL)
+    query_stats: QueryStats = QueryStats()
+    token = _query_stats.set(query_stats)
+
+    try:
+        with engine.connect() as connection:
+            with pytest.raises(ProgrammingError):
+                connection.execute(text("SELECT * FROM missing_table"))
+            connection.rollback()
+            connection.execute(text("SELECT 1"))
+
+            assert "query_started_at" not in connection.info
+    finally:
+        _query_stats.reset(token)
+        engine.dispose()
+
+    assert query_stats.count == 1
+    assert query_stats.slowest_statement == "SELECT 1"
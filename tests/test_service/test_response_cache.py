@@ -0,0 +1,375 @@
+from datetime import datetime
+from typing import Callable
+from typing import Generator
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+from uuid import UUID
+from uuid import uuid4
+
+import pytest
+import redis
+from fastapi import status
+from httpx import AsyncClient
+from httpx import Response
+from prometheus_client import REGISTRY
+
+from src.cache import CachedResponse
+from src.cache import get_cache_key
+from src.cache import InMemoryResponseCache
+from src.cache import RedisResponseCache
+from src.event.services.services import EventService
+from src.pet.schemas import PetSortingEnum
+from src.pet.services.dal import PetDAL
+from src.user.services.hashing import Hasher
+from src.worker.services.cache import ResponseCacheInvalidator
+from tests.conftest import create_test_auth_headers_for_user
+
+
+@pytest.fixture(scope="function")
+def in_memory_response_cache() -> Generator[InMemoryResponseCache, None, None]:
+    """Fixture that enables the in-memory response cache for a test function"""
+
+    cache: InMemoryResponseCache = InMemoryResponseCache(max_size=100, ttl=60)
+    with patch("src.cache.response_cache", cache):
+        yield cache
+
+
+def _create_user_with_pet(
+    create_user_in_database: Callable, create_pet_in_database: Callable
+) -> dict:
+    user_data: dict = {
+        "user_id": str(uuid4()),
+        "username": "some_username",
+        "email": "some_email@email.ru",
+        "hashed_password": Hasher().get_password_hash("1234"),
+        "is_active": True,
+    }
+    create_user_in_database(**user_data)
+
+    pet_data: dict = {
+        "pet_id": str(uuid4()),
+        "name": "Some name",
+        "species": "Cat",
+        "breed": "Some breed",
+        "weight": 15,
+        "owner_id": user_data["user_id"],
+        "gender": "male",
+    }
+    create_pet_in_database(**pet_data)
+
+    return {
+        "user_id": user_data["user_id"],
+        "email": user_data["email"],
+        "pet_id": pet_data["pet_id"],
+    }
+
+
+def _get_cache_metric(name: str, route: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            f"pettracker_response_cache_{name}_total", {"route": route}
+        )
+        or 0.0
+    )
+
+
+async def test_get_list_of_pets_is_cached(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    async_client: AsyncClient,
+    in_memory_response_cache: InMemoryResponseCache,
+):
+    owner: dict = _create_user_with_pet(create_user_in_database, create_pet_in_database)
+    headers: dict = create_test_auth_headers_for_user(owner["email"])
+    hits: float = _get_cache_metric("hits", "/pet/list-of-pets")
+    misses: float = _get_cache_metric("misses", "/pet/list-of-pets")
+
+    first_response: Response = await async_client.get(
+        "/api/v1/pet/list-of-pets", headers=headers
+    )
+    create_pet_in_database(
+        pet_id=str(uuid4()),
+        name="Not cached name",
+        species="Dog",
+        breed="Some breed",
+        weight=20,
+        owner_id=owner["user_id"],
+        gender="male",
+    )
+    second_response: Response = await async_client.get(
+        "/api/v1/pet/list-of-pets", headers=headers
+    )
+
+    assert first_response.status_code == status.HTTP_200_OK
+    assert second_response.status_code == status.HTTP_200_OK
+    assert second_response.json() == first_response.json()
+    assert second_response.headers["ETag"] == first_response.headers["ETag"]
+    assert _get_cache_metric("misses", "/pet/list-of-pets") == misses + 1
+    assert _get_cache_metric("hits", "/pet/list-of-pets") == hits + 1
+
+    response: Response = await async_client.get(
+        "/api/v1/pet/list-of-pets",
+        headers={**headers, "If-None-Match": first_response.headers["ETag"]},
+    )
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+async def test_get_list_of_pets_cache_invalidated_after_adding_pet(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    async_client: AsyncClient,
+    in_memory_response_cache: InMemoryResponseCache,
+):
+    owner: dict = _create_user_with_pet(create_user_in_database, create_pet_in_database)
+    headers: dict = create_test_auth_headers_for_user(owner["email"])
+
+    await async_client.get("/api/v1/pet/list-of-pets", headers=headers)
+    await async_client.post(
+        "/api/v1/pet/",
+        json={
+            "name": "New name",
+            "species": "Dog",
+            "breed": "Some breed",
+            "gender": "male",
+            "weight": 20,
+        },
+        headers=headers,
+    )
+    response: Response = await async_client.get(
+        "/api/v1/pet/list-of-pets", headers=headers
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [pet["name"] for pet in response.json()] == ["Some name", "New name"]
+
+
+async def test_get_pet_cache_invalidated_after_update(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    async_client: AsyncClient,
+    in_memory_response_cache: InMemoryResponseCache,
+):
+    owner: dict = _create_user_with_pet(create_user_in_database, create_pet_in_database)
+    headers: dict = create_test_auth_headers_for_user(owner["email"])
+
+    await async_client.get(
+        "/api/v1/pet/", params={"pet_id": owner["pet_id"]}, headers=headers
+    )
+    await async_client.patch(
+        "/api/v1/pet/",
+        params={"pet_id": owner["pet_id"]},
+        json={"name": "New name"},
+        headers=headers,
+    )
+    response: Response = await async_client.get(
+        "/api/v1/pet/", params={"pet_id": owner["pet_id"]}, headers=headers
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["name"] == "New name"
+
+
+async def test_get_event_cache_invalidated_after_update(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    async_client: AsyncClient,
+    in_memory_response_cache: InMemoryResponseCache,
+):
+    with patch.object(EventService, "_create_task"):
+        owner: dict = _create_user_with_pet(
+            create_user_in_database, create_pet_in_database
+        )
+        headers: dict = create_test_auth_headers_for_user(owner["email"])
+        event_id: str = str(uuid4())
+        create_event_in_database(
+            event_id=event_id,
+            title="Some title",
+            content="Some content",
+            scheduled_at=datetime(datetime.now().year + 1, 10, 10, 10, 10),
+            pet_id=owner["pet_id"],
+            is_happened=False,
+        )
+
+        await async_client.get(
+            "/api/v1/event/", params={"event_id": event_id}, headers=headers
+        )
+        await async_client.get("/api/v1/event/list-of-events", headers=headers)
+        await async_client.patch(
+            "/api/v1/event/",
+            params={"event_id": event_id},
+            json={"title": "New title", "timezone": "Europe/Moscow"},
+            headers=headers,
+        )
+
+        response: Response = await async_client.get(
+            "/api/v1/event/", params={"event_id": event_id}, headers=headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["title"] == "New title"
+
+        response = await async_client.get(
+            "/api/v1/event/list-of-events", headers=headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [event["title"] for event in response.json()] == ["New title"]
+
+
+async def test_get_list_of_events_cache_is_separate_for_users(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    async_client: AsyncClient,
+    in_memory_response_cache: InMemoryResponseCache,
+):
+    owner: dict = _create_user_with_pet(create_user_in_database, create_pet_in_database)
+    create_event_in_database(
+        event_id=str(uuid4()),
+        title="Some title",
+        content=None,
+        scheduled_at=datetime(2030, 10, 10, 10, 10),
+        pet_id=owner["pet_id"],
+        is_happened=False,
+    )
+    other_user_id: str = str(uuid4())
+    create_user_in_database(
+        user_id=other_user_id,
+        username="other_username",
+        email="other_email@email.ru",
+        hashed_password=Hasher().get_password_hash("1234"),
+        is_active=True,
+    )
+
+    response: Response = await async_client.get(
+        "/api/v1/event/list-of-events",
+        headers=create_test_auth_headers_for_user(owner["email"]),
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    response = await async_client.get(
+        "/api/v1/event/list-of-events",
+        headers=create_test_auth_headers_for_user("other_email@email.ru"),
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_in_memory_response_cache_invalidates_only_user_namespace():
+    cache: InMemoryResponseCache = InMemoryResponseCache(max_size=100, ttl=60)
+    first_user_id, second_user_id = uuid4(), uuid4()
+    cached_response: CachedResponse = CachedResponse(content=b"[]", headers={})
+
+    await cache.set(first_user_id, 0, "/pet/list-of-pets?", cached_response)
+    await cache.set(second_user_id, 0, "/pet/list-of-pets?", cached_response)
+    await cache.invalidate(first_user_id)
+
+    first_generation: int = await cache.get_generation(first_user_id)
+    assert (
+        await cache.get(first_user_id, first_generation, "/pet/list-of-pets?") is None
+    )
+    assert await cache.get(second_user_id, 0, "/pet/list-of-pets?") == cached_response
+
+
+async def test_in_memory_response_cache_skips_response_of_old_generation():
+    cache: InMemoryResponseCache = InMemoryResponseCache(max_size=100, ttl=60)
+    user_id: UUID = uuid4()
+    cached_response: CachedResponse = CachedResponse(content=b"[]", headers={})
+
+    generation: int = await cache.get_generation(user_id)
+    await cache.invalidate(user_id)
+    await cache.set(user_id, generation, "/pet/list-of-pets?", cached_response)
+
+    new_generation: int = await cache.get_generation(user_id)
+    assert await cache.get(user_id, new_generation, "/pet/list-of-pets?") is None
+
+
+async def test_get_list_of_pets_not_cached_after_concurrent_change(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    async_client: AsyncClient,
+    in_memory_response_cache: InMemoryResponseCache,
+):
+    owner: dict = _create_user_with_pet(create_user_in_database, create_pet_in_database)
+    headers: dict = create_test_auth_headers_for_user(owner["email"])
+    get_pets_page: Callable = PetDAL.get_pets_page
+
+    async def get_pets_page_before_change(self, *args, **kwargs):
+        rows = await get_pets_page(self, *args, **kwargs)
+        await in_memory_response_cache.invalidate(UUID(owner["user_id"]))
+        return rows
+
+    with patch.object(PetDAL, "get_pets_page", get_pets_page_before_change):
+        await async_client.get("/api/v1/pet/list-of-pets", headers=headers)
+
+    generation: int = await in_memory_response_cache.get_generation(
+        UUID(owner["user_id"])
+    )
+    assert (
+        await in_memory_response_cache.get(
+            UUID(owner["user_id"]),
+            generation,
+            get_cache_key(
+                "/pet/list-of-pets", limit=50, sort=PetSortingEnum.created_at
+            ),
+        )
+        is None
+    )
+    assert not in_memory_response_cache._entries
+
+
+async def test_redis_response_cache_expires_every_entry():
+    cache: RedisResponseCache = RedisResponseCache(url="redis://some_host", ttl=60)
+    cache.client = MagicMock()
+    cache.client.set = AsyncMock()
+    cache.client.get = AsyncMock(return_value=b"3")
+    user_id: UUID = uuid4()
+
+    generation: int = await cache.get_generation(user_id)
+    await cache.set(
+        user_id, generation, "/pet/?", CachedResponse(content=b"{}", headers={})
+    )
+
+    cache.client.get.assert_awaited_once_with(f"response-cache:generation:{user_id}")
+    cache.client.set.assert_awaited_once_with(
+        f"response-cache:entry:{user_id}:3:/pet/?", b"{}\n{}", ex=60
+    )
+
+
+def test_cached_response_dump_and_load():
+    cached_response: CachedResponse = CachedResponse(
+        content=b'[{"name":"Some\\nname"}]', headers={"X-Next-Cursor": "abc"}
+    )
+
+    assert CachedResponse.load(cached_response.dump()) == cached_response
+
+
+def test_get_cache_key_does_not_depend_on_order_of_parameters():
+    assert get_cache_key(
+        "/pet/list-of-pets", sort=PetSortingEnum.name, limit=10, cursor=None
+    ) == get_cache_key("/pet/list-of-pets", limit=10, sort=PetSortingEnum.name)
+    assert get_cache_key(
+        "/pet/list-of-pets", sort=PetSortingEnum.name, limit=10
+    ) != get_cache_key("/pet/list-of-pets", sort=PetSortingEnum.created_at, limit=10)
+
+
+def test_response_cache_invalidator_increments_generations():
+    invalidator: ResponseCacheInvalidator = ResponseCacheInvalidator(
+        url="redis://some_host", ttl=60
+    )
+    invalidator.client = MagicMock()
+    pipeline: MagicMock = invalidator.client.pipeline.return_value.__enter__()
+    user_id: UUID = uuid4()
+
+    invalidator.invalidate([user_id, user_id, None])
+
+    pipeline.incr.assert_called_once_with(f"response-cache:generation:{user_id}")
+    pipeline.expire.assert_called_once_with(f"response-cache:generation:{user_id}", 600)
+    pipeline.execute.assert_called_once()
+
+    pipeline.execute.side_effect = redis.RedisError
+    invalidator.invalidate([user_id])
+
+    invalidator.client.reset_mock()
+    invalidator.invalidate([])
+    invalidator.client.pipeline.assert_not_called()
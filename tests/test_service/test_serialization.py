@@ -0,0 +1,66 @@
+import uuid
+from datetime import datetime
+from typing import List
+
+import pytest
+from asyncpg.pgproto.pgproto import UUID
+
+from src.event.models import Event
+from src.event.schemas import ShowEventSchema
+from src.event.services.services import EventService
+from src.pet.models import PetGenderEnum
+from src.pet.schemas import ShowPetInDetailSchema
+from src.pet.schemas import ShowPetSchema
+from src.pet.services.services import PetService
+from src.serialization import serialize
+from src.serialization import serialize_trusted
+
+
+def _create_event(recurrence_rule: str = None) -> Event:
+    return Event(
+        event_id=uuid.uuid4(),
+        title='Some "title"',
+        content="Some content",
+        scheduled_at=datetime(2030, 10, 10, 10, 10),
+        pet_id=uuid.uuid4(),
+        is_happened=False,
+        recurrence_rule=recurrence_rule,
+    )
+
+
+@pytest.mark.parametrize("is_detailed", [True, False])
+@pytest.mark.parametrize("recurrence_rule", [None, "FREQ=DAILY"])
+def test_serialize_trusted_event_data(is_detailed: bool, recurrence_rule: str):
+    event_data: dict = EventService._form_event_data(
+        _create_event(recurrence_rule), is_detailed
+    )
+
+    assert serialize_trusted(event_data) == serialize(ShowEventSchema, event_data)
+
+
+def test_serialize_trusted_pet_data():
+    events: List[dict] = PetService._form_event_data_for_pet(
+        [_create_event(), _create_event("FREQ=WEEKLY")]
+    )
+    pet_data: dict = {
+        "pet_id": uuid.uuid4(),
+        "name": "Some name",
+        "species": "Cat",
+        "breed": None,
+        "gender": PetGenderEnum.female,
+        "weight": 15.5,
+        "events": events,
+    }
+    pets_data: List[dict] = [
+        {"pet_id": uuid.uuid4(), "name": "Some name"},
+        {"pet_id": UUID(str(uuid.uuid4())), "name": "Other name"},
+    ]
+
+    assert serialize_trusted(pet_data) == serialize(ShowPetInDetailSchema, pet_data)
+    assert serialize_trusted(events) == serialize(List[ShowEventSchema], events)
+    assert serialize_trusted(pets_data) == serialize(List[ShowPetSchema], pets_data)
+
+
+def test_serialize_trusted_unsupported_type():
+    with pytest.raises(TypeError):
+        serialize_trusted({"created_at": object()})
@@ -0,0 +1,79 @@
+import os
+from unittest.mock import patch
+
+from fastapi import status
+from httpx import AsyncClient
+from httpx import Response
+
+from src.templates import template_registry
+from src.templates import TemplateRegistry
+from src.templates import TEMPLATES_FOLDERS
+
+
+def test_load_compiles_all_templates():
+    registry: TemplateRegistry = TemplateRegistry(folders=TEMPLATES_FOLDERS)
+
+    registry.load()
+
+    assert registry.get_stats()["loaded"] == [
+        "email_change_confirmation.html",
+        "email_confirmation.html",
+        "event_notification.html",
+        "password_reset_confirmation.html",
+    ]
+
+
+def test_render_does_not_read_templates_from_disk():
+    registry: TemplateRegistry = TemplateRegistry(folders=TEMPLATES_FOLDERS)
+    registry.load()
+
+    with patch.object(
+        registry.env.loader, "get_source", side_effect=AssertionError
+    ) as mock_get_source:
+        for _ in range(2):
+            result: str = registry.render(
+                "email_confirmation.html",
+                frontend_url="http://some-host",
+                token="some_token",
+            )
+
+        mock_get_source.assert_not_called()
+
+    assert "some_token" in result
+
+    render_stats: dict = registry.get_stats()["renders"]["email_confirmation.html"]
+    assert render_stats["count"] == 2
+    assert render_stats["max_ms"] >= render_stats["avg_ms"]
+
+
+def test_bytecode_cache(tmp_path):
+    registry: TemplateRegistry = TemplateRegistry(
+        folders=TEMPLATES_FOLDERS, bytecode_cache_dir=str(tmp_path / "cache")
+    )
+
+    registry.load()
+
+    assert len(os.listdir(tmp_path / "cache")) == 4
+
+
+async def test_get_templates_stats(async_client: AsyncClient, service_headers: dict):
+    template_registry.render(
+        "event_notification.html",
+        title="some title",
+        content="some content",
+        pet="Some name",
+        year=2030,
+        month=10,
+        day=10,
+        hour=10,
+        minute=10,
+    )
+
+    response: Response = await async_client.get(
+        "/api/v1/service/templates", headers=service_headers
+    )
+    response_data: dict = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "event_notification.html" in response_data["loaded"]
+    assert response_data["renders"]["event_notification.html"]["count"] >= 1
@@ -0,0 +1,103 @@
+import uuid
+from typing import Callable
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+
+from fastapi import status
+from httpx import AsyncClient
+from httpx import Response
+from kombu.exceptions import OperationalError
+
+from src.user.services.hashing import Hasher
+
+
+async def test_reset_password_email_is_enqueued(
+    async_client: AsyncClient,
+    create_user_in_database: Callable,
+    get_outgoing_email_from_database: Callable,
+):
+    with patch("src.user.services.email.send_user_email") as mock_send_user_email:
+        user_data: dict = {
+            "user_id": str(uuid.uuid4()),
+            "username": "some_username",
+            "email": "some_email@email.ru",
+            "hashed_password": Hasher().get_password_hash("1234"),
+            "is_active": True,
+        }
+        create_user_in_database(**user_data)
+
+        response: Response = await async_client.post(
+            "/api/v1/user/auth/reset-password", json={"email": user_data["email"]}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        outgoing_email: dict = get_outgoing_email_from_database(user_data["email"])
+        assert outgoing_email["subject"] == "Письмо для сброса пароля в PetTracker"
+        assert outgoing_email["status"] == "pending"
+        assert outgoing_email["attempts"] == 0
+        assert outgoing_email["template_name"] == "password_reset_confirmation.html"
+        assert outgoing_email["context"] == {"email": user_data["email"]}
+
+        mock_send_user_email.delay.assert_called_once_with(
+            email_id=str(outgoing_email["email_id"])
+        )
+
+
+async def test_create_user_email_is_sent_inline(
+    async_client: AsyncClient,
+    get_outgoing_email_from_database: Callable,
+):
+    with patch(
+        "src.user.services.email.project_settings.USER_EMAIL_DELIVERY", "inline"
+    ), patch(
+        "src.user.services.email.async_smtp_pool.send_message", new_callable=AsyncMock
+    ) as mock_send_message, patch(
+        "src.user.services.email.send_user_email"
+    ) as mock_send_user_email:
+        user_data: dict = {
+            "username": "some username",
+            "email": "some_email@email.ru",
+            "password1": "1234",
+            "password2": "1234",
+        }
+
+        response: Response = await async_client.post("/api/v1/user/", json=user_data)
+
+        assert response.status_code == status.HTTP_200_OK
+
+        mock_send_message.assert_awaited_once()
+        message = mock_send_message.await_args.args[0]
+        assert message["To"] == user_data["email"]
+        assert message["Subject"] == "Письмо для подтверждения регистрации в PetTracker"
+
+        mock_send_user_email.delay.assert_not_called()
+        assert get_outgoing_email_from_database(user_data["email"]) == {}
+
+
+async def test_email_is_sent_inline_when_it_can_not_be_enqueued(
+    async_client: AsyncClient,
+    get_outgoing_email_from_database: Callable,
+):
+    with patch(
+        "src.user.services.email.async_smtp_pool.send_message", new_callable=AsyncMock
+    ) as mock_send_message, patch(
+        "src.user.services.email.send_user_email"
+    ) as mock_send_user_email:
+        mock_send_user_email.delay.side_effect = OperationalError("Connection refused")
+        user_data: dict = {
+            "username": "some username",
+            "email": "some_email@email.ru",
+            "password1": "1234",
+            "password2": "1234",
+        }
+
+        response: Response = await async_client.post("/api/v1/user/", json=user_data)
+
+        assert response.status_code == status.HTTP_200_OK
+        mock_send_message.assert_awaited_once()
+
+        outgoing_email: dict = get_outgoing_email_from_database(user_data["email"])
+        assert outgoing_email["status"] == "sent"
+        assert outgoing_email["attempts"] == 1
+        assert outgoing_email["last_error"].startswith("Could not enqueue email")
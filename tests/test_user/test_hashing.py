@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+
+from src.user.services.hashing import Hasher
+from src.user.services.hashing import HashingExecutor
+
+
+async def test_async_hashing_matches_sync_hashing():
+    hasher: Hasher = Hasher()
+
+    hashed_password: str = await hasher.async_get_password_hash("1234")
+
+    assert hasher.verify_password(hashed_password, "1234")
+    assert await hasher.async_verify_password(hashed_password, "1234")
+    assert not await hasher.async_verify_password(hashed_password, "4321")
+
+
+@pytest.mark.parametrize("executor_type", ["thread", "process"])
+async def test_hashing_executor_limits_concurrency(executor_type: str):
+    executor: HashingExecutor = HashingExecutor(
+        executor_type=executor_type, max_workers=1
+    )
+
+    try:
+        results: list = await asyncio.gather(
+            *[executor.run(pow, 2, power) for power in range(3)]
+        )
+        stats: dict = executor.get_stats()
+
+        assert results == [1, 2, 4]
+        assert stats["completed"] == 3
+        assert stats["in_flight"] == 0
+        assert stats["queued"] == 0
+        assert stats["peak_queued"] == 2
+    finally:
+        executor.shutdown()
+
+
+def test_hashing_executor_incorrect_type():
+    with pytest.raises(ValueError):
+        HashingExecutor(executor_type="fiber", max_workers=1)
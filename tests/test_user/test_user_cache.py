@@ -0,0 +1,151 @@
+import uuid
+from typing import Callable
+from unittest.mock import patch
+
+from fastapi import status
+from httpx import AsyncClient
+from httpx import Response
+
+from src.config import project_settings
+from src.config import ProjectSettings
+from src.user.services.cache import _create_user_cache
+from src.user.services.cache import InMemoryUserCache
+from src.user.services.cache import RedisUserCache
+from src.user.services.cache import user_cache
+from src.user.services.hashing import Hasher
+from tests.conftest import create_test_auth_headers_for_user
+
+
+async def test_get_user_is_cached(
+    async_client: AsyncClient,
+    create_user_in_database: Callable,
+):
+    user_data: dict = {
+        "user_id": str(uuid.uuid4()),
+        "username": "some_username",
+        "email": "some_email@email.ru",
+        "hashed_password": Hasher().get_password_hash("1234"),
+        "is_active": True,
+    }
+    create_user_in_database(**user_data)
+
+    response: Response = await async_client.get(
+        "/api/v1/user/", headers=create_test_auth_headers_for_user(user_data["email"])
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    cached_data: dict = await user_cache.get(user_data["email"])
+    assert str(cached_data["user_id"]) == user_data["user_id"]
+    assert cached_data["username"] == user_data["username"]
+
+
+async def test_user_cache_invalidated_after_username_change(
+    async_client: AsyncClient,
+    create_user_in_database: Callable,
+):
+    user_data: dict = {
+        "user_id": str(uuid.uuid4()),
+        "username": "some_username",
+        "email": "some_email@email.ru",
+        "hashed_password": Hasher().get_password_hash("1234"),
+        "is_active": True,
+    }
+    create_user_in_database(**user_data)
+    headers: dict = create_test_auth_headers_for_user(user_data["email"])
+
+    await async_client.get("/api/v1/user/", headers=headers)
+    await async_client.patch(
+        "/api/v1/user/change-username",
+        json={"username": "new_username"},
+        headers=headers,
+    )
+    response: Response = await async_client.get("/api/v1/user/", headers=headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["username"] == "new_username"
+
+
+async def test_user_cache_invalidated_after_deletion(
+    async_client: AsyncClient,
+    create_user_in_database: Callable,
+):
+    user_data: dict = {
+        "user_id": str(uuid.uuid4()),
+        "username": "some_username",
+        "email": "some_email@email.ru",
+        "hashed_password": Hasher().get_password_hash("1234"),
+        "is_active": True,
+    }
+    create_user_in_database(**user_data)
+    headers: dict = create_test_auth_headers_for_user(user_data["email"])
+
+    await async_client.get("/api/v1/user/", headers=headers)
+    await async_client.delete("/api/v1/user/", headers=headers)
+    response: Response = await async_client.get("/api/v1/user/", headers=headers)
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert await user_cache.get(user_data["email"]) is None
+
+
+async def test_in_memory_user_cache_evicts_least_recently_used():
+    cache: InMemoryUserCache = InMemoryUserCache(max_size=2, ttl=60)
+
+    await cache.set("first", {"username": "first"})
+    await cache.set("second", {"username": "second"})
+    await cache.get("first")
+    await cache.set("third", {"username": "third"})
+
+    assert await cache.get("first") == {"username": "first"}
+    assert await cache.get("second") is None
+    assert await cache.get("third") == {"username": "third"}
+
+
+async def test_in_memory_user_cache_entry_expires():
+    cache: InMemoryUserCache = InMemoryUserCache(max_size=2, ttl=0)
+
+    await cache.set("first", {"username": "first"})
+
+    assert await cache.get("first") is None
+
+
+async def test_cached_user_can_change_password(
+    async_client: AsyncClient,
+    create_user_in_database: Callable,
+):
+    user_data: dict = {
+        "user_id": str(uuid.uuid4()),
+        "username": "some_username",
+        "email": "some_email@email.ru",
+        "hashed_password": Hasher().get_password_hash("1234"),
+        "is_active": True,
+    }
+    create_user_in_database(**user_data)
+    headers: dict = create_test_auth_headers_for_user(user_data["email"])
+
+    await async_client.get("/api/v1/user/", headers=headers)
+    assert "hashed_password" not in await user_cache.get(user_data["email"])
+
+    response: Response = await async_client.patch(
+        "/api/v1/user/change-password",
+        json={"old_password": "1234", "password1": "12345", "password2": "12345"},
+        headers=headers,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert await user_cache.get(user_data["email"]) is None
+
+
+def test_redis_user_cache_is_used_without_in_memory_tier():
+    with patch.object(project_settings, "USER_CACHE_ENABLED", True), patch.object(
+        project_settings, "USER_CACHE_REDIS_ENABLED", True
+    ):
+        assert isinstance(_create_user_cache(), RedisUserCache)
+
+    with patch.object(project_settings, "USER_CACHE_ENABLED", True), patch.object(
+        project_settings, "USER_CACHE_REDIS_ENABLED", False
+    ):
+        assert isinstance(_create_user_cache(), InMemoryUserCache)
+
+
+def test_redis_user_cache_is_enabled_by_default():
+    assert ProjectSettings.model_fields["USER_CACHE_REDIS_ENABLED"].default is True
@@ -0,0 +1,260 @@
+from datetime import datetime
+from datetime import timedelta
+from functools import wraps
+from importlib import reload
+from typing import Callable
+from typing import Optional
+from unittest.mock import patch
+from uuid import uuid4
+
+from sqlalchemy import create_engine
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import sessionmaker
+
+from src.event.models import Event
+from src.user.services.hashing import Hasher
+from src.worker import celery
+from src.worker.services.dal import CeleryDAL
+from tests.conftest import TEST_SYNC_DATABASE_URL
+
+
+def _db_session_manager_for_tests(func: Callable) -> Callable:
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> None:
+        engine = create_engine(url=TEST_SYNC_DATABASE_URL, echo=True)
+        session = sessionmaker(engine)
+        db_session: Session = session()
+        celery_dal: CeleryDAL = CeleryDAL(db_session=db_session)
+
+        try:
+            result: Callable = func(celery_dal, *args, **kwargs)
+            return result
+        finally:
+            db_session.close()
+
+    return wrapper
+
+
+patch("src.worker.database.db_session_manager", _db_session_manager_for_tests).start()
+
+reload(celery)
+
+
+def _create_user_with_pet(
+    create_user_in_database: Callable, create_pet_in_database: Callable
+) -> dict:
+    user_data: dict = {
+        "user_id": str(uuid4()),
+        "username": "some_username",
+        "email": "some_email@email.ru",
+        "hashed_password": Hasher().get_password_hash("1234"),
+        "is_active": True,
+    }
+    create_user_in_database(**user_data)
+
+    pet_data: dict = {
+        "pet_id": str(uuid4()),
+        "name": "Some name",
+        "species": "Cat",
+        "breed": "Some breed",
+        "weight": 15,
+        "owner_id": user_data["user_id"],
+        "gender": "male",
+    }
+    create_pet_in_database(**pet_data)
+
+    return {"email": user_data["email"], "pet_id": pet_data["pet_id"]}
+
+
+def _get_event_data(
+    title: str, pet_id: str, notify_at: Optional[datetime], is_happened: bool = False
+) -> dict:
+    return {
+        "event_id": str(uuid4()),
+        "title": title,
+        "content": "some content",
+        "scheduled_at": datetime(year=2024, month=10, day=10, hour=10, minute=10),
+        "pet_id": pet_id,
+        "is_happened": is_happened,
+        "notify_at": notify_at,
+    }
+
+
+def test_dispatch_due_notifications_successfully(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    create_task_in_database: Callable,
+    get_event_from_database: Callable,
+    get_task_from_database: Callable,
+):
+    with patch("src.worker.celery.send_due_notification_email") as mock_send:
+        owner: dict = _create_user_with_pet(
+            create_user_in_database, create_pet_in_database
+        )
+        now: datetime = datetime.utcnow()
+
+        due_event: dict = _get_event_data(
+            "due", owner["pet_id"], now - timedelta(minutes=1)
+        )
+        create_event_in_database(**due_event)
+        create_task_in_database(task_id=str(uuid4()), event_id=due_event["event_id"])
+
+        create_event_in_database(
+            **_get_event_data("future", owner["pet_id"], now + timedelta(days=1))
+        )
+        create_event_in_database(
+            **_get_event_data(
+                "happened", owner["pet_id"], now - timedelta(days=1), is_happened=True
+            )
+        )
+        create_event_in_database(**_get_event_data("eta", owner["pet_id"], None))
+
+        dispatched: int = celery.dispatch_due_notifications()
+
+        assert dispatched == 1
+        mock_send.delay.assert_called_once_with(
+            email=owner["email"],
+            body={
+                "title": due_event["title"],
+                "content": due_event["content"],
+                "pet": "Some name",
+                "year": due_event["scheduled_at"].year,
+                "month": due_event["scheduled_at"].month,
+                "day": due_event["scheduled_at"].day,
+                "hour": due_event["scheduled_at"].hour,
+                "minute": due_event["scheduled_at"].minute,
+            },
+            event_id=due_event["event_id"],
+            notify_at=due_event["notify_at"].isoformat(),
+        )
+
+        assert get_event_from_database("due")["is_happened"] is True
+        assert get_task_from_database(due_event["event_id"]) is None
+        assert get_event_from_database("future")["is_happened"] is False
+        assert get_event_from_database("eta")["is_happened"] is False
+
+
+def test_dispatch_due_notifications_updates_version_of_events(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    get_event_from_database: Callable,
+):
+    with patch("src.worker.celery.send_due_notification_email"):
+        owner: dict = _create_user_with_pet(
+            create_user_in_database, create_pet_in_database
+        )
+        create_event_in_database(
+            **_get_event_data(
+                "due", owner["pet_id"], datetime.utcnow() - timedelta(minutes=1)
+            )
+        )
+        updated_at: datetime = get_event_from_database("due")["updated_at"]
+
+        celery.dispatch_due_notifications()
+
+        assert get_event_from_database("due")["updated_at"] > updated_at
+
+
+def test_dispatch_due_notifications_in_batches(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+):
+    with patch("src.worker.celery.send_due_notification_email") as mock_send, patch(
+        "src.worker.celery.project_settings.NOTIFICATION_SCHEDULER_BATCH_SIZE", 2
+    ), patch.object(
+        CeleryDAL,
+        "claim_due_events",
+        autospec=True,
+        side_effect=CeleryDAL.claim_due_events,
+    ) as mock_claim:
+        owner: dict = _create_user_with_pet(
+            create_user_in_database, create_pet_in_database
+        )
+        now: datetime = datetime.utcnow()
+
+        for number in range(5):
+            create_event_in_database(
+                **_get_event_data(
+                    f"title {number}",
+                    owner["pet_id"],
+                    now - timedelta(minutes=number + 1),
+                )
+            )
+
+        dispatched: int = celery.dispatch_due_notifications()
+
+        assert dispatched == 5
+        assert mock_send.delay.call_count == 5
+        assert mock_claim.call_count == 3
+
+        titles: list = [
+            send_call.kwargs["body"]["title"]
+            for send_call in mock_send.delay.call_args_list
+        ]
+        assert titles == [f"title {number}" for number in range(4, -1, -1)]
+
+
+def test_dispatch_due_notifications_skips_locked_events(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    get_event_from_database: Callable,
+    get_sync_session: Session,
+):
+    with patch("src.worker.celery.send_due_notification_email") as mock_send:
+        owner: dict = _create_user_with_pet(
+            create_user_in_database, create_pet_in_database
+        )
+        now: datetime = datetime.utcnow()
+
+        locked_event: dict = _get_event_data(
+            "locked", owner["pet_id"], now - timedelta(minutes=1)
+        )
+        create_event_in_database(**locked_event)
+        create_event_in_database(
+            **_get_event_data("free", owner["pet_id"], now - timedelta(minutes=1))
+        )
+
+        with get_sync_session.begin():
+            get_sync_session.execute(
+                select(Event)
+                .filter_by(event_id=locked_event["event_id"])
+                .with_for_update()
+            )
+
+            dispatched: int = celery.dispatch_due_notifications()
+
+            assert dispatched == 1
+            assert mock_send.delay.call_args.kwargs["body"]["title"] == "free"
+
+        assert get_event_from_database("locked")["is_happened"] is False
+        assert get_event_from_database("free")["is_happened"] is True
+
+
+def test_send_due_notification_email_successfully():
+    with patch("src.worker.celery.send_email") as mock_send_email:
+        body: dict = {"title": "some title"}
+
+        celery.send_due_notification_email(email="some_email@email.ru", body=body)
+
+        mock_send_email.assert_called_once_with(
+            subject="Уведомление о событии (PetTracker)",
+            data=body,
+            to_email="some_email@email.ru",
+        )
+
+
+def test_send_due_notification_email_raised_exception():
+    with patch("src.worker.celery.logger.log_error") as mock_log_error, patch(
+        "src.worker.celery.send_email"
+    ) as mock_send_email:
+        error: Exception = Exception("Some error message")
+        mock_send_email.side_effect = error
+
+        celery.send_due_notification_email(email="some_email@email.ru", body={})
+
+        mock_log_error.assert_called_once_with(error)
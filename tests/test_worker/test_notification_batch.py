@@ -0,0 +1,369 @@
+import smtplib
+from datetime import datetime
+from datetime import timedelta
+from functools import wraps
+from importlib import reload
+from typing import Callable
+from typing import List
+from typing import Tuple
+from unittest.mock import call
+from unittest.mock import MagicMock
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import sessionmaker
+
+from src.smtp import SMTPConnectionPool
+from src.user.services.hashing import Hasher
+from src.worker import celery
+from src.worker.services.buffer import NotificationBuffer
+from src.worker.services.dal import CeleryDAL
+from src.worker.services.email import send_emails
+from tests.conftest import TEST_SYNC_DATABASE_URL
+
+
+def _db_session_manager_for_tests(func: Callable) -> Callable:
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> None:
+        engine = create_engine(url=TEST_SYNC_DATABASE_URL, echo=True)
+        session = sessionmaker(engine)
+        db_session: Session = session()
+        celery_dal: CeleryDAL = CeleryDAL(db_session=db_session)
+
+        try:
+            result: Callable = func(celery_dal, *args, **kwargs)
+            return result
+        finally:
+            db_session.close()
+
+    return wrapper
+
+
+patch("src.worker.database.db_session_manager", _db_session_manager_for_tests).start()
+
+reload(celery)
+
+
+BODY: dict = {
+    "title": "some title",
+    "content": "some content",
+    "pet": "Some name",
+    "year": 2030,
+    "month": 10,
+    "day": 10,
+    "hour": 10,
+    "minute": 10,
+}
+
+
+def _create_events_with_tasks(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    create_task_in_database: Callable,
+    number_of_events: int,
+    notify_at: datetime = None,
+) -> List[Tuple[str, str]]:
+    user_data: dict = {
+        "user_id": str(uuid4()),
+        "username": "some_username",
+        "email": "some_email@email.ru",
+        "hashed_password": Hasher().get_password_hash("1234"),
+        "is_active": True,
+    }
+    create_user_in_database(**user_data)
+
+    pet_data: dict = {
+        "pet_id": str(uuid4()),
+        "name": "Some name",
+        "species": "Cat",
+        "breed": "Some breed",
+        "weight": 15,
+        "owner_id": user_data["user_id"],
+        "gender": "male",
+    }
+    create_pet_in_database(**pet_data)
+
+    events_with_tasks: List[Tuple[str, str]] = []
+    for number in range(number_of_events):
+        event_id: str = str(uuid4())
+        create_event_in_database(
+            event_id=event_id,
+            title=f"title {number}",
+            content="some content",
+            scheduled_at=datetime(year=2030, month=10, day=10, hour=10, minute=10),
+            pet_id=pet_data["pet_id"],
+            is_happened=False,
+            notify_at=notify_at,
+        )
+
+        task_id: str = str(uuid4())
+        create_task_in_database(task_id=task_id, event_id=event_id)
+        events_with_tasks.append((event_id, task_id))
+
+    return events_with_tasks
+
+
+def test_send_notification_email_is_buffered_in_batch_mode():
+    with patch(
+        "src.worker.celery.project_settings.NOTIFICATION_DISPATCH_MODE", "batch"
+    ), patch("src.worker.celery.notification_buffer") as mock_buffer, patch(
+        "src.worker.celery.send_email"
+    ) as mock_send_email:
+        event_id, task_id = str(uuid4()), str(uuid4())
+
+        celery.send_notification_email(
+            email="some_email@email.ru", body=BODY, event_id=event_id, task_id=task_id
+        )
+
+        mock_buffer.push.assert_called_once_with(
+            {
+                "email": "some_email@email.ru",
+                "body": BODY,
+                "event_id": event_id,
+                "task_id": task_id,
+                "notify_at": None,
+            }
+        )
+        mock_send_email.assert_not_called()
+
+
+def test_flush_notification_buffer(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    create_task_in_database: Callable,
+    get_event_from_database: Callable,
+    get_task_from_database: Callable,
+):
+    with patch("src.worker.celery.notification_buffer") as mock_buffer, patch(
+        "src.worker.celery.send_emails", return_value=[]
+    ) as mock_send_emails, patch(
+        "src.worker.celery.project_settings.NOTIFICATION_BATCH_SIZE", 3
+    ):
+        events_with_tasks: List[Tuple[str, str]] = _create_events_with_tasks(
+            create_user_in_database,
+            create_pet_in_database,
+            create_event_in_database,
+            create_task_in_database,
+            number_of_events=3,
+        )
+        notifications: List[dict] = [
+            {
+                "email": f"email_{number}@email.ru",
+                "body": BODY,
+                "event_id": event_id,
+                "task_id": task_id,
+            }
+            for number, (event_id, task_id) in enumerate(events_with_tasks)
+        ]
+        stale_notification: dict = {
+            "email": "stale_email@email.ru",
+            "body": BODY,
+            "event_id": str(uuid4()),
+            "task_id": str(uuid4()),
+        }
+        mock_buffer.pop_batch.side_effect = [
+            notifications,
+            [stale_notification],
+        ]
+
+        sent: int = celery.flush_notification_buffer()
+
+        assert sent == 3
+        assert mock_buffer.pop_batch.call_count == 2
+        mock_buffer.restore.assert_called_once()
+        assert mock_buffer.ack.call_args_list == [
+            call(notifications),
+            call([stale_notification]),
+        ]
+        mock_buffer.lock.return_value.release.assert_called_once()
+        mock_send_emails.assert_any_call(
+            subject="Уведомление о событии (PetTracker)",
+            notifications=[
+                (notification["email"], BODY) for notification in notifications
+            ],
+        )
+        mock_send_emails.assert_called_with(
+            subject="Уведомление о событии (PetTracker)", notifications=[]
+        )
+
+        for number, (event_id, _) in enumerate(events_with_tasks):
+            assert get_event_from_database(f"title {number}")["is_happened"] is True
+            assert get_task_from_database(event_id) is None
+
+
+def test_flush_notification_buffer_keeps_notifications_when_sending_fails(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    create_task_in_database: Callable,
+    get_event_from_database: Callable,
+    get_task_from_database: Callable,
+):
+    with patch("src.worker.celery.notification_buffer") as mock_buffer, patch(
+        "src.worker.celery.send_emails", side_effect=smtplib.SMTPServerDisconnected
+    ):
+        events_with_tasks: List[Tuple[str, str]] = _create_events_with_tasks(
+            create_user_in_database,
+            create_pet_in_database,
+            create_event_in_database,
+            create_task_in_database,
+            number_of_events=1,
+        )
+        event_id, task_id = events_with_tasks[0]
+        mock_buffer.pop_batch.return_value = [
+            {
+                "email": "some_email@email.ru",
+                "body": BODY,
+                "event_id": event_id,
+                "task_id": task_id,
+            }
+        ]
+
+        with pytest.raises(smtplib.SMTPServerDisconnected):
+            celery.flush_notification_buffer()
+
+        mock_buffer.ack.assert_not_called()
+        mock_buffer.lock.return_value.release.assert_called_once()
+        assert get_event_from_database("title 0")["is_happened"] is False
+        assert get_task_from_database(event_id) is not None
+
+
+def test_flush_notification_buffer_sends_duplicated_notification_once(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    create_task_in_database: Callable,
+    get_task_from_database: Callable,
+):
+    with patch("src.worker.celery.notification_buffer") as mock_buffer, patch(
+        "src.worker.celery.send_emails", return_value=[]
+    ) as mock_send_emails:
+        events_with_tasks: List[Tuple[str, str]] = _create_events_with_tasks(
+            create_user_in_database,
+            create_pet_in_database,
+            create_event_in_database,
+            create_task_in_database,
+            number_of_events=1,
+        )
+        event_id, task_id = events_with_tasks[0]
+        notification: dict = {
+            "email": "some_email@email.ru",
+            "body": BODY,
+            "event_id": event_id,
+            "task_id": task_id,
+        }
+        mock_buffer.pop_batch.return_value = [notification, dict(notification)]
+
+        sent: int = celery.flush_notification_buffer()
+
+        assert sent == 1
+        mock_send_emails.assert_called_once_with(
+            subject="Уведомление о событии (PetTracker)",
+            notifications=[("some_email@email.ru", BODY)],
+        )
+        mock_buffer.ack.assert_called_once_with([notification, notification])
+        assert get_task_from_database(event_id) is None
+
+
+def test_flush_notification_buffer_is_skipped_when_locked():
+    with patch("src.worker.celery.notification_buffer") as mock_buffer:
+        mock_buffer.lock.return_value.acquire.return_value = False
+
+        assert celery.flush_notification_buffer() == 0
+        mock_buffer.restore.assert_not_called()
+        mock_buffer.pop_batch.assert_not_called()
+
+
+def test_notification_buffer_moves_notifications_to_processing_list():
+    buffer: NotificationBuffer = NotificationBuffer(url="redis://some_host")
+    buffer.client = MagicMock()
+    pipeline: MagicMock = buffer.client.pipeline.return_value.__enter__()
+    pipeline.execute.return_value = [b'{"task_id": "1"}', None]
+
+    assert buffer.pop_batch(2) == [{"task_id": "1"}]
+    assert (
+        pipeline.lmove.call_args_list
+        == [
+            call(
+                NotificationBuffer.KEY,
+                NotificationBuffer.PROCESSING_KEY,
+                "LEFT",
+                "RIGHT",
+            )
+        ]
+        * 2
+    )
+
+    buffer.ack([{"task_id": "1"}])
+    pipeline.lrem.assert_called_once_with(
+        NotificationBuffer.PROCESSING_KEY, 1, '{"task_id": "1"}'
+    )
+
+    buffer.client.lmove.side_effect = [b'{"task_id": "1"}', None]
+    assert buffer.restore() == 1
+    buffer.client.lmove.assert_called_with(
+        NotificationBuffer.PROCESSING_KEY, NotificationBuffer.KEY, "RIGHT", "LEFT"
+    )
+
+
+def test_dispatch_due_notifications_in_batch_mode(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    create_task_in_database: Callable,
+):
+    with patch(
+        "src.worker.celery.project_settings.NOTIFICATION_DISPATCH_MODE", "batch"
+    ), patch("src.worker.celery.send_notification_batch") as mock_send_batch, patch(
+        "src.worker.celery.send_due_notification_email"
+    ) as mock_send_single:
+        _create_events_with_tasks(
+            create_user_in_database,
+            create_pet_in_database,
+            create_event_in_database,
+            create_task_in_database,
+            number_of_events=2,
+            notify_at=datetime.utcnow() - timedelta(minutes=1),
+        )
+
+        dispatched: int = celery.dispatch_due_notifications()
+
+        assert dispatched == 2
+        mock_send_batch.delay.assert_called_once()
+        assert len(mock_send_batch.delay.call_args.kwargs["notifications"]) == 2
+        mock_send_single.delay.assert_not_called()
+
+
+def test_send_emails_uses_one_smtp_session():
+    client: MagicMock = MagicMock()
+    client.send_message.side_effect = [
+        None,
+        smtplib.SMTPRecipientsRefused({"refused@email.ru": (550, b"No such user")}),
+        None,
+    ]
+    pool: SMTPConnectionPool = SMTPConnectionPool(
+        connect=MagicMock(side_effect=[client]),
+        size=2,
+        max_messages_per_connection=100,
+        keepalive_seconds=30,
+        max_idle_seconds=240,
+    )
+
+    with patch("src.worker.services.email.smtp_pool", pool):
+        failures: List[Tuple[str, Exception]] = send_emails(
+            subject="some subject",
+            notifications=[
+                ("first@email.ru", BODY),
+                ("refused@email.ru", BODY),
+                ("second@email.ru", BODY),
+            ],
+        )
+
+    assert pool.connect.call_count == 1
+    assert client.send_message.call_count == 3
+    assert [to_email for to_email, _ in failures] == ["refused@email.ru"]
@@ -0,0 +1,202 @@
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from functools import wraps
+from importlib import reload
+from typing import Callable
+from typing import Optional
+from unittest.mock import patch
+from uuid import uuid4
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import sessionmaker
+
+from src.user.services.hashing import Hasher
+from src.worker import celery
+from src.worker.services.dal import CeleryDAL
+from tests.conftest import TEST_SYNC_DATABASE_URL
+
+
+def _db_session_manager_for_tests(func: Callable) -> Callable:
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> None:
+        engine = create_engine(url=TEST_SYNC_DATABASE_URL, echo=True)
+        session = sessionmaker(engine)
+        db_session: Session = session()
+        celery_dal: CeleryDAL = CeleryDAL(db_session=db_session)
+
+        try:
+            result: Callable = func(celery_dal, *args, **kwargs)
+            return result
+        finally:
+            db_session.close()
+
+    return wrapper
+
+
+patch("src.worker.database.db_session_manager", _db_session_manager_for_tests).start()
+
+reload(celery)
+
+
+def _create_user_with_pet(
+    create_user_in_database: Callable, create_pet_in_database: Callable
+) -> dict:
+    user_data: dict = {
+        "user_id": str(uuid4()),
+        "username": "some_username",
+        "email": "some_email@email.ru",
+        "hashed_password": Hasher().get_password_hash("1234"),
+        "is_active": True,
+    }
+    create_user_in_database(**user_data)
+
+    pet_data: dict = {
+        "pet_id": str(uuid4()),
+        "name": "Some name",
+        "species": "Cat",
+        "breed": "Some breed",
+        "weight": 15,
+        "owner_id": user_data["user_id"],
+        "gender": "male",
+    }
+    create_pet_in_database(**pet_data)
+
+    return {"email": user_data["email"], "pet_id": pet_data["pet_id"]}
+
+
+def _get_event_data(pet_id: str, recurrence_rule: str) -> dict:
+    return {
+        "event_id": str(uuid4()),
+        "title": "Give medicine",
+        "content": "some content",
+        "scheduled_at": datetime(year=2024, month=1, day=1, hour=8),
+        "pet_id": pet_id,
+        "is_happened": False,
+        "notify_at": datetime.utcnow() - timedelta(minutes=1),
+        "recurrence_rule": recurrence_rule,
+        "timezone": "UTC",
+    }
+
+
+def _get_next_daily_occurrence() -> datetime:
+    now: datetime = datetime.utcnow()
+    occurrence: datetime = now.replace(hour=8, minute=0, second=0, microsecond=0)
+    if occurrence <= now:
+        occurrence += timedelta(days=1)
+    return occurrence
+
+
+def test_send_notification_email_schedules_next_occurrence(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    create_task_in_database: Callable,
+    get_event_from_database: Callable,
+    get_task_from_database: Callable,
+):
+    with patch("src.worker.celery.send_email") as mock_send_email, patch.object(
+        celery.send_notification_email, "apply_async"
+    ) as mock_apply_async:
+        owner: dict = _create_user_with_pet(
+            create_user_in_database, create_pet_in_database
+        )
+        event_data: dict = _get_event_data(owner["pet_id"], "FREQ=DAILY")
+        create_event_in_database(**event_data)
+        task_id: str = str(uuid4())
+        create_task_in_database(task_id=task_id, event_id=event_data["event_id"])
+        updated_at: datetime = get_event_from_database(event_data["title"])[
+            "updated_at"
+        ]
+
+        celery.send_notification_email(
+            email=owner["email"],
+            body={},
+            event_id=event_data["event_id"],
+            task_id=task_id,
+        )
+
+        mock_send_email.assert_called_once()
+
+        next_occurrence: datetime = _get_next_daily_occurrence()
+        event: dict = get_event_from_database(event_data["title"])
+        assert event["is_happened"] is False
+        assert event["notify_at"] == next_occurrence
+        assert event["updated_at"] > updated_at
+
+        new_task: Optional[tuple] = get_task_from_database(event_data["event_id"])
+        assert new_task is not None
+        assert str(new_task[0]) != task_id
+
+        mock_apply_async.assert_called_once()
+        args: tuple = mock_apply_async.call_args.args[0]
+        assert args[0] == owner["email"]
+        assert args[1]["day"] == next_occurrence.day
+        assert args[1]["hour"] == 8
+        assert args[2:] == (event_data["event_id"], str(new_task[0]))
+        assert mock_apply_async.call_args.kwargs["eta"] == next_occurrence.replace(
+            tzinfo=timezone.utc
+        )
+
+
+def test_send_notification_email_last_occurrence(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    create_task_in_database: Callable,
+    get_event_from_database: Callable,
+):
+    with patch("src.worker.celery.send_email") as mock_send_email, patch.object(
+        celery.send_notification_email, "apply_async"
+    ) as mock_apply_async:
+        owner: dict = _create_user_with_pet(
+            create_user_in_database, create_pet_in_database
+        )
+        event_data: dict = _get_event_data(owner["pet_id"], "FREQ=DAILY;COUNT=3")
+        create_event_in_database(**event_data)
+        task_id: str = str(uuid4())
+        create_task_in_database(task_id=task_id, event_id=event_data["event_id"])
+
+        celery.send_notification_email(
+            email=owner["email"],
+            body={},
+            event_id=event_data["event_id"],
+            task_id=task_id,
+        )
+
+        mock_send_email.assert_called_once()
+        mock_apply_async.assert_not_called()
+        assert get_event_from_database(event_data["title"])["is_happened"] is True
+
+
+def test_dispatch_due_notifications_schedules_next_occurrence(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    get_event_from_database: Callable,
+    get_task_from_database: Callable,
+):
+    with patch("src.worker.celery.send_due_notification_email") as mock_send, patch(
+        "src.worker.celery.project_settings.NOTIFICATION_SCHEDULER_MODE", "database"
+    ):
+        owner: dict = _create_user_with_pet(
+            create_user_in_database, create_pet_in_database
+        )
+        event_data: dict = _get_event_data(owner["pet_id"], "FREQ=DAILY")
+        create_event_in_database(**event_data)
+
+        dispatched: int = celery.dispatch_due_notifications()
+
+        assert dispatched == 1
+        body: dict = mock_send.delay.call_args.kwargs["body"]
+        assert (body["day"], body["hour"], body["minute"]) == (
+            event_data["notify_at"].day,
+            event_data["notify_at"].hour,
+            event_data["notify_at"].minute,
+        )
+
+        event: dict = get_event_from_database(event_data["title"])
+        assert event["is_happened"] is False
+        assert event["notify_at"] == _get_next_daily_occurrence()
+        assert get_task_from_database(event_data["event_id"]) is None
@@ -0,0 +1,153 @@
+from datetime import datetime
+from datetime import timedelta
+from functools import wraps
+from importlib import reload
+from typing import Callable
+from typing import List
+from typing import Optional
+from unittest.mock import MagicMock
+from unittest.mock import patch
+from uuid import UUID
+from uuid import uuid4
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import sessionmaker
+
+from src.user.services.hashing import Hasher
+from src.worker import celery
+from src.worker.services.dal import CeleryDAL
+from tests.conftest import TEST_SYNC_DATABASE_URL
+
+
+def _db_session_manager_for_tests(func: Callable) -> Callable:
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> None:
+        engine = create_engine(url=TEST_SYNC_DATABASE_URL, echo=True)
+        session = sessionmaker(engine)
+        db_session: Session = session()
+        celery_dal: CeleryDAL = CeleryDAL(db_session=db_session)
+
+        try:
+            result: Callable = func(celery_dal, *args, **kwargs)
+            return result
+        finally:
+            db_session.close()
+
+    return wrapper
+
+
+patch("src.worker.database.db_session_manager", _db_session_manager_for_tests).start()
+
+reload(celery)
+
+
+def _create_user_with_pet(
+    create_user_in_database: Callable, create_pet_in_database: Callable
+) -> dict:
+    user_data: dict = {
+        "user_id": str(uuid4()),
+        "username": "some_username",
+        "email": "some_email@email.ru",
+        "hashed_password": Hasher().get_password_hash("1234"),
+        "is_active": True,
+    }
+    create_user_in_database(**user_data)
+
+    pet_data: dict = {
+        "pet_id": str(uuid4()),
+        "name": "Some name",
+        "species": "Cat",
+        "breed": "Some breed",
+        "weight": 15,
+        "owner_id": user_data["user_id"],
+        "gender": "male",
+    }
+    create_pet_in_database(**pet_data)
+
+    return {
+        "user_id": user_data["user_id"],
+        "email": user_data["email"],
+        "pet_id": pet_data["pet_id"],
+    }
+
+
+def _get_event_data(pet_id: str, recurrence_rule: Optional[str] = None) -> dict:
+    return {
+        "event_id": str(uuid4()),
+        "title": "Give medicine",
+        "content": "some content",
+        "scheduled_at": datetime(year=2024, month=1, day=1, hour=8),
+        "pet_id": pet_id,
+        "is_happened": False,
+        "notify_at": datetime.utcnow() - timedelta(minutes=1),
+        "recurrence_rule": recurrence_rule,
+        "timezone": "UTC",
+    }
+
+
+def _get_invalidated_user_ids(mock_invalidate: MagicMock) -> List[UUID]:
+    return [
+        user_id
+        for invalidate_call in mock_invalidate.call_args_list
+        for user_id in invalidate_call.args[0]
+    ]
+
+
+def test_send_notification_email_invalidates_cached_responses(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+    create_task_in_database: Callable,
+):
+    with patch("src.worker.celery.send_email"), patch(
+        "src.worker.services.dal.invalidate_cached_responses"
+    ) as mock_invalidate:
+        owner: dict = _create_user_with_pet(
+            create_user_in_database, create_pet_in_database
+        )
+        event_data: dict = _get_event_data(owner["pet_id"])
+        create_event_in_database(**event_data)
+        task_id: str = str(uuid4())
+        create_task_in_database(task_id=task_id, event_id=event_data["event_id"])
+
+        celery.send_notification_email(
+            email=owner["email"],
+            body={},
+            event_id=event_data["event_id"],
+            task_id=task_id,
+        )
+
+        assert _get_invalidated_user_ids(mock_invalidate) == [UUID(owner["user_id"])]
+
+        mock_invalidate.reset_mock()
+        celery.send_notification_email(
+            email=owner["email"],
+            body={},
+            event_id=event_data["event_id"],
+            task_id=task_id,
+        )
+
+        mock_invalidate.assert_not_called()
+
+
+def test_dispatch_due_notifications_invalidates_cached_responses(
+    create_user_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_event_in_database: Callable,
+):
+    with patch("src.worker.celery.send_due_notification_email"), patch(
+        "src.worker.celery.project_settings.NOTIFICATION_SCHEDULER_MODE", "database"
+    ), patch("src.worker.services.dal.invalidate_cached_responses") as mock_invalidate:
+        owner: dict = _create_user_with_pet(
+            create_user_in_database, create_pet_in_database
+        )
+        create_event_in_database(**_get_event_data(owner["pet_id"], "FREQ=DAILY"))
+
+        celery.dispatch_due_notifications()
+
+        assert mock_invalidate.call_count == 2
+        assert _get_invalidated_user_ids(mock_invalidate) == [
+            UUID(owner["user_id"]),
+            UUID(owner["user_id"]),
+        ]
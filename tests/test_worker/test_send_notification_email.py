@@ -264,3 +264,67 @@ def test_send_notification_email_raised_exception(
         )
 
         mock_log_error.assert_called_once_with(error)
+
+
+def test_send_notification_email_redelivered(
+    create_event_in_database: Callable,
+    create_pet_in_database: Callable,
+    create_user_in_database: Callable,
+    create_task_in_database: Callable,
+    get_event_from_database: Callable,
+):
+    with patch.object(
+        CeleryLogger, "log_not_found_message"
+    ) as mock_log_not_found, patch("src.worker.celery.send_email") as mock_send_email:
+        user_data: dict = {
+            "user_id": str(uuid4()),
+            "username": "some_username",
+            "email": "some_email@email.ru",
+            "hashed_password": Hasher().get_password_hash("1234"),
+            "is_active": True,
+        }
+        create_user_in_database(**user_data)
+
+        pet_data: dict = {
+            "pet_id": str(uuid4()),
+            "name": "Some name",
+            "species": "Cat",
+            "breed": "Some breed",
+            "weight": 15,
+            "owner_id": user_data["user_id"],
+            "gender": "male",
+        }
+        create_pet_in_database(**pet_data)
+
+        event_data: dict = {
+            "event_id": str(uuid4()),
+            "title": "some title",
+            "content": "some content",
+            "scheduled_at": datetime(
+                year=datetime.now().year + 1,
+                month=10,
+                day=10,
+                hour=10,
+                minute=10,
+            ),
+            "pet_id": pet_data["pet_id"],
+            "is_happened": False,
+        }
+        create_event_in_database(**event_data)
+
+        task_data: dict = {"task_id": str(uuid4()), "event_id": event_data["event_id"]}
+        create_task_in_database(**task_data)
+
+        for _ in range(2):
+            celery.send_notification_email(
+                email=user_data["email"],
+                body={},
+                event_id=event_data["event_id"],
+                task_id=task_data["task_id"],
+            )
+
+        mock_send_email.assert_called_once()
+        mock_log_not_found.assert_called_once_with(
+            message=f"Task with id {task_data['task_id']} not found"
+        )
+        assert get_event_from_database(event_data["title"])["is_happened"] is True
@@ -0,0 +1,170 @@
+import smtplib
+from datetime import datetime
+from functools import wraps
+from importlib import reload
+from typing import Callable
+from unittest.mock import patch
+from uuid import UUID
+from uuid import uuid4
+
+import pytest
+from jose import jwt
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import sessionmaker
+
+from src.config import project_settings
+from src.worker import celery
+from src.worker.logging import CeleryLogger
+from src.worker.services.dal import CeleryDAL
+from tests.conftest import TEST_SYNC_DATABASE_URL
+
+
+def _db_session_manager_for_tests(func: Callable) -> Callable:
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> None:
+        engine = create_engine(url=TEST_SYNC_DATABASE_URL, echo=True)
+        session = sessionmaker(engine)
+        db_session: Session = session()
+        celery_dal: CeleryDAL = CeleryDAL(db_session=db_session)
+
+        try:
+            result: Callable = func(celery_dal, *args, **kwargs)
+            return result
+        finally:
+            db_session.close()
+
+    return wrapper
+
+
+patch("src.worker.database.db_session_manager", _db_session_manager_for_tests).start()
+
+reload(celery)
+
+
+def _create_outgoing_email(create_outgoing_email_in_database: Callable) -> dict:
+    email_data: dict = {
+        "email_id": str(uuid4()),
+        "recipients": "some_email@email.ru",
+        "subject": "Письмо для сброса пароля в PetTracker",
+        "template_name": "password_reset_confirmation.html",
+        "context": {"email": "some_email@email.ru"},
+    }
+    create_outgoing_email_in_database(**email_data)
+    return email_data
+
+
+def test_send_user_email_successfully(
+    create_outgoing_email_in_database: Callable,
+    get_outgoing_email_from_database: Callable,
+):
+    with patch("src.worker.celery.send_html_email") as mock_send_html_email:
+        email_data: dict = _create_outgoing_email(create_outgoing_email_in_database)
+
+        celery.send_user_email(email_id=email_data["email_id"])
+
+        mock_send_html_email.assert_called_once()
+        kwargs: dict = mock_send_html_email.call_args.kwargs
+        assert kwargs["subject"] == email_data["subject"]
+        assert kwargs["recipients"] == [email_data["recipients"]]
+
+        token: str = kwargs["body"].split("?token=")[1].split('"')[0]
+        payload: dict = jwt.decode(
+            token, project_settings.SECRET_KEY, algorithms=[project_settings.ALGORITHM]
+        )
+        assert payload["email"] == email_data["recipients"]
+        assert payload["exp"] > datetime.utcnow().timestamp()
+
+        outgoing_email: dict = get_outgoing_email_from_database(
+            email_data["recipients"]
+        )
+        assert outgoing_email["status"] == "sent"
+        assert outgoing_email["attempts"] == 1
+        assert outgoing_email["sent_at"] is not None
+
+
+def test_send_user_email_already_sent(create_outgoing_email_in_database: Callable):
+    with patch("src.worker.celery.send_html_email") as mock_send_html_email:
+        email_data: dict = {
+            "email_id": str(uuid4()),
+            "recipients": "some_email@email.ru",
+            "subject": "some subject",
+            "template_name": "email_confirmation.html",
+            "context": {"email": "some_email@email.ru"},
+            "status": "sent",
+        }
+        create_outgoing_email_in_database(**email_data)
+
+        celery.send_user_email(email_id=email_data["email_id"])
+
+        mock_send_html_email.assert_not_called()
+
+
+def test_send_user_email_not_found():
+    with patch.object(CeleryLogger, "log_not_found_message") as mock_log_not_found:
+        email_id: UUID = uuid4()
+
+        celery.send_user_email(email_id=email_id)
+
+        mock_log_not_found.assert_called_once_with(
+            message=f"Email with id {email_id} not found"
+        )
+
+
+def test_send_user_email_temporary_failure_is_retried(
+    create_outgoing_email_in_database: Callable,
+    get_outgoing_email_from_database: Callable,
+):
+    with patch("src.worker.celery.send_html_email") as mock_send_html_email:
+        mock_send_html_email.side_effect = smtplib.SMTPServerDisconnected(
+            "Connection unexpectedly closed"
+        )
+        email_data: dict = _create_outgoing_email(create_outgoing_email_in_database)
+
+        with pytest.raises(smtplib.SMTPServerDisconnected):
+            celery.send_user_email(email_id=email_data["email_id"])
+
+        outgoing_email: dict = get_outgoing_email_from_database(
+            email_data["recipients"]
+        )
+        assert outgoing_email["status"] == "retrying"
+        assert outgoing_email["attempts"] == 1
+        assert outgoing_email["last_error"] == "Connection unexpectedly closed"
+
+
+def test_send_user_email_last_attempt_failed(
+    create_outgoing_email_in_database: Callable,
+    get_outgoing_email_from_database: Callable,
+):
+    with patch("src.worker.celery.send_html_email") as mock_send_html_email, patch(
+        "src.worker.celery.send_user_email.max_retries", 0
+    ):
+        mock_send_html_email.side_effect = ConnectionRefusedError()
+        email_data: dict = _create_outgoing_email(create_outgoing_email_in_database)
+
+        with pytest.raises(ConnectionRefusedError):
+            celery.send_user_email(email_id=email_data["email_id"])
+
+        outgoing_email: dict = get_outgoing_email_from_database(
+            email_data["recipients"]
+        )
+        assert outgoing_email["status"] == "failed"
+
+
+def test_send_user_email_recipients_refused(
+    create_outgoing_email_in_database: Callable,
+    get_outgoing_email_from_database: Callable,
+):
+    with patch("src.worker.celery.send_html_email") as mock_send_html_email:
+        mock_send_html_email.side_effect = smtplib.SMTPRecipientsRefused(
+            {"some_email@email.ru": (550, b"No such user")}
+        )
+        email_data: dict = _create_outgoing_email(create_outgoing_email_in_database)
+
+        celery.send_user_email(email_id=email_data["email_id"])
+
+        outgoing_email: dict = get_outgoing_email_from_database(
+            email_data["recipients"]
+        )
+        assert outgoing_email["status"] == "failed"
+        assert outgoing_email["attempts"] == 1
@@ -0,0 +1,171 @@
+import asyncio
+import smtplib
+from email.mime.text import MIMEText
+from typing import List
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import aiosmtplib
+import pytest
+
+from src.smtp import _connect_to_smtp_server
+from src.smtp import AsyncSMTPConnectionPool
+from src.smtp import SMTPConnectionPool
+
+
+def _create_pool(clients: List[MagicMock], **kwargs) -> SMTPConnectionPool:
+    settings: dict = {
+        "size": 2,
+        "max_messages_per_connection": 100,
+        "keepalive_seconds": 30,
+        "max_idle_seconds": 240,
+    }
+    settings.update(kwargs)
+    return SMTPConnectionPool(connect=MagicMock(side_effect=clients), **settings)
+
+
+def _create_async_pool(clients: List[AsyncMock], **kwargs) -> AsyncSMTPConnectionPool:
+    settings: dict = {
+        "size": 2,
+        "max_messages_per_connection": 100,
+        "keepalive_seconds": 30,
+        "max_idle_seconds": 240,
+    }
+    settings.update(kwargs)
+    return AsyncSMTPConnectionPool(connect=AsyncMock(side_effect=clients), **settings)
+
+
+def test_smtp_pool_reuses_connection():
+    client: MagicMock = MagicMock()
+    pool: SMTPConnectionPool = _create_pool([client])
+
+    for _ in range(3):
+        pool.send_message(MIMEText("some text"))
+
+    assert pool.connect.call_count == 1
+    assert client.send_message.call_count == 3
+    assert pool.reused == 2
+
+
+def test_smtp_pool_max_messages_per_connection():
+    first_client, second_client = MagicMock(), MagicMock()
+    pool: SMTPConnectionPool = _create_pool(
+        [first_client, second_client], max_messages_per_connection=2
+    )
+
+    for _ in range(3):
+        pool.send_message(MIMEText("some text"))
+
+    assert pool.connect.call_count == 2
+    first_client.quit.assert_called_once()
+    assert first_client.send_message.call_count == 2
+    assert second_client.send_message.call_count == 1
+
+
+def test_smtp_pool_health_check_of_idle_connection():
+    first_client, second_client = MagicMock(), MagicMock()
+    first_client.noop.return_value = (421, b"Service not available")
+    pool: SMTPConnectionPool = _create_pool(
+        [first_client, second_client], keepalive_seconds=-1
+    )
+
+    pool.send_message(MIMEText("some text"))
+    pool.send_message(MIMEText("some text"))
+
+    first_client.noop.assert_called_once()
+    first_client.quit.assert_called_once()
+    assert second_client.send_message.call_count == 1
+
+
+def test_smtp_pool_reconnects_when_server_disconnected():
+    first_client, second_client = MagicMock(), MagicMock()
+    first_client.send_message.side_effect = smtplib.SMTPServerDisconnected()
+    pool: SMTPConnectionPool = _create_pool([first_client, second_client])
+
+    pool.send_message(MIMEText("some text"))
+
+    first_client.close.assert_called_once()
+    second_client.send_message.assert_called_once()
+    assert pool.connect.call_count == 2
+
+
+def test_smtp_pool_keeps_connection_when_recipients_refused():
+    client: MagicMock = MagicMock()
+    client.send_message.side_effect = [
+        smtplib.SMTPRecipientsRefused({"some_email@email.ru": (550, b"")}),
+        None,
+    ]
+    pool: SMTPConnectionPool = _create_pool([client])
+
+    with pytest.raises(smtplib.SMTPRecipientsRefused):
+        pool.send_message(MIMEText("some text"))
+    pool.send_message(MIMEText("some text"))
+
+    assert pool.connect.call_count == 1
+    client.close.assert_not_called()
+
+
+async def test_async_smtp_pool_reuses_connection():
+    client: AsyncMock = AsyncMock()
+    pool: AsyncSMTPConnectionPool = _create_async_pool([client])
+
+    for _ in range(3):
+        await pool.send_message(MIMEText("some text"))
+
+    assert pool.connect.await_count == 1
+    assert client.send_message.await_count == 3
+
+    await pool.close()
+    client.quit.assert_awaited_once()
+
+
+async def test_async_smtp_pool_reconnects_when_server_disconnected():
+    first_client, second_client = AsyncMock(), AsyncMock()
+    first_client.close = MagicMock()
+    first_client.send_message.side_effect = aiosmtplib.SMTPServerDisconnected("")
+    pool: AsyncSMTPConnectionPool = _create_async_pool([first_client, second_client])
+
+    await pool.send_message(MIMEText("some text"))
+
+    first_client.close.assert_called_once()
+    second_client.send_message.assert_awaited_once()
+
+
+async def test_async_smtp_pool_limits_concurrent_connections():
+    clients: List[AsyncMock] = [AsyncMock() for _ in range(3)]
+    sending: asyncio.Event = asyncio.Event()
+
+    async def send_message(message: MIMEText) -> None:
+        await sending.wait()
+
+    for client in clients:
+        client.send_message.side_effect = send_message
+    pool: AsyncSMTPConnectionPool = _create_async_pool(clients, size=2)
+
+    senders: List[asyncio.Task] = [
+        asyncio.create_task(pool.send_message(MIMEText("some text"))) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    assert pool.connect.await_count == 2
+
+    sending.set()
+    await asyncio.gather(*senders)
+    assert pool.connect.await_count == 2
+
+
+def test_connect_to_smtp_server_closes_connection_when_login_fails():
+    with patch("src.smtp.smtplib.SMTP") as mock_smtp, patch.multiple(
+        "src.smtp.project_settings",
+        MAIL_SSL_TLS=False,
+        MAIL_STARTTLS=True,
+        USE_CREDENTIALS=True,
+    ):
+        server: MagicMock = mock_smtp.return_value
+        server.login.side_effect = smtplib.SMTPAuthenticationError(535, b"")
+
+        with pytest.raises(smtplib.SMTPAuthenticationError):
+            _connect_to_smtp_server()
+
+        server.starttls.assert_called_once()
+        server.close.assert_called_once()
@@ -0,0 +1,81 @@
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from sqlalchemy import Engine
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.database import DatabaseSettings
+from src.database import SyncEngineManager
+from src.database import TimedQueuePool
+from src.worker import celery
+from tests.conftest import TEST_SYNC_DATABASE_URL
+
+
+def _get_engine_manager() -> SyncEngineManager:
+    settings: DatabaseSettings = DatabaseSettings()
+    with patch.object(
+        DatabaseSettings,
+        "SYNC_DATABASE_URL",
+        property(lambda self: TEST_SYNC_DATABASE_URL),
+    ):
+        engine_manager: SyncEngineManager = SyncEngineManager(settings=settings)
+        engine_manager.init()
+    return engine_manager
+
+
+def test_engine_is_shared_between_sessions():
+    engine_manager: SyncEngineManager = _get_engine_manager()
+    engine: Engine = engine_manager.engine
+
+    for _ in range(3):
+        db_session: Session = engine_manager.session()
+        db_session.execute(text("SELECT 1"))
+        db_session.close()
+
+    assert engine_manager.engine is engine
+    assert isinstance(engine.pool, TimedQueuePool)
+    assert engine.pool.checkedin() == 1
+
+    engine_manager.dispose()
+
+
+def test_pool_checkout_is_reported():
+    engine_manager: SyncEngineManager = _get_engine_manager()
+    on_checkout: MagicMock = MagicMock()
+    engine_manager.engine.pool.on_checkout = on_checkout
+
+    db_session: Session = engine_manager.session()
+    db_session.execute(text("SELECT 1"))
+    db_session.close()
+
+    on_checkout.assert_called_once()
+    duration, pool = on_checkout.call_args.args
+    assert duration >= 0
+    assert pool is engine_manager.engine.pool
+
+    engine_manager.dispose()
+
+
+def test_dispose_drops_engine():
+    engine_manager: SyncEngineManager = _get_engine_manager()
+    engine: Engine = engine_manager.engine
+
+    engine_manager.dispose()
+
+    assert engine_manager._engine is None
+    assert engine_manager._session_factory is None
+    assert engine.pool.checkedin() == 0
+
+
+def test_worker_process_signals():
+    with patch("src.worker.celery.sync_engine_manager") as mock_engine_manager, patch(
+        "src.worker.celery.smtp_pool"
+    ):
+        celery.create_database_engine()
+        celery.close_smtp_connections()
+
+        mock_engine_manager.init.assert_called_once_with(
+            on_checkout=celery.logger.log_pool_checkout
+        )
+        mock_engine_manager.dispose.assert_called_once()
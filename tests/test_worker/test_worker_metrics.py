@@ -0,0 +1,196 @@
+from datetime import datetime
+from datetime import timedelta
+from functools import wraps
+from importlib import reload
+from typing import Callable
+from typing import List
+from unittest.mock import MagicMock
+from unittest.mock import patch
+from uuid import uuid4
+
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import sessionmaker
+
+from src.smtp import SMTPConnectionPool
+from src.worker import celery
+from src.worker.logging import CeleryLogger
+from src.worker.metrics import late_notification
+from src.worker.metrics import QueueLengthCollector
+from src.worker.metrics import start_metrics_server
+from src.worker.services.dal import CeleryDAL
+from tests.conftest import TEST_SYNC_DATABASE_URL
+
+
+def _db_session_manager_for_tests(func: Callable) -> Callable:
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> None:
+        engine = create_engine(url=TEST_SYNC_DATABASE_URL, echo=True)
+        session = sessionmaker(engine)
+        db_session: Session = session()
+        celery_dal: CeleryDAL = CeleryDAL(db_session=db_session)
+
+        try:
+            result: Callable = func(celery_dal, *args, **kwargs)
+            return result
+        finally:
+            db_session.close()
+
+    return wrapper
+
+
+patch("src.worker.database.db_session_manager", _db_session_manager_for_tests).start()
+
+reload(celery)
+
+
+def _get_sample_value(name: str, labels: dict = None) -> float:
+    return REGISTRY.get_sample_value(name, labels or {}) or 0
+
+
+def test_notification_lag_is_observed(
+    get_notification_deliveries_from_database: Callable,
+):
+    with patch("src.worker.celery.send_email") as mock_send_email, patch.object(
+        CeleryLogger, "log_late_notification"
+    ) as mock_log_late_notification:
+        observed: float = _get_sample_value("pettracker_notification_lag_seconds_count")
+        late: float = _get_sample_value("pettracker_late_notifications_total")
+        event_id: str = str(uuid4())
+        notify_at: datetime = datetime.utcnow() - timedelta(minutes=2)
+
+        celery.send_due_notification_email(
+            email="some_email@email.ru",
+            body={},
+            event_id=event_id,
+            notify_at=notify_at.isoformat(),
+        )
+
+        mock_send_email.assert_called_once()
+        assert (
+            _get_sample_value("pettracker_notification_lag_seconds_count")
+            == observed + 1
+        )
+        assert _get_sample_value("pettracker_late_notifications_total") == late + 1
+        mock_log_late_notification.assert_called_once()
+        assert mock_log_late_notification.call_args.kwargs["event_id"] == event_id
+
+        deliveries: List[dict] = get_notification_deliveries_from_database(event_id)
+        assert len(deliveries) == 1
+        assert deliveries[0]["due_at"] == notify_at
+        assert deliveries[0]["lag_ms"] >= 120000
+
+
+def test_notification_in_time_is_not_late(
+    get_notification_deliveries_from_database: Callable,
+):
+    receiver: MagicMock = MagicMock()
+    late_notification.connect(receiver, weak=False)
+
+    try:
+        with patch("src.worker.celery.send_email"):
+            event_id: str = str(uuid4())
+
+            celery.send_due_notification_email(
+                email="some_email@email.ru",
+                body={},
+                event_id=event_id,
+                notify_at=datetime.utcnow().isoformat(),
+            )
+    finally:
+        late_notification.disconnect(receiver)
+
+    receiver.assert_not_called()
+    assert get_notification_deliveries_from_database(event_id)[0]["lag_ms"] < 60000
+
+
+def test_task_runtime_is_observed():
+    labels: dict = {"task": "send_due_notification_email", "state": "SUCCESS"}
+    observed: float = _get_sample_value(
+        "pettracker_worker_task_runtime_seconds_count", labels
+    )
+
+    celery.start_measuring_task(task_id="some_task_id")
+    celery.finish_measuring_task(
+        task_id="some_task_id",
+        task=celery.send_due_notification_email,
+        state="SUCCESS",
+    )
+
+    assert (
+        _get_sample_value("pettracker_worker_task_runtime_seconds_count", labels)
+        == observed + 1
+    )
+
+
+def test_smtp_pool_reports_timings():
+    pool: SMTPConnectionPool = SMTPConnectionPool(
+        connect=MagicMock(return_value=MagicMock()),
+        size=2,
+        max_messages_per_connection=100,
+        keepalive_seconds=30,
+        max_idle_seconds=240,
+    )
+    pool.on_connect = MagicMock()
+    pool.on_send = MagicMock()
+
+    pool.send_message(MagicMock())
+    pool.send_message(MagicMock())
+
+    pool.on_connect.assert_called_once()
+    assert pool.on_send.call_count == 2
+
+
+def test_queue_length_collector():
+    collector: QueueLengthCollector = QueueLengthCollector(url="redis://some_host")
+    collector.client = MagicMock()
+    collector.client.llen.return_value = 7
+
+    with patch("src.worker.metrics.notification_buffer") as mock_buffer:
+        mock_buffer.KEY = "notification-buffer"
+        mock_buffer.client.llen.return_value = 3
+
+        metrics: list = list(collector.collect())
+
+    assert [(sample.labels, sample.value) for sample in metrics[0].samples] == [
+        ({"queue": "celery"}, 7),
+        ({"queue": "notification-buffer"}, 3),
+    ]
+
+
+def test_start_metrics_server_in_multiprocess_mode(tmp_path):
+    stale_file = tmp_path / "histogram_123.db"
+    stale_file.write_bytes(b"")
+
+    with patch.dict("os.environ", {"PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}), patch(
+        "src.worker.metrics.start_http_server"
+    ) as mock_start_http_server:
+        start_metrics_server(port=9808)
+
+    assert not stale_file.exists()
+    assert mock_start_http_server.call_args.args == (9808,)
+    assert mock_start_http_server.call_args.kwargs["registry"] is not REGISTRY
+
+
+def test_purge_notification_deliveries(
+    create_notification_delivery_in_database: Callable,
+    get_notification_deliveries_from_database: Callable,
+):
+    old_event_id: str = str(uuid4())
+    recent_event_id: str = str(uuid4())
+    create_notification_delivery_in_database(
+        event_id=old_event_id,
+        due_at=datetime.utcnow() - timedelta(days=8),
+        lag_ms=100,
+    )
+    create_notification_delivery_in_database(
+        event_id=recent_event_id,
+        due_at=datetime.utcnow() - timedelta(days=6),
+        lag_ms=100,
+    )
+
+    assert celery.purge_notification_deliveries() == 1
+    assert get_notification_deliveries_from_database(old_event_id) == []
+    assert len(get_notification_deliveries_from_database(recent_event_id)) == 1
+    assert "purge-notification-deliveries" in celery.celery.conf.beat_schedule